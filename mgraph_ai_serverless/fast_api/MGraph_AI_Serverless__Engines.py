@@ -0,0 +1,73 @@
+import importlib
+import sys
+import threading
+import time
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+from osbot_utils.utils.Env           import get_env
+
+ENGINES__WARMUP  = get_env('MGRAPH__ENGINES__WARMUP', 'true').lower() == 'true'        # import the engines in a background thread after the app is created (cold start doesn't wait for them)
+
+ENGINES__MODULES = { 'matplotlib' : ['mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render'                      ],     # modules each engine's routes import on first use (graphviz's are cheap, so they stay eager)
+                     'playwright' : ['mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Html'      ,
+                                     'mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Pdf'       ,
+                                     'mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Screenshot'],
+                     'debug'      : ['osbot_aws.apis.shell.Lambda_Shell'                                                     ]}
+
+ENGINES__WARMUP__ENGINES = [engine.strip() for engine in get_env('MGRAPH__ENGINES__WARMUP__ENGINES', 'matplotlib,playwright').split(',') if engine.strip()]   # only the engines whose first (render) request would pay for the import ('debug' pulls in osbot_aws and boto3)
+
+
+class MGraph_AI_Serverless__Engines(Type_Safe):                             # tracks (and warms up) the lazily imported engine modules
+    import_times : dict                                                     # module name -> ms it took to import (0 when it was already imported)
+    errors       : dict                                                     # module name -> import error
+    thread       = None
+    lock         = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+
+    def import_engine(self, engine: str) -> dict:
+        if engine not in ENGINES__MODULES:
+            raise ValueError(f"Unknown engine: {engine}")
+        for module_name in ENGINES__MODULES[engine]:
+            self.import_module(module_name)
+        return {module_name: self.import_times.get(module_name) for module_name in ENGINES__MODULES[engine]}
+
+    def import_module(self, module_name: str):
+        already_imported = module_name in sys.modules
+        start            = time.perf_counter()
+        try:
+            importlib.import_module(module_name)                            # python's per-module import locks make this safe to race with a request's own import
+        except Exception as error:                                          # i.e. an optional engine dependency that is not installed
+            with self.lock:
+                self.errors[module_name] = f'{type(error).__name__}: {error}'
+            return
+        with self.lock:
+            if module_name not in self.import_times:
+                self.import_times[module_name] = 0.0 if already_imported else round((time.perf_counter() - start) * 1000, 1)
+
+    def warmup(self):
+        for engine in ENGINES__WARMUP__ENGINES:
+            if engine in ENGINES__MODULES:                                  # (unknown engines in the env var are ignored)
+                self.import_engine(engine)
+
+    def warmup_start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.warmup, name='engines-warmup', daemon=True)
+                self.thread.start()
+        return self.thread
+
+    def status(self):
+        with self.lock:
+            if self.thread is None:
+                warmup = 'not-started'
+            else:
+                warmup = 'running' if self.thread.is_alive() else 'done'
+            return dict(warmup       = warmup                   ,
+                        import_times = dict(self.import_times)  ,
+                        errors       = dict(self.errors      )  ,
+                        loaded       = sorted(engine for engine, module_names in ENGINES__MODULES.items()
+                                                     if all(module_name in sys.modules for module_name in module_names)))
+
+mgraph_ai_serverless__engines = MGraph_AI_Serverless__Engines()             # shared by the handler (warm-up) and the /info/engines route
@@ -1,4 +1,3 @@
-from osbot_aws.apis.shell.Lambda_Shell  import Lambda_Shell, SHELL_VAR
 from osbot_fast_api.api.Fast_API_Routes import Fast_API_Routes
 from fastapi                            import Request
 
@@ -8,6 +7,7 @@ class Routes__Debug(Fast_API_Routes):
     tag : str = 'debug'
 
     async def lambda_shell(self, request: Request):
+        from osbot_aws.apis.shell.Lambda_Shell import Lambda_Shell, SHELL_VAR          # osbot_aws (boto3) is only imported on first use
         try:
             data = await request.json()
             if data:
@@ -1,7 +1,8 @@
-from osbot_fast_api.api.Fast_API_Routes  import Fast_API_Routes
-from mgraph_ai_serverless.utils.Version  import version__mgraph_ai_serverless
+from osbot_fast_api.api.Fast_API_Routes                             import Fast_API_Routes
+from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Engines    import mgraph_ai_serverless__engines
+from mgraph_ai_serverless.utils.Version                             import version__mgraph_ai_serverless
 
-ROUTES_PATHS__INFO = ['/info/version',  '/info/ping']
+ROUTES_PATHS__INFO = ['/info/version',  '/info/ping', '/info/engines']
 
 class Routes__Info(Fast_API_Routes):
     tag :str = 'info'
@@ -12,8 +13,12 @@ class Routes__Info(Fast_API_Routes):
     def version(self):
         return {'version': version__mgraph_ai_serverless}
 
+    def engines(self):                                                  # warm-up status and per module import times of the lazily imported engines
+        return mgraph_ai_serverless__engines.status()
+
     
     def setup_routes(self):
         self.add_route_get(self.ping)
         self.add_route_get(self.version)
+        self.add_route_get(self.engines)
 
@@ -0,0 +1,3 @@
+GRAPH_ENGINES__DOMAIN_TYPES = ( 'mgraph_ai.mgraph.domain.Domain__MGraph__Graph.Domain__MGraph__Graph'                      ,   # allow-list of the graph_data domain types (graph_type) that the graph engines render
+                                'mgraph_ai.providers.simple.domain.Domain__Simple__Graph.Domain__Simple__Graph'           ,   # (plain strings, so that checking it doesn't import mgraph_ai, networkx or matplotlib)
+                                'mgraph_ai.providers.json.domain.Domain__MGraph__Json__Graph.Domain__MGraph__Json__Graph' )
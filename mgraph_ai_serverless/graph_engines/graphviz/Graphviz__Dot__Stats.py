@@ -0,0 +1,190 @@
+import re
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Dot__Stats import Model__Graphviz__Dot__Stats
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+
+DOT__TOKEN_REGEX = re.compile(r'''
+      (?P<space>   \s+                                                      )
+    | (?P<comment> //[^\n]* | /\*.*?\*/ | (?<![^\n])\#[^\n]*                )           # '#' lines are C preprocessor output (ignored by graphviz when in the first column)
+    | (?P<string>  "(?:[^"\\]|\\.)*"                                        )
+    | (?P<attrs>   \[ (?:[^\[\]"<]|"(?:[^"\\]|\\.)*")* \]                   )           # fast path for attribute lists without nesting or html strings
+    | (?P<edge_op> -> | --                                                  )
+    | (?P<id>      -?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?) | [A-Za-z_\x80-\U0010ffff][A-Za-z_0-9\x80-\U0010ffff]* )
+    | (?P<punct>   [{}\[\];,=:]                                             )
+    | (?P<plus>    \+                                                       )           # concatenation of quoted strings ("a" + "b")
+    | (?P<html>    <                                                        )
+    | (?P<invalid> .                                                        )
+    ''', re.VERBOSE | re.DOTALL)
+
+DOT__KEYWORDS__ATTRS = ('graph', 'node', 'edge')
+DOT__TOKENS__ID      = ('id', 'string', 'html')
+
+
+class Graphviz__Dot__Stats(Type_Safe):                                      # single pass pre-parser: validates the DOT structure and counts nodes, edges and clusters (without running graphviz)
+
+    def tokens(self, dot_source: str) -> list:
+        if '<' not in dot_source:                                               # no html strings, so the regex engine can tokenize the whole source in one go
+            matches = DOT__TOKEN_REGEX.finditer(dot_source)
+            tokens  = [(match.lastgroup, match.group(), match.start()) for match in matches if match.lastgroup not in ('space', 'comment')]
+        else:
+            tokens = self.tokens__with_html(dot_source)
+        has_plus = False
+        for kind, value, position in tokens:
+            if kind == 'invalid':
+                raise ValueError(f"Invalid DOT source: unexpected character {value!r} at position {position}")
+            if kind == 'plus':
+                has_plus = True
+        if has_plus:
+            return self.tokens__concatenated(tokens)
+        return tokens
+
+    def tokens__concatenated(self, tokens: list) -> list:                   # "a" + "b" is the single string "ab"
+        result = []
+        index  = 0
+        while index < len(tokens):
+            kind, value, position = tokens[index]
+            if kind == 'plus':
+                if not result or result[-1][0] != 'string' or index + 1 >= len(tokens) or tokens[index + 1][0] != 'string':
+                    raise ValueError(f"Invalid DOT source: '+' must be between two quoted strings (at position {position})")
+                _, left, left_position = result.pop()
+                result.append(('string', left[:-1] + tokens[index + 1][1][1:], left_position))
+                index += 2
+                continue
+            result.append(tokens[index])
+            index += 1
+        return result
+
+    def tokens__with_html(self, dot_source: str) -> list:
+        tokens   = []
+        position = 0
+        length   = len(dot_source)
+        while position < length:
+            match = DOT__TOKEN_REGEX.match(dot_source, position)
+            kind  = match.lastgroup
+            if kind == 'html':
+                end = self.html_string_end(dot_source, position)
+                tokens.append(('html', dot_source[position:end], position))
+                position = end
+                continue
+            if kind not in ('space', 'comment'):
+                tokens.append((kind, match.group(), position))
+            position = match.end()
+        return tokens
+
+    def html_string_end(self, dot_source: str, position: int) -> int:       # html strings (<...>) can be nested
+        depth = 0
+        for index in range(position, len(dot_source)):
+            char = dot_source[index]
+            if char == '<':
+                depth += 1
+            elif char == '>':
+                depth -= 1
+                if depth == 0:
+                    return index + 1
+        raise ValueError("Invalid DOT source: unterminated html string")
+
+    def dot_stats(self, dot_source: str) -> Model__Graphviz__Dot__Stats:
+        tokens = self.tokens(dot_source or '')
+        stats  = Model__Graphviz__Dot__Stats()
+        index  = self.parse_header(tokens, stats)
+        index  = self.parse_body  (tokens, stats, index)
+        if index < len(tokens):
+            raise ValueError(f"Invalid DOT source: unexpected content after the end of the graph at position {tokens[index][2]}")
+        return stats
+
+    def parse_header(self, tokens: list, stats: Model__Graphviz__Dot__Stats) -> int:     # [strict] (graph | digraph) [ID] '{'
+        index = 0
+        if index < len(tokens) and tokens[index][1].lower() == 'strict':
+            index += 1
+        graph_type = tokens[index][1].lower() if index < len(tokens) else None
+        if graph_type not in ('graph', 'digraph'):
+            raise ValueError("Invalid DOT source: expected 'graph' or 'digraph'")
+        stats.directed = graph_type == 'digraph'
+        index += 1
+        if index < len(tokens) and tokens[index][0] in DOT__TOKENS__ID:
+            index += 1
+        if index >= len(tokens) or tokens[index][1] != '{':
+            raise ValueError("Invalid DOT source: expected '{' after the graph declaration")
+        return index + 1
+
+    def parse_body(self, tokens: list, stats: Model__Graphviz__Dot__Stats, index: int) -> int:
+        node_ids      = set()
+        edge_count    = 0                                                    # counted in locals (Type_Safe attribute writes are type checked)
+        cluster_count = 0
+        edge_op       = '->' if stats.directed else '--'
+        frames        = [self.body_frame()]                                  # one per open '{' (the graph's body and its subgraphs)
+        bracket_depth = 0
+        tokens_count  = len(tokens)
+        while index < tokens_count:
+            kind, value, position = tokens[index]
+            index += 1
+            frame = frames[-1]
+            if kind == 'attrs':
+                frame['operand'] = None
+                continue
+            if bracket_depth:                                                # contents of attribute lists don't affect the counts
+                if value == '[':
+                    bracket_depth += 1
+                elif value == ']':
+                    bracket_depth -= 1
+                continue
+            if value == '[':
+                bracket_depth   += 1
+                frame['operand'] = None
+            elif value == ']':
+                raise ValueError(f"Invalid DOT source: unbalanced ']' at position {position}")
+            elif value == '{':
+                frames.append(self.body_frame())
+            elif value == '}':
+                frames.pop()
+                if not frames:
+                    stats.body_end      = position
+                    stats.node_count    = len(node_ids)
+                    stats.edge_count    = edge_count
+                    stats.cluster_count = cluster_count
+                    return index
+                frames[-1]['nodes'] |= frame['nodes']                        # a subgraph's nodes are also in its parent
+                edge_count          += self.edge_operand(frames[-1], len(frame['nodes']))
+            elif kind == 'edge_op':
+                if value != edge_op:
+                    raise ValueError(f"Invalid DOT source: '{value}' is not valid in a {'digraph' if stats.directed else 'graph'} (at position {position})")
+                if frame['operand'] is None or index >= tokens_count or self.is_edge_operand_start(tokens[index]) is False:
+                    raise ValueError(f"Invalid DOT source: '{value}' needs a node or subgraph on each side (at position {position})")
+                frame['edge_from'] = frame['operand']
+                frame['operand'  ] = None
+            elif kind == 'id' and value.lower() == 'subgraph':
+                if index < tokens_count and tokens[index][0] in DOT__TOKENS__ID:
+                    if tokens[index][1].strip('"').startswith('cluster'):
+                        cluster_count += 1
+                    index += 1
+            elif kind == 'id' and value.lower() in DOT__KEYWORDS__ATTRS:
+                frame['operand'] = None
+            elif kind in DOT__TOKENS__ID:
+                if index < tokens_count and tokens[index][1] == '=':         # attribute assignment (i.e. rankdir=LR)
+                    index           += 2
+                    frame['operand'] = None
+                    continue
+                node_id = value.strip('"') if kind == 'string' else value
+                node_ids      .add(node_id)
+                frame['nodes'].add(node_id)
+                edge_count += self.edge_operand(frame, 1)
+                while index + 1 < tokens_count and tokens[index][1] == ':':  # node ports (i.e. a:port:n)
+                    index += 2
+            else:                                                            # ';' and ',' end the statement
+                frame['operand'] = None
+        raise ValueError("Invalid DOT source: unbalanced '{'")
+
+    def body_frame(self) -> dict:
+        return dict(nodes     = set(),                                       # the nodes in this body (its size when the subgraph is an edge operand)
+                    operand   = None ,                                       # size of the node (1) or subgraph that the last token completed (None when it didn't complete one)
+                    edge_from = None )                                       # size of the left side of a pending edge op
+
+    def edge_operand(self, frame: dict, size: int) -> int:                  # returns the edges a completed operand adds: a -> {b c d} is 3 edges, {a b} -> {c d} is 4
+        edges = 0
+        if frame['edge_from'] is not None:
+            edges              = frame['edge_from'] * size
+            frame['edge_from'] = None
+        frame['operand'] = size
+        return edges
+
+    def is_edge_operand_start(self, token) -> bool:                         # a node id, 'subgraph' or the '{' of an anonymous subgraph
+        return token[0] in DOT__TOKENS__ID or token[1] == '{'
@@ -0,0 +1,54 @@
+from typing                                                         import Iterator
+from osbot_utils.type_safe.Type_Safe                                import Type_Safe
+from mgraph_ai_serverless.graph_engines.Graph_Engines__Domain_Types import GRAPH_ENGINES__DOMAIN_TYPES
+
+MGRAPH__DOT__NODE_LABEL_ATTRS = ('label', 'name', 'value')                  # same order as MGraph__Export__Matplotlib.get_node_label
+
+
+class Graphviz__MGraph__Dot(Type_Safe):                                     # writes DOT straight from the (serialized) nodes and edges, without rebuilding the MGraph domain objects
+    node_attrs : dict
+    edge_attrs : dict
+
+    def dot_source(self, graph_data: dict) -> str:
+        return ''.join(self.dot_lines(graph_data))
+
+    def dot_lines(self, graph_data: dict) -> Iterator[str]:                 # one line per node/edge, so large graphs are never held in intermediate structures
+        nodes, edges = self.graph_data_nodes_and_edges(graph_data)
+        yield 'digraph {\n'                                                 # MGraph edges always go from_node -> to_node
+        if self.node_attrs:
+            yield f'    node [{self.dot_attrs(self.node_attrs)}];\n'
+        if self.edge_attrs:
+            yield f'    edge [{self.dot_attrs(self.edge_attrs)}];\n'
+        for node_id, node in nodes.items():
+            yield f'    {self.dot_id(node_id)} [label={self.dot_id(self.node_label(node))}];\n'
+        for edge in edges.values():
+            yield f'    {self.dot_id(edge.get("from_node_id"))} -> {self.dot_id(edge.get("to_node_id"))};\n'
+        yield '}\n'
+
+    def graph_data_nodes_and_edges(self, graph_data: dict):
+        if not graph_data:
+            raise ValueError("No graph provided for rendering")
+        graph_type = graph_data.get('graph_type')
+        if graph_type not in GRAPH_ENGINES__DOMAIN_TYPES:                   # same allow-list as the matplotlib renderer
+            raise ValueError(f"Unsupported domain type: {graph_type}")
+        model_data = (graph_data.get('model') or {}).get('data') or {}
+        nodes      = model_data.get('nodes')
+        edges      = model_data.get('edges')
+        if not isinstance(nodes, dict) or not isinstance(edges, dict):
+            raise ValueError("Invalid graph_data: model.data must contain 'nodes' and 'edges'")
+        return nodes, edges
+
+    def node_label(self, node: dict) -> str:
+        node_data = node.get('node_data') or {}
+        for attr in MGRAPH__DOT__NODE_LABEL_ATTRS:
+            node_label = node_data.get(attr)
+            if node_label:
+                return str(node_label)
+        return str(node.get('node_type') or '').split('.')[-1]             # node_type is the full type name
+
+    def dot_id(self, value) -> str:                                         # always quoted, so any id/label is valid DOT
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        return f'"{value}"'
+
+    def dot_attrs(self, attrs: dict) -> str:
+        return ', '.join(f'{name}={self.dot_id(value)}' for name, value in attrs.items())
@@ -1,13 +1,167 @@
-import graphviz
+import io
+import json
+import os
+import zipfile
+from threading                                                                              import BoundedSemaphore
+from concurrent.futures                                                                     import ThreadPoolExecutor
+from osbot_utils.decorators.methods.cache_on_self                                           import cache_on_self
+from osbot_utils.utils.Env                                                                  import get_env
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__MGraph__Dot                      import Graphviz__MGraph__Dot
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Cache                    import Graphviz__Render__Cache
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Planner                  import Graphviz__Render__Planner
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend                 import Graphviz__Backend
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Libgvc         import Graphviz__Backend__Libgvc
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Subprocess     import Graphviz__Backend__Subprocess
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot         import Model__Graphviz__Render_Dot
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot_Batch   import Model__Graphviz__Render_Dot_Batch
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot_Formats import Model__Graphviz__Render_Dot_Formats
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_MGraph      import Model__Graphviz__Render_MGraph
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Plan        import Model__Graphviz__Render_Plan
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
 
-from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot import Model__Graphviz__Render_Dot
-from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+GRAPHVIZ__BACKEND            = get_env('MGRAPH__GRAPHVIZ__BACKEND', 'subprocess')
+GRAPHVIZ__BATCH__MAX_ITEMS   = int(get_env('MGRAPH__GRAPHVIZ__BATCH__MAX_ITEMS'  , 1000               ))      # larger batches are rejected
+GRAPHVIZ__BATCH__MAX_WORKERS = int(get_env('MGRAPH__GRAPHVIZ__BATCH__MAX_WORKERS', os.cpu_count() or 1))      # max batch items rendering at the same time (across all requests), also the upper bound for the per-request max_workers
+
+GRAPHVIZ__BACKENDS = { 'subprocess' : Graphviz__Backend__Subprocess ,                                  # allow-list of supported backends
+                       'libgvc'     : Graphviz__Backend__Libgvc     }
+
+graphviz__batch_slots = BoundedSemaphore(max(GRAPHVIZ__BATCH__MAX_WORKERS, 1))                        # process wide, so concurrent batch requests share the same cap
 
 
 class Graphviz__Render(Type_Safe):
+    cache            : Graphviz__Render__Cache
+    layout_cache     : Graphviz__Render__Cache                                                         # positioned DOT (-Tdot output) by source hash
+    backend_name     : str = GRAPHVIZ__BACKEND
+    backend_fallback : Graphviz__Backend__Subprocess
+    planner          : Graphviz__Render__Planner
+    mgraph_dot       : Graphviz__MGraph__Dot
+
+    @cache_on_self
+    def backend(self) -> Graphviz__Backend:
+        backend_type = GRAPHVIZ__BACKENDS.get(self.backend_name)
+        if not backend_type:
+            raise ValueError(f"Unsupported graphviz backend: {self.backend_name}")
+        backend = backend_type()
+        if backend.is_available():
+            return backend
+        return self.backend_fallback                                                                   # e.g. libgvc requested but graphviz's shared libraries are not installed
+
+    def render_plan(self, render_config: Model__Graphviz__Render_Dot) -> Model__Graphviz__Render_Plan:
+        return self.planner.render_plan(render_config.dot_source, render_config.engine, render_config.max_ms)
 
-    def render_dot(self, render_config: Model__Graphviz__Render_Dot)-> bytes:
-        dot_source    = render_config.dot_source
+    def render_dot(self, render_config: Model__Graphviz__Render_Dot, render_plan: Model__Graphviz__Render_Plan = None)-> bytes:
+        render_plan   = render_plan or self.render_plan(render_config)
+        dot_source    = self.planner.planned_dot_source(render_config.dot_source, render_plan)
+        engine        = render_plan.engine
         output_format = render_config.output_format
-        dot           = graphviz.Source(dot_source)
-        return dot.pipe(format=output_format)
\ No newline at end of file
+        reuse_layout  = render_config.reuse_layout
+        cache_key     = self.cache.cache_key(dot_source, output_format, engine=engine, reuse_layout=reuse_layout)
+        bytes_data    = self.cache.get(cache_key)
+        if bytes_data is None:
+            if reuse_layout:
+                bytes_data = self.render_layout(self.layout_dot(dot_source, engine=engine), output_format)
+            else:
+                bytes_data = self.render_dot_source(dot_source, output_format, engine=engine)
+            self.cache.set(cache_key, bytes_data)
+        return bytes_data
+
+    def render_mgraph_config(self, render_mgraph: Model__Graphviz__Render_MGraph) -> Model__Graphviz__Render_Dot:    # MGraph graph_data -> DOT render config
+        dot_source = self.mgraph_dot.dot_source(render_mgraph.graph_data)
+        return Model__Graphviz__Render_Dot(dot_source    = dot_source                 ,
+                                           output_format = render_mgraph.output_format,
+                                           engine        = render_mgraph.engine       ,
+                                           max_ms        = render_mgraph.max_ms       )
+
+    def render_mgraph(self, render_mgraph: Model__Graphviz__Render_MGraph) -> bytes:
+        return self.render_dot(self.render_mgraph_config(render_mgraph))
+
+    def render_dot_formats(self, render_formats: Model__Graphviz__Render_Dot_Formats) -> dict:       # one layout, many output formats
+        results     = {}
+        render_plan = None
+        for output_format in render_formats.output_formats:
+            render_config = Model__Graphviz__Render_Dot(dot_source    = render_formats.dot_source,
+                                                        output_format = output_format            ,
+                                                        engine        = render_formats.engine    ,
+                                                        max_ms        = render_formats.max_ms    ,
+                                                        reuse_layout  = True                     )
+            render_plan   = render_plan or self.render_plan(render_config)                          # the source is only pre-parsed once
+            results[f'graph.{output_format.value}'] = self.render_dot(render_config, render_plan)
+        return results
+
+    def render_dot_formats_zip(self, render_formats: Model__Graphviz__Render_Dot_Formats) -> bytes:
+        return self.files_to_zip(self.render_dot_formats(render_formats))
+
+    def layout_dot(self, dot_source: str, engine: str = 'dot') -> str:                                # runs the (expensive) layout step and returns the positioned DOT
+        cache_key  = self.layout_cache.cache_key(dot_source, 'dot', engine=engine)
+        layout_dot = self.layout_cache.get(cache_key)
+        if layout_dot is None:
+            layout_dot = self.render_dot_source(dot_source, 'dot', engine=engine)
+            self.layout_cache.set(cache_key, layout_dot)
+        return layout_dot.decode()
+
+    def render_layout(self, layout_dot: str, output_format) -> bytes:                                 # cheap render step: reuses the positions (neato -n2)
+        return self.render_dot_source(layout_dot, output_format, neato_no_op=2)
+
+    def render_dot_source(self, dot_source: str, output_format, engine: str = 'dot', neato_no_op: int = None) -> bytes:
+        render_kwargs = dict(dot_source    = dot_source                                      ,
+                             output_format = getattr(output_format, 'value', output_format)  ,
+                             engine        = engine                                          ,
+                             neato_no_op   = neato_no_op                                     )
+        backend       = self.backend()
+        try:
+            return backend.render(**render_kwargs)
+        except ValueError:                                                                             # bad input (i.e. a DOT syntax error), the fallback would fail the same way
+            raise
+        except Exception:                                                                              # the backend itself failed (i.e. libgvc's libraries could not be loaded)
+            if backend is self.backend_fallback:
+                raise
+            return self.backend_fallback.render(**render_kwargs)
+
+    def render_dot_batch(self, render_batch: Model__Graphviz__Render_Dot_Batch) -> list:           # renders all items in parallel, errors are captured per item
+        items = render_batch.items
+        if len(items) > GRAPHVIZ__BATCH__MAX_ITEMS:
+            raise ValueError(f"Too many items in batch: {len(items)} (max is {GRAPHVIZ__BATCH__MAX_ITEMS})")
+        if not items:
+            return []
+        max_workers = min(render_batch.max_workers or GRAPHVIZ__BATCH__MAX_WORKERS, GRAPHVIZ__BATCH__MAX_WORKERS, len(items))
+        if self.backend().parallel_renders is False:                                                   # libgvc renders one graph at a time (behind its lock), so more threads would only wait
+            max_workers = 1
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:                          # with the subprocess backend the renders happen in child processes, so threads are enough to use all cores
+            return list(executor.map(self.render_dot_batch_item, range(len(items)), items))
+
+    def render_dot_batch_item(self, index: int, render_config: Model__Graphviz__Render_Dot) -> dict:
+        output_format = getattr(render_config.output_format, 'value', render_config.output_format)
+        result        = dict(index=index, output_format=output_format, file_name=f'{index:04d}.{output_format}')
+        try:
+            with graphviz__batch_slots:
+                result['bytes_data'] = self.render_dot(render_config)
+        except Exception as error:
+            result['error'     ] = f'{type(error).__name__}: {error}'
+        return result
+
+    def render_dot_batch_zip(self, render_batch: Model__Graphviz__Render_Dot_Batch) -> bytes:     # zip with one file per rendered item, plus a manifest.json with the status of each item
+        results  = self.render_dot_batch(render_batch)
+        files    = {}
+        manifest = []
+        for result in results:
+            bytes_data = result.pop('bytes_data', None)
+            if bytes_data is None:
+                result['file_name'] = None
+            else:
+                files[result['file_name']] = bytes_data
+            manifest.append(result)
+        files['manifest.json'] = json.dumps(manifest, indent=2).encode()
+        return self.files_to_zip(files)
+
+    def files_to_zip(self, files: dict) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zip_file:                           # png/pdf are already compressed
+            for file_name, file_bytes in files.items():
+                zip_file.writestr(file_name, file_bytes)
+        return buffer.getvalue()
+
+    def cache_stats(self):
+        stats            = self.cache.stats()
+        stats['layouts'] = self.layout_cache.stats()
+        return stats
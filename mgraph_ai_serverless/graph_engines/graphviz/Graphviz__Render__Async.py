@@ -0,0 +1,83 @@
+import asyncio
+from typing                                                                              import Callable, Awaitable
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                        import Graphviz__Render
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Cache                 import Graphviz__Render__Cache
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Planner               import Graphviz__Render__Planner
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Stream                import Graphviz__Render__Stream
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Subprocess  import Graphviz__Backend__Subprocess
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot      import Model__Graphviz__Render_Dot
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Plan     import Model__Graphviz__Render_Plan
+
+GRAPHVIZ__DISCONNECT__POLL_INTERVAL = 0.1                                       # seconds between checks for a client disconnect
+
+
+class Graphviz__Render__Async(Graphviz__Render__Stream):                        # renders on an asyncio subprocess, which is killed on timeout or client disconnect
+    cache           : Graphviz__Render__Cache
+    planner         : Graphviz__Render__Planner
+    graphviz_render : Graphviz__Render                                          # (sync) renderer used for the configured backend, when it is not the subprocess one
+    poll_interval   : float = GRAPHVIZ__DISCONNECT__POLL_INTERVAL
+
+    def render_plan(self, render_config: Model__Graphviz__Render_Dot) -> Model__Graphviz__Render_Plan:
+        return self.planner.render_plan(render_config.dot_source, render_config.engine, render_config.max_ms)
+
+    async def render_plan_async(self, render_config: Model__Graphviz__Render_Dot) -> Model__Graphviz__Render_Plan:    # the DOT pre-parse (and stats) is cpu bound, so it runs off the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, self.render_plan, render_config)
+
+    def render_timeout(self, render_config: Model__Graphviz__Render_Dot) -> float:     # requests can ask for a shorter timeout, never a longer one
+        if render_config.timeout:
+            return min(render_config.timeout, self.timeout)
+        return self.timeout
+
+    async def render_dot(self, render_config: Model__Graphviz__Render_Dot, is_disconnected: Callable[[], Awaitable[bool]] = None,
+                               render_plan  : Model__Graphviz__Render_Plan = None) -> bytes:
+        if render_config.reuse_layout:
+            raise ValueError("reuse_layout is not supported by the async render (use render-dot or render-dot-formats)")
+        render_plan   = render_plan or await self.render_plan_async(render_config)
+        timeout       = self.render_timeout(render_config)
+        if not isinstance(self.graphviz_render.backend(), Graphviz__Backend__Subprocess):
+            return await self.render_dot__in_process(render_config, render_plan, is_disconnected, timeout)
+        dot_source    = self.planner.planned_dot_source(render_config.dot_source, render_plan)
+        engine        = render_plan.engine
+        output_format = render_config.output_format
+        cache_key     = self.cache.cache_key(dot_source, output_format, engine=engine, reuse_layout=False)
+        bytes_data    = self.cache.get(cache_key)
+        if bytes_data is not None:
+            return bytes_data
+
+        process      = await asyncio.create_subprocess_exec(*self.render_command(output_format, engine),
+                                                            stdin  = asyncio.subprocess.PIPE,
+                                                            stdout = asyncio.subprocess.PIPE,
+                                                            stderr = asyncio.subprocess.PIPE)
+        render_task  = asyncio.create_task(process.communicate(dot_source.encode()))
+        watch_task   = asyncio.create_task(self.wait_for_disconnect(is_disconnected))
+        try:
+            stdout, stderr = await self.wait_for_render(render_task, watch_task, timeout)
+            if process.returncode != 0:
+                raise ValueError(f"Graphviz render failed: {stderr.decode(errors='replace').strip()}")
+            self.cache.set(cache_key, stdout)
+            return stdout
+        finally:
+            await self.stop_process(process, render_task, watch_task)             # kills the renderer if it is still running
+
+    async def render_dot__in_process(self, render_config: Model__Graphviz__Render_Dot, render_plan: Model__Graphviz__Render_Plan,
+                                           is_disconnected: Callable[[], Awaitable[bool]], timeout: float) -> bytes:         # in-process backends (i.e. libgvc) can't be killed, so on timeout or disconnect the render is abandoned (and finishes in its thread)
+        render_task = asyncio.get_running_loop().run_in_executor(None, self.graphviz_render.render_dot, render_config, render_plan)
+        watch_task  = asyncio.create_task(self.wait_for_disconnect(is_disconnected))
+        try:
+            return await self.wait_for_render(render_task, watch_task, timeout)
+        finally:
+            watch_task.cancel()
+
+    async def wait_for_render(self, render_task, watch_task, timeout: float):
+        done, _ = await asyncio.wait({render_task, watch_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if render_task in done:
+            return render_task.result()
+        if watch_task in done:
+            raise ConnectionAbortedError("Client disconnected, Graphviz render was cancelled")
+        raise TimeoutError(f"Graphviz render timed out after {timeout} seconds")
+
+    async def wait_for_disconnect(self, is_disconnected: Callable[[], Awaitable[bool]] = None):
+        if is_disconnected is None:
+            await asyncio.Event().wait()                                          # nothing to watch, wait until cancelled
+        while not await is_disconnected():
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+from collections                     import OrderedDict
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+from osbot_utils.utils.Env           import get_env
+from osbot_utils.utils.Files         import path_combine, file_exists, file_bytes, folder_create
+
+GRAPHVIZ__CACHE__MAX_ITEMS      = int(get_env('MGRAPH__GRAPHVIZ__CACHE__MAX_ITEMS', 256               ))     # max number of renders kept in memory
+GRAPHVIZ__CACHE__MAX_BYTES      = int(get_env('MGRAPH__GRAPHVIZ__CACHE__MAX_BYTES', 64 * 1024 * 1024  ))     # max total size of the renders kept in memory
+GRAPHVIZ__CACHE__DISK           = get_env('MGRAPH__GRAPHVIZ__CACHE__DISK', 'false').lower() == 'true'         # enable the /tmp tier (shared by all workers in the same container)
+GRAPHVIZ__CACHE__DISK_FOLDER    = get_env('MGRAPH__GRAPHVIZ__CACHE__DISK_FOLDER', '/tmp/mgraph-ai-serverless/graphviz-cache')
+GRAPHVIZ__CACHE__DISK_MAX_ITEMS = int(get_env('MGRAPH__GRAPHVIZ__CACHE__DISK_MAX_ITEMS', 1024              ))     # max number of renders kept in the disk tier
+GRAPHVIZ__CACHE__DISK_MAX_BYTES = int(get_env('MGRAPH__GRAPHVIZ__CACHE__DISK_MAX_BYTES', 256 * 1024 * 1024 ))     # max total size of the disk tier (Lambda's /tmp is 512Mb by default)
+
+
+class Graphviz__Render__Cache(Type_Safe):                                                   # content-addressed cache of rendered DOT graphs (in-memory LRU + optional disk tier)
+    max_items      : int         = GRAPHVIZ__CACHE__MAX_ITEMS
+    max_bytes      : int         = GRAPHVIZ__CACHE__MAX_BYTES
+    disk_enabled   : bool        = GRAPHVIZ__CACHE__DISK
+    disk_folder    : str         = GRAPHVIZ__CACHE__DISK_FOLDER
+    disk_max_items : int         = GRAPHVIZ__CACHE__DISK_MAX_ITEMS
+    disk_max_bytes : int         = GRAPHVIZ__CACHE__DISK_MAX_BYTES
+    items          : OrderedDict                                                            # cache_key -> bytes (most recently used at the end)
+    items_bytes    : int
+    hits           : int
+    misses         : int
+    evictions      : int
+    disk_hits      : int
+    disk_writes    : int
+    disk_evictions : int
+    lock           = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.RLock()                                                       # routes are called from FastAPI's threadpool
+
+    def cache_key(self, dot_source: str, output_format, **options) -> str:                  # hash of normalized source + format + engine options
+        key_data = dict(dot_source    = self.normalize_dot_source(dot_source),
+                        output_format = getattr(output_format, 'value', output_format),
+                        options       = options                                     )
+        key_json = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(key_json.encode()).hexdigest()
+
+    def normalize_dot_source(self, dot_source: str) -> str:                                 # only normalise what can't change the rendered output
+        return (dot_source or '').replace('\r\n', '\n').strip()
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.items_bytes = 0
+
+    def get(self, cache_key: str):
+        with self.lock:
+            value = self.items.get(cache_key)
+            if value is not None:
+                self.items.move_to_end(cache_key)
+                self.hits += 1
+                return value
+        value = self.disk_get(cache_key)
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self.memory_set(cache_key, value)                                               # promote to the memory tier
+            return value
+
+    def set(self, cache_key: str, value: bytes):
+        with self.lock:
+            self.memory_set(cache_key, value)
+        self.disk_set(cache_key, value)
+        return value
+
+    def memory_set(self, cache_key: str, value: bytes):
+        if len(value) > self.max_bytes:                                                     # never let a single item flush the whole cache
+            return
+        if cache_key in self.items:
+            self.items_bytes -= len(self.items.pop(cache_key))
+        self.items[cache_key]  = value
+        self.items_bytes      += len(value)
+        while len(self.items) > self.max_items or self.items_bytes > self.max_bytes:
+            _, evicted        = self.items.popitem(last=False)
+            self.items_bytes -= len(evicted)
+            self.evictions   += 1
+
+    def disk_path(self, cache_key: str) -> str:
+        return path_combine(self.disk_folder, cache_key)
+
+    def disk_get(self, cache_key: str):
+        if self.disk_enabled:
+            path = self.disk_path(cache_key)
+            if file_exists(path):
+                try:
+                    value = file_bytes(path)
+                    os.utime(path)                                                          # the mtime is the last use, so the disk tier is evicted in LRU order
+                    return value
+                except FileNotFoundError:                                                   # evicted by another worker
+                    return None
+
+    def disk_set(self, cache_key: str, value: bytes):
+        if self.disk_enabled:
+            if len(value) > self.disk_max_bytes:                                            # (same as the memory tier)
+                return
+            path      = self.disk_path(cache_key)
+            path_temp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            folder_create(self.disk_folder)
+            with open(path_temp, 'wb') as file:
+                file.write(value)
+            os.replace(path_temp, path)                                                     # atomic, so other workers never read a partial file
+            with self.lock:
+                self.disk_writes += 1
+            self.disk_evict()
+
+    def disk_files(self) -> list:                                                           # (mtime, size, path) of the cached renders, least recently used first
+        files = []
+        with os.scandir(self.disk_folder) as entries:
+            for entry in entries:
+                if entry.name.endswith('.tmp'):                                             # other workers' writes in progress
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(files)
+
+    def disk_evict(self):                                                                   # the folder is shared by all workers in the container, so its bounds are checked on disk (not in memory)
+        files       = self.disk_files()
+        files_count = len(files)
+        files_bytes = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if files_count <= self.disk_max_items and files_bytes <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(path)
+                with self.lock:
+                    self.disk_evictions += 1
+            except FileNotFoundError:                                                       # already evicted by another worker
+                pass
+            files_count -= 1
+            files_bytes -= size
+
+    def stats(self):
+        with self.lock:
+            return dict(hits           = self.hits           ,
+                        misses         = self.misses         ,
+                        evictions      = self.evictions      ,
+                        disk_hits      = self.disk_hits      ,
+                        disk_writes    = self.disk_writes    ,
+                        disk_evictions = self.disk_evictions ,
+                        items          = len(self.items)     ,
+                        items_bytes    = self.items_bytes    ,
+                        max_items      = self.max_items      ,
+                        max_bytes      = self.max_bytes      ,
+                        disk_enabled   = self.disk_enabled   ,
+                        disk_max_items = self.disk_max_items ,
+                        disk_max_bytes = self.disk_max_bytes )
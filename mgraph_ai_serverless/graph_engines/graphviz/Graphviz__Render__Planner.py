@@ -0,0 +1,92 @@
+import graphviz
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Dot__Stats               import Graphviz__Dot__Stats
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Plan import Model__Graphviz__Render_Plan
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.utils.Env                                                          import get_env
+
+GRAPHVIZ__ADMISSION__MAX_NODES       = int  (get_env('MGRAPH__GRAPHVIZ__ADMISSION__MAX_NODES'      , 100_000))     # larger graphs are rejected (before graphviz is started)
+GRAPHVIZ__ADMISSION__MAX_EDGES       = int  (get_env('MGRAPH__GRAPHVIZ__ADMISSION__MAX_EDGES'      , 500_000))
+GRAPHVIZ__ADMISSION__LARGE_NODES     = int  (get_env('MGRAPH__GRAPHVIZ__ADMISSION__LARGE_NODES'    , 2_000  ))     # above this, costly engines are downgraded
+GRAPHVIZ__ADMISSION__LARGE_EDGES     = int  (get_env('MGRAPH__GRAPHVIZ__ADMISSION__LARGE_EDGES'    , 5_000  ))
+GRAPHVIZ__ADMISSION__SCALABLE_ENGINE =       get_env('MGRAPH__GRAPHVIZ__ADMISSION__SCALABLE_ENGINE', 'sfdp' )      # engine used for large graphs
+GRAPHVIZ__ADMISSION__MAX_ITER        = int  (get_env('MGRAPH__GRAPHVIZ__ADMISSION__MAX_ITER'       , 300    ))     # iteration cap for the layout of large graphs
+GRAPHVIZ__BUDGET__MS_PER_ELEMENT     = float(get_env('MGRAPH__GRAPHVIZ__BUDGET__MS_PER_ELEMENT'    , 0.5    ))     # estimated cost of a full quality layout, per node + edge
+GRAPHVIZ__BUDGET__MIN_ITER           = int  (get_env('MGRAPH__GRAPHVIZ__BUDGET__MIN_ITER'          , 20     ))     # never go below this many layout iterations
+
+GRAPHVIZ__ENGINE__DEFAULT    = 'dot'
+GRAPHVIZ__ENGINE__MAX_ITER   = 600                                                                                # fdp/sfdp's default number of iterations
+GRAPHVIZ__ENGINE__SEARCHSIZE = 30                                                                                 # dot's default searchsize
+GRAPHVIZ__ENGINES__COSTLY    = ('dot', 'neato', 'fdp', 'circo', 'twopi')                                          # super-linear layouts, that can run for minutes on large graphs
+
+
+class Graphviz__Render__Planner(Type_Safe):                                 # cost-aware admission control: decides if (and with which engine) a DOT source is rendered
+    dot_stats       : Graphviz__Dot__Stats
+    max_nodes       : int   = GRAPHVIZ__ADMISSION__MAX_NODES
+    max_edges       : int   = GRAPHVIZ__ADMISSION__MAX_EDGES
+    large_nodes     : int   = GRAPHVIZ__ADMISSION__LARGE_NODES
+    large_edges     : int   = GRAPHVIZ__ADMISSION__LARGE_EDGES
+    scalable_engine : str   = GRAPHVIZ__ADMISSION__SCALABLE_ENGINE
+    max_iter        : int   = GRAPHVIZ__ADMISSION__MAX_ITER
+    ms_per_element  : float = GRAPHVIZ__BUDGET__MS_PER_ELEMENT
+    min_iter        : int   = GRAPHVIZ__BUDGET__MIN_ITER
+
+    def render_plan(self, dot_source: str, engine: str = None, max_ms: int = None) -> Model__Graphviz__Render_Plan:
+        requested_engine = engine or GRAPHVIZ__ENGINE__DEFAULT
+        if requested_engine not in graphviz.ENGINES:
+            raise ValueError(f"Unsupported graphviz engine: {requested_engine}")
+        stats = self.dot_stats.dot_stats(dot_source)                        # raises ValueError for malformed sources
+        if stats.node_count > self.max_nodes or stats.edge_count > self.max_edges:
+            raise ValueError(f"Graph too large: {stats.node_count} nodes and {stats.edge_count} edges "
+                             f"(max is {self.max_nodes} nodes and {self.max_edges} edges)")
+        render_plan = Model__Graphviz__Render_Plan(requested_engine=requested_engine, engine=requested_engine, stats=stats)
+        if self.is_large(stats):
+            if requested_engine in GRAPHVIZ__ENGINES__COSTLY:
+                render_plan.engine = self.scalable_engine
+            render_plan.graph_attrs['maxiter'] = self.max_iter
+        if max_ms:
+            self.apply_budget(render_plan, max_ms)
+        return render_plan
+
+    def budget_quality(self, stats, max_ms: int) -> float:                 # 1.0 when a full quality layout fits in the budget, smaller the more it has to be cut
+        if max_ms <= 0:
+            raise ValueError(f"Invalid max_ms: {max_ms} (must be a positive number of milliseconds)")
+        estimated_ms = (stats.node_count + stats.edge_count) * self.ms_per_element
+        if estimated_ms <= max_ms:
+            return 1.0
+        return max_ms / estimated_ms
+
+    def apply_budget(self, render_plan: Model__Graphviz__Render_Plan, max_ms: int):     # trades layout quality for time (the params used end up in the plan's graph_attrs)
+        quality = self.budget_quality(render_plan.stats, max_ms)
+        if quality >= 1.0:
+            return
+        graph_attrs = render_plan.graph_attrs
+        if render_plan.engine == 'dot':
+            graph_attrs['nslimit'   ] = round(max(quality * 10, 0.1), 2)                 # network simplex iterations (x node count), for ranking and x coordinates
+            graph_attrs['nslimit1'  ] = graph_attrs['nslimit']
+            graph_attrs['mclimit'   ] = round(max(quality     , 0.1), 2)                 # scale of the crossing minimisation iterations
+            graph_attrs['searchsize'] = max(int(GRAPHVIZ__ENGINE__SEARCHSIZE * quality), 1)
+        else:
+            max_iter = max(int(GRAPHVIZ__ENGINE__MAX_ITER * quality), self.min_iter)
+            graph_attrs['maxiter'] = min(graph_attrs.get('maxiter', max_iter), max_iter)
+            graph_attrs['overlap'] = 'scale' if quality >= 0.25 else 'true'               # 'scale' is the cheapest removal, 'true' skips it
+
+    def is_large(self, stats) -> bool:
+        return stats.node_count > self.large_nodes or stats.edge_count > self.large_edges
+
+    def planned_dot_source(self, dot_source: str, render_plan: Model__Graphviz__Render_Plan) -> str:   # adds the plan's graph attributes just before the graph's closing '}'
+        if not render_plan.graph_attrs:
+            return dot_source
+        attrs    = ', '.join(f'{name}="{value}"' for name, value in sorted(render_plan.graph_attrs.items()))
+        body_end = render_plan.stats.body_end
+        return f'{dot_source[:body_end]}\n    graph [{attrs}];\n{dot_source[body_end:]}'
+
+    def plan_headers(self, render_plan: Model__Graphviz__Render_Plan) -> dict:                   # so that clients can see what was actually rendered
+        stats = render_plan.stats
+        return { 'X-Graphviz-Engine'   : render_plan.engine       ,
+                 'X-Graphviz-Nodes'    : str(stats.node_count   ),
+                 'X-Graphviz-Edges'    : str(stats.edge_count   ),
+                 'X-Graphviz-Clusters' : str(stats.cluster_count),
+                 'X-Graphviz-Params'   : self.plan_params(render_plan)}
+
+    def plan_params(self, render_plan: Model__Graphviz__Render_Plan) -> str:          # i.e. 'maxiter=300;overlap=scale' (logged with the render's latency)
+        return ';'.join(f'{name}={value}' for name, value in sorted(render_plan.graph_attrs.items()))
@@ -0,0 +1,102 @@
+import asyncio
+import time
+from typing                                                                             import AsyncIterator
+from graphviz.backend.dot_command                                                       import command
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Planner              import Graphviz__Render__Planner
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Output_Format  import Model__Graphviz__Output_Format
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Plan    import Model__Graphviz__Render_Plan
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from osbot_utils.utils.Env                                                              import get_env
+
+GRAPHVIZ__STREAM__CHUNK_SIZE = 64 * 1024
+GRAPHVIZ__TIMEOUT            = float(get_env('MGRAPH__GRAPHVIZ__TIMEOUT', 30))             # max seconds a renderer process is allowed to run
+
+
+class Graphviz__Render__Stream(Type_Safe):                                  # pipes the DOT source into the renderer's stdin and streams its stdout back (so the output is never held in memory)
+    chunk_size : int   = GRAPHVIZ__STREAM__CHUNK_SIZE
+    planner    : Graphviz__Render__Planner
+    timeout    : float = GRAPHVIZ__TIMEOUT
+
+    def render_command(self, output_format: Model__Graphviz__Output_Format, engine: str = 'dot'):
+        output_format = getattr(output_format, 'value', output_format)
+        return [str(item) for item in command(engine, output_format)]               # graphviz validates both engine and format
+
+    async def read_dot_source(self, dot_chunks: AsyncIterator[bytes]) -> str:       # the whole source is needed by the admission pre-parse (which bounds what is rendered)
+        dot_bytes = bytearray()
+        async for chunk in dot_chunks:
+            dot_bytes += chunk
+        if not dot_bytes.strip():
+            raise ValueError("No DOT source provided")
+        try:
+            return dot_bytes.decode()
+        except UnicodeDecodeError as error:
+            raise ValueError(f"DOT source is not valid utf-8: {error}")
+
+    async def render_plan_async(self, dot_source: str, engine: str = None) -> Model__Graphviz__Render_Plan:    # same admission as the other routes (cpu bound, so off the event loop)
+        return await asyncio.get_running_loop().run_in_executor(None, self.planner.render_plan, dot_source, engine)
+
+    async def render_stream(self, dot_source: str, output_format: Model__Graphviz__Output_Format, engine: str = None,
+                                  render_plan: Model__Graphviz__Render_Plan = None) -> AsyncIterator[bytes]:
+        render_plan = render_plan or await self.render_plan_async(dot_source, engine)    # rejects malformed or oversized graphs before the renderer starts
+        dot_source  = self.planner.planned_dot_source(dot_source, render_plan)
+        deadline    = time.monotonic() + self.timeout
+        process     = await asyncio.create_subprocess_exec(*self.render_command(output_format, render_plan.engine),
+                                                           stdin  = asyncio.subprocess.PIPE,
+                                                           stdout = asyncio.subprocess.PIPE,
+                                                           stderr = asyncio.subprocess.PIPE)
+        stdin_task  = asyncio.create_task(self.feed_stdin(process, dot_source.encode()))
+        stderr_task = asyncio.create_task(process.stderr.read())                    # drained in parallel so a chatty renderer can't block on a full pipe
+        try:
+            first_chunk = await self.read_chunk(process, deadline)                      # wait for the first chunk, so that errors can still become a proper http status
+            if not first_chunk:
+                await self.check_exit(process, stderr_task)
+        except BaseException:
+            await self.stop_process(process, stdin_task, stderr_task)
+            raise
+        return self.stream_stdout(process, first_chunk, deadline, stdin_task, stderr_task)
+
+    async def check_exit(self, process, stderr_task):
+        await process.wait()
+        if process.returncode != 0:
+            stderr = (await stderr_task).decode(errors='replace').strip()
+            raise ValueError(f"Graphviz render failed: {stderr}")
+
+    async def read_chunk(self, process, deadline: float) -> bytes:
+        timeout = deadline - time.monotonic()
+        try:
+            return await asyncio.wait_for(process.stdout.read(self.chunk_size), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Graphviz render timed out after {self.timeout} seconds")
+
+    async def stream_stdout(self, process, first_chunk, deadline, stdin_task, stderr_task) -> AsyncIterator[bytes]:    # failures after the headers were sent are raised, which aborts the (chunked) response
+        try:                                                                                                            # without its final chunk, so clients see an incomplete body (not a truncated 200)
+            if first_chunk:
+                yield first_chunk
+            while True:
+                chunk = await self.read_chunk(process, deadline)
+                if not chunk:
+                    break
+                yield chunk
+            await self.check_exit(process, stderr_task)
+        finally:
+            await self.stop_process(process, stdin_task, stderr_task)                # also runs when the client goes away mid-stream
+
+    async def feed_stdin(self, process, dot_bytes: bytes):
+        try:
+            for start in range(0, len(dot_bytes), self.chunk_size):
+                process.stdin.write(dot_bytes[start:start + self.chunk_size])
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):                             # renderer exited early (its stderr has the reason)
+            pass
+        finally:
+            if not process.stdin.is_closing():
+                process.stdin.close()
+
+    async def stop_process(self, process, *tasks):
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
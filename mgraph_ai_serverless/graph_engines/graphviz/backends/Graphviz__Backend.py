@@ -0,0 +1,14 @@
+from abc                             import ABC, abstractmethod
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Graphviz__Backend(Type_Safe, ABC):                                # base class for the engines that turn DOT source into bytes
+    name             : str
+    parallel_renders : bool = True                                      # False when renders are serialized (so batches use a single worker)
+
+    def is_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def render(self, dot_source: str, output_format: str, engine: str = 'dot', neato_no_op: int = None) -> bytes:    # neato_no_op=2 renders a graph that already has positions (i.e. neato -n2)
+        pass                                                            # raises ValueError when graphviz rejects the input (bad DOT, engine or format), any other error is a backend failure
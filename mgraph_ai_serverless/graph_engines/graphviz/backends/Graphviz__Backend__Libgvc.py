@@ -0,0 +1,70 @@
+import ctypes
+import ctypes.util
+import threading
+from osbot_utils.decorators.methods.cache_on_self                           import cache_on_self
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend import Graphviz__Backend
+
+
+class Graphviz__Backend__Libgvc(Graphviz__Backend):                     # renders in-process via libgvc, so the plugins are only loaded once per process
+    name             : str  = 'libgvc'
+    parallel_renders : bool = False                                     # every render takes the lock
+    lock             = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()                                    # libgvc is not thread safe
+
+    @cache_on_self
+    def libraries(self):                                                # returns (libgvc, libcgraph) or None when graphviz's shared libraries are not installed
+        path_gvc    = ctypes.util.find_library('gvc'   )
+        path_cgraph = ctypes.util.find_library('cgraph')
+        if not path_gvc or not path_cgraph:
+            return None
+        libgvc    = ctypes.CDLL(path_gvc   )
+        libcgraph = ctypes.CDLL(path_cgraph)
+
+        libgvc.gvContext       .restype  = ctypes.c_void_p
+        libgvc.gvLayout        .argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p]
+        libgvc.gvFreeLayout    .argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        libgvc.gvRenderData    .argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p,
+                                            ctypes.POINTER(ctypes.POINTER(ctypes.c_char)),
+                                            ctypes.POINTER(ctypes.c_size_t)]            # size_t in graphviz >= 2.46 (unsigned int before, which fits in the zeroed low bytes)
+        libgvc.gvFreeRenderData.argtypes = [ctypes.POINTER(ctypes.c_char)]
+        libcgraph.agmemread    .restype  = ctypes.c_void_p
+        libcgraph.agmemread    .argtypes = [ctypes.c_char_p]
+        libcgraph.agclose      .argtypes = [ctypes.c_void_p]
+        return libgvc, libcgraph
+
+    @cache_on_self
+    def gv_context(self):                                               # created once and reused for every render
+        libgvc, _ = self.libraries()
+        return libgvc.gvContext()
+
+    def is_available(self) -> bool:
+        return self.libraries() is not None
+
+    def render(self, dot_source: str, output_format: str, engine: str = 'dot', neato_no_op: int = None) -> bytes:
+        libgvc, libcgraph = self.libraries()
+        if neato_no_op:
+            engine = f'nop{int(neato_no_op)}'                                  # libgvc's name for neato -n1 / -n2
+        with self.lock:
+            gv_context = self.gv_context()
+            graph      = libcgraph.agmemread(dot_source.encode())
+            if not graph:
+                raise ValueError("Invalid DOT source")
+            try:
+                if libgvc.gvLayout(gv_context, graph, engine.encode()) != 0:
+                    raise ValueError(f"Graphviz layout failed for engine: {engine}")
+                try:
+                    result = ctypes.POINTER(ctypes.c_char)()
+                    length = ctypes.c_size_t(0)
+                    if libgvc.gvRenderData(gv_context, graph, output_format.encode(), ctypes.byref(result), ctypes.byref(length)) != 0:
+                        raise ValueError(f"Graphviz render failed for format: {output_format}")
+                    try:
+                        return ctypes.string_at(result, length.value)
+                    finally:
+                        libgvc.gvFreeRenderData(result)
+                finally:
+                    libgvc.gvFreeLayout(gv_context, graph)
+            finally:
+                libcgraph.agclose(graph)
@@ -0,0 +1,17 @@
+import graphviz
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend import Graphviz__Backend
+
+
+class Graphviz__Backend__Subprocess(Graphviz__Backend):                 # original path: forks and execs the graphviz binary on every render
+    name : str = 'subprocess'
+
+    def render(self, dot_source: str, output_format: str, engine: str = 'dot', neato_no_op: int = None) -> bytes:
+        if neato_no_op:
+            engine = 'neato'
+        dot = graphviz.Source(dot_source, engine=engine)
+        try:
+            return dot.pipe(format=output_format, neato_no_op=neato_no_op)
+        except graphviz.CalledProcessError as error:                   # graphviz exited with an error (i.e. a DOT syntax error), same error type as the libgvc backend
+            stderr = (error.stderr or b'')
+            stderr = stderr.decode(errors='replace') if isinstance(stderr, bytes) else stderr
+            raise ValueError(f"Graphviz render failed: {stderr.strip()}") from None
@@ -0,0 +1,9 @@
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Model__Graphviz__Dot__Stats(Type_Safe):
+    directed      : bool
+    node_count    : int
+    edge_count    : int
+    cluster_count : int
+    body_end      : int                                                     # position of the graph's closing '}'
@@ -15,3 +15,7 @@ digraph NodeAttributes {
 class Model__Graphviz__Render_Dot:
     dot_source     : str                            = GRAPHVIZ__DOT__SAMPLE_GRAPH_1
     output_format  : Model__Graphviz__Output_Format = Model__Graphviz__Output_Format.png
+    engine         : str                            = None                                  # layout engine (defaults to dot, large graphs are downgraded to a scalable engine)
+    max_ms         : int                            = None                                  # latency budget: layout quality is reduced to (roughly) fit in it
+    timeout        : float                          = None                                  # max seconds for the render (only used by render-dot-async, capped at MGRAPH__GRAPHVIZ__TIMEOUT)
+    reuse_layout   : bool                           = False                                 # layout once (cached by source hash) and only run the cheap neato -n2 render step per format (not supported by render-dot-async)
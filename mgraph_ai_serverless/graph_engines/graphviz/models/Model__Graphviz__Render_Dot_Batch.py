@@ -0,0 +1,9 @@
+from dataclasses                                                                    import dataclass, field
+from typing                                                                         import List
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot import Model__Graphviz__Render_Dot
+
+
+@dataclass
+class Model__Graphviz__Render_Dot_Batch:
+    items       : List[Model__Graphviz__Render_Dot] = field(default_factory=list)     # graphs to render (each with its own output format)
+    max_workers : int                               = None                            # threads used by this batch (defaults to, and is capped by, GRAPHVIZ__BATCH__MAX_WORKERS, which is shared by all batches)
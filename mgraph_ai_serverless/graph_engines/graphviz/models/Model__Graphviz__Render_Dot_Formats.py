@@ -0,0 +1,12 @@
+from dataclasses                                                                        import dataclass, field
+from typing                                                                             import List
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Output_Format  import Model__Graphviz__Output_Format
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot     import GRAPHVIZ__DOT__SAMPLE_GRAPH_1
+
+
+@dataclass
+class Model__Graphviz__Render_Dot_Formats:
+    dot_source     : str                                  = GRAPHVIZ__DOT__SAMPLE_GRAPH_1
+    output_formats : List[Model__Graphviz__Output_Format] = field(default_factory=lambda: list(Model__Graphviz__Output_Format))     # all formats are rendered from a single layout
+    engine         : str                                  = None                                                                    # layout engine (defaults to dot, large graphs are downgraded)
+    max_ms         : int                                  = None                                                                    # latency budget for the (single) layout
@@ -0,0 +1,11 @@
+from dataclasses                                                                        import dataclass
+from typing                                                                             import Dict, Any
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Output_Format  import Model__Graphviz__Output_Format
+
+
+@dataclass
+class Model__Graphviz__Render_MGraph:
+    graph_data     : Dict[str, Any]                 = None                                  # Serialized graph data (same format as the matplotlib render-graph route)
+    output_format  : Model__Graphviz__Output_Format = Model__Graphviz__Output_Format.png
+    engine         : str                            = None                                  # layout engine (defaults to dot, large graphs are downgraded to a scalable engine)
+    max_ms         : int                            = None                                  # latency budget: layout quality is reduced to (roughly) fit in it
@@ -0,0 +1,9 @@
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Dot__Stats import Model__Graphviz__Dot__Stats
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+
+
+class Model__Graphviz__Render_Plan(Type_Safe):
+    requested_engine : str
+    engine           : str                                                  # engine that will actually be used
+    graph_attrs      : dict                                                 # graph attributes injected into the DOT source (i.e. iteration caps)
+    stats            : Model__Graphviz__Dot__Stats
@@ -1,19 +1,109 @@
-from fastapi                                                                        import Response
-from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot import Model__Graphviz__Render_Dot
-from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                   import Graphviz__Render
-from osbot_fast_api.api.Fast_API_Routes                                             import Fast_API_Routes
+import time
+from fastapi                                                                                import Response, HTTPException, Request
+from starlette.responses                                                                    import StreamingResponse
+from starlette.status                                                                       import HTTP_400_BAD_REQUEST, HTTP_504_GATEWAY_TIMEOUT
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Output_Format      import Model__Graphviz__Output_Format
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot         import Model__Graphviz__Render_Dot
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot_Batch   import Model__Graphviz__Render_Dot_Batch
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot_Formats import Model__Graphviz__Render_Dot_Formats
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_MGraph      import Model__Graphviz__Render_MGraph
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                           import Graphviz__Render
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Async                    import Graphviz__Render__Async
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Stream                   import Graphviz__Render__Stream
+from osbot_fast_api.api.Fast_API_Routes                                                     import Fast_API_Routes
 
-ROUTES__GRAPHVIZ__RENDER = ['/render-dot']
+ROUTES__GRAPHVIZ__RENDER = ['/render-dot', '/render-dot-async', '/render-dot-batch', '/render-dot-formats', '/render-dot-stream', '/render-mgraph', '/cache-stats']
+
+HTTP_499_CLIENT_CLOSED_REQUEST = 499                                                            # nginx's non-standard status for requests abandoned by the client
 
 class Routes__Graphviz(Fast_API_Routes):
-    graphviz_render : Graphviz__Render
-    tag             : str = 'graphviz'
+    graphviz_render        : Graphviz__Render
+    graphviz_render_async  : Graphviz__Render__Async
+    graphviz_render_stream : Graphviz__Render__Stream
+    tag                    : str = 'graphviz'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.graphviz_render_async.cache           = self.graphviz_render.cache                # sync and async routes share the same render cache
+        self.graphviz_render_async.graphviz_render = self.graphviz_render                      # (and backend)
 
     def render_dot(self, graphviz_render_dot: Model__Graphviz__Render_Dot) -> Response:
-        bytes_data = self.graphviz_render.render_dot(graphviz_render_dot)
+        try:
+            render_plan = self.graphviz_render.render_plan(graphviz_render_dot)                 # cheap pre-parse: rejects malformed or oversized graphs before graphviz runs
+            start_time  = time.perf_counter()
+            bytes_data  = self.graphviz_render.render_dot(graphviz_render_dot, render_plan)     # (graphviz rejects what the pre-parse lets through with ValueError too)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST, detail = value_error.args[0])
         output_format = graphviz_render_dot.output_format
-        return Response(content=bytes_data, media_type=f"image/{output_format.value}")
+        headers       = self.render_headers(self.graphviz_render.planner, render_plan, start_time)
+        return Response(content=bytes_data, media_type=f"image/{output_format.value}", headers=headers)
+
+    async def render_dot_async(self, request: Request, graphviz_render_dot: Model__Graphviz__Render_Dot) -> Response:
+        try:
+            render_plan = await self.graphviz_render_async.render_plan_async(graphviz_render_dot)
+            start_time  = time.perf_counter()
+            bytes_data  = await self.graphviz_render_async.render_dot(graphviz_render_dot, is_disconnected=request.is_disconnected, render_plan=render_plan)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST          , detail = value_error.args[0])
+        except TimeoutError as timeout_error:
+            raise HTTPException(status_code = HTTP_504_GATEWAY_TIMEOUT      , detail = timeout_error.args[0])
+        except ConnectionAbortedError as aborted_error:
+            raise HTTPException(status_code = HTTP_499_CLIENT_CLOSED_REQUEST, detail = aborted_error.args[0])
+        output_format = graphviz_render_dot.output_format
+        headers       = self.render_headers(self.graphviz_render_async.planner, render_plan, start_time)
+        return Response(content=bytes_data, media_type=f"image/{output_format.value}", headers=headers)
+
+    def render_mgraph(self, graphviz_render_mgraph: Model__Graphviz__Render_MGraph) -> Response:  # MGraph graph_data rendered with graphviz's (C) layout engines
+        try:
+            render_config = self.graphviz_render.render_mgraph_config(graphviz_render_mgraph)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST, detail = value_error.args[0])
+        return self.render_dot(render_config)
+
+    def render_headers(self, planner, render_plan, start_time) -> dict:                          # the layout params used and how long they took (for latency metrics)
+        headers                         = planner.plan_headers(render_plan)
+        headers['X-Graphviz-Render-Ms'] = f'{(time.perf_counter() - start_time) * 1000:.1f}'
+        return headers
+
+    def render_dot_batch(self, graphviz_render_dot_batch: Model__Graphviz__Render_Dot_Batch) -> Response:
+        try:
+            zip_bytes = self.graphviz_render.render_dot_batch_zip(graphviz_render_dot_batch)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST,
+                                detail      = value_error.args[0] )
+        return Response(content    = zip_bytes        ,
+                        media_type = "application/zip",
+                        headers    = {"Content-Disposition": "attachment; filename=render-dot-batch.zip"})
+
+    def render_dot_formats(self, graphviz_render_dot_formats: Model__Graphviz__Render_Dot_Formats) -> Response:
+        try:
+            zip_bytes = self.graphviz_render.render_dot_formats_zip(graphviz_render_dot_formats)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST, detail = value_error.args[0])
+        return Response(content    = zip_bytes        ,
+                        media_type = "application/zip",
+                        headers    = {"Content-Disposition": "attachment; filename=render-dot-formats.zip"})
+
+    async def render_dot_stream(self, request: Request, output_format: Model__Graphviz__Output_Format = Model__Graphviz__Output_Format.png) -> StreamingResponse:
+        try:
+            dot_source    = await self.graphviz_render_stream.read_dot_source(request.stream())    # the request body is the raw DOT source
+            render_plan   = await self.graphviz_render_stream.render_plan_async(dot_source)        # same admission (and plan) as the other routes
+            output_stream = await self.graphviz_render_stream.render_stream(dot_source, output_format, render_plan=render_plan)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST    , detail = value_error.args[0])
+        except TimeoutError as timeout_error:
+            raise HTTPException(status_code = HTTP_504_GATEWAY_TIMEOUT, detail = timeout_error.args[0])
+        headers = self.graphviz_render_stream.planner.plan_headers(render_plan)
+        return StreamingResponse(output_stream, media_type=f"image/{output_format.value}", headers=headers)
 
+    def cache_stats(self):
+        return self.graphviz_render.cache_stats()
 
     def setup_routes(self):
-        self.add_route(self.render_dot, methods=['POST'])
\ No newline at end of file
+        self.add_route    (self.render_dot        , methods=['POST'])
+        self.add_route    (self.render_dot_async  , methods=['POST'])
+        self.add_route    (self.render_dot_batch  , methods=['POST'])
+        self.add_route    (self.render_dot_formats, methods=['POST'])
+        self.add_route    (self.render_dot_stream , methods=['POST'])
+        self.add_route    (self.render_mgraph     , methods=['POST'])
+        self.add_route_get(self.cache_stats       )
\ No newline at end of file
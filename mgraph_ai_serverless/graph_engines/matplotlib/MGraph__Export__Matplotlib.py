@@ -2,12 +2,51 @@ import matplotlib
 matplotlib.use('Agg')
 
 import networkx          as nx
-import matplotlib.pyplot as plt
-from typing                                                     import Dict, Any, Optional
-from mgraph_ai.mgraph.actions.exporters.MGraph__Export__Base    import MGraph__Export__Base
-from io                                                         import BytesIO
+import numpy             as np
+from matplotlib.collections                                                               import LineCollection
+from matplotlib.backends.backend_agg                                                      import FigureCanvasAgg
+from matplotlib.figure                                                                    import Figure
+from typing                                                                               import Dict, Any, Optional
+from osbot_utils.utils.Env                                                                import get_env
+from mgraph_ai.mgraph.actions.exporters.MGraph__Export__Base                              import MGraph__Export__Base
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Layouts                    import Matplotlib__Layouts
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Layout__Cache              import matplotlib__layout_cache
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Graph_Arrays import Model__Matplotlib__Graph_Arrays
+from io                                                                                   import BytesIO
+
+MATPLOTLIB__LAYOUTS         = { 'spring'   : nx.spring_layout    ,                          # Select layout algorithm
+                                'circular' : nx.circular_layout  ,
+                                'random'   : nx.random_layout    ,
+                                'shell'    : nx.shell_layout     ,
+                                'spectral' : nx.spectral_layout  }
+MATPLOTLIB__LAYOUTS__SEEDED = ('spring', 'random')                                             # layouts that use the seed
+MATPLOTLIB__LAYOUTS__NUMPY  = ('force_grid', 'multilevel', 'spectral_sparse')                  # scalable layouts (see Matplotlib__Layouts), these work on the int edge arrays
+
+MATPLOTLIB__MAX_PIXELS          = int(get_env('MGRAPH__MATPLOTLIB__MAX_PIXELS'         , 0  ))      # server wide pixel budget per image (0 means no limit), the dpi is lowered to fit it
+MATPLOTLIB__PREVIEW__DPI        = int(get_env('MGRAPH__MATPLOTLIB__PREVIEW__DPI'       , 50 ))      # preview mode: low dpi, no antialiasing, no tight bounding box (one less draw)
+MATPLOTLIB__PREVIEW__MAX_LABELS = int(get_env('MGRAPH__MATPLOTLIB__PREVIEW__MAX_LABELS', 100))      # preview mode: labels are skipped above this many nodes
+MATPLOTLIB__LAYOUT__DECIMALS    = 5                                                                 # positions in the layout json are rounded (they are in [-1, 1])
+
+MATPLOTLIB__DRAW__NODE_KWARGS  = { 'alpha'      : 'alpha'      ,                                    # nx.draw's style kwargs, mapped onto the artists that draw_graph_arrays uses
+                                   'node_shape' : 'marker'     ,                                    # (nodes: axes.scatter, edges: LineCollection, labels: axes.text)
+                                   'linewidths' : 'linewidths' ,
+                                   'edgecolors' : 'edgecolors' ,
+                                   'cmap'       : 'cmap'       ,
+                                   'vmin'       : 'vmin'       ,
+                                   'vmax'       : 'vmax'       }
+MATPLOTLIB__DRAW__EDGE_KWARGS  = { 'edge_color' : 'colors'     ,
+                                   'width'      : 'linewidths' ,
+                                   'style'      : 'linestyles' }
+MATPLOTLIB__DRAW__LABEL_KWARGS = { 'font_size'  : 'size'       ,
+                                   'font_color' : 'color'      ,
+                                   'font_weight': 'weight'     ,
+                                   'font_family': 'family'     }
 
 class MGraph__Export__Matplotlib(MGraph__Export__Base):
+    layouts      : Matplotlib__Layouts
+    layout_key   : str = None                                                                   # layout cache key of the last layout (so clients can seed the next render from it)
+    graph_arrays : Model__Matplotlib__Graph_Arrays = None                                       # when set (i.e. by Matplotlib__Graph_Data__Reader) it is used instead of walking the graph
+    layout_cache = matplotlib__layout_cache                                                     # shared by all exporters (and requests) in this process
 
     def create_node_data(self, node) -> Dict[str, Any]:
         return { 'id'    : str(node.node_id)                ,
@@ -52,43 +91,182 @@ class MGraph__Export__Matplotlib(MGraph__Export__Base):
                  node_color : str           = 'lightblue' ,
                  format     : str           = 'png'       ,
                  dpi        : int           = 300         ,
-                 **kwargs) -> Optional[str]:
-        G = self.to_networkx()
+                 seed       : int           = None        ,
+                 positions  : dict          = None        ,
+                 layout_key : str           = None        ,
+                 max_pixels : int           = None        ,
+                 preview    : bool          = False       ,
+                 **kwargs) -> Optional[str]:                                    # kwargs: nx.draw's style options that map onto our artists (see MATPLOTLIB__DRAW__*_KWARGS), others raise ValueError
+        graph_arrays    = self.to_arrays()
+        prior_positions = self.prior_positions(positions=positions, layout_key=layout_key)
+        positions       = self.layout_positions__arrays(graph_arrays, layout=layout, seed=seed, prior_positions=prior_positions)   # only computed once per graph structure (styling changes reuse it)
 
+        figure      = self.create_figure(figsize)                                 # one Figure per render (no pyplot global state, so renders can run concurrently)
+        axes        = figure.add_axes((0, 0, 1, 1))
+        with_labels = kwargs.pop('with_labels', True) and not (preview and len(graph_arrays.node_ids) > MATPLOTLIB__PREVIEW__MAX_LABELS)
+        self.draw_graph_arrays(axes, graph_arrays, positions, node_size=node_size, node_color=node_color,
+                               with_labels=with_labels, antialiased=not preview, **kwargs)
 
-        layouts = { 'spring'   : nx.spring_layout    ,                  # Select layout algorithm
-                    'circular' : nx.circular_layout  ,
-                    'random'   : nx.random_layout    ,
-                    'shell'    : nx.shell_layout     ,
-                    'spectral' : nx.spectral_layout  }
-        layout_func = layouts.get(layout, nx.spring_layout)
-        pos = layout_func(G)
+        dpi   = self.render_dpi(figsize, dpi=dpi, max_pixels=max_pixels, preview=preview)
+        tight = not (preview or self.pixel_budget(max_pixels))                   # without the tight bounding box the image is exactly figsize * dpi (so it fits the budget)
+        return self.figure_to_bytes(figure, format=format, dpi=dpi, tight=tight)
 
-        plt.figure(figsize=figsize)                                     # Create figure
+    def pixel_budget(self, max_pixels: int = None) -> Optional[int]:              # the request's budget, capped by the server wide one
+        budgets = [budget for budget in (max_pixels, MATPLOTLIB__MAX_PIXELS) if budget]
+        return min(budgets) if budgets else None
 
-        # Draw the graph
-        nx.draw(G,
-                pos         = pos       ,
-                with_labels = True      ,
-                node_color  = node_color,
-                node_size   = node_size ,
-                labels      = {node: G.nodes[node]['label'] for node in G.nodes()},
-                **kwargs)
+    def render_dpi(self, figsize: tuple, dpi: int, max_pixels: int = None, preview: bool = False) -> int:     # the (pixel) size of the image is figsize * dpi
+        if preview:
+            dpi = min(dpi, MATPLOTLIB__PREVIEW__DPI)
+        pixel_budget = self.pixel_budget(max_pixels)
+        if pixel_budget:
+            width, height = figsize
+            max_dpi       = int((pixel_budget / max(width * height, 1e-9)) ** 0.5)
+            dpi           = min(dpi, max_dpi)
+        return max(dpi, 1)
 
+    def to_layout(self, layout: str = 'spring', seed: int = None, positions: dict = None, layout_key: str = None, encoding: str = 'objects') -> Dict[str, Any]:
+        graph_arrays    = self.to_arrays()
+        prior_positions = self.prior_positions(positions=positions, layout_key=layout_key)
+        coords          = self.layout_positions__arrays(graph_arrays, layout=layout, seed=seed, prior_positions=prior_positions)     # same cache as to_image
+        coords          = np.round(coords, MATPLOTLIB__LAYOUT__DECIMALS)
+        layout_data     = dict(layout=layout, layout_key=self.layout_key)
+        if getattr(encoding, 'value', encoding) == 'flat':                        # parallel arrays (the smallest json, and the fastest to load into typed arrays)
+            layout_data.update(node_ids  = graph_arrays.node_ids         ,
+                               labels    = graph_arrays.labels           ,
+                               positions = coords.ravel().tolist()       ,
+                               edges     = graph_arrays.edges.ravel().tolist())
+        else:
+            node_ids = graph_arrays.node_ids
+            layout_data.update(nodes = [dict(id=node_id, label=label, x=x, y=y) for node_id, label, (x, y) in zip(node_ids, graph_arrays.labels, coords.tolist())],
+                               edges = [dict(source=node_ids[from_index], target=node_ids[to_index]) for from_index, to_index in graph_arrays.edges.tolist()])
+        return layout_data
 
-        buffer = BytesIO()                                                          # Save to bytes buffer
-        plt.savefig(buffer, format=format, dpi=dpi, bbox_inches='tight')
-        plt.close()
+    def to_arrays(self) -> Model__Matplotlib__Graph_Arrays:                     # one pass over nodes and edges, no per node/edge dicts
+        if self.graph_arrays is not None:
+            return self.graph_arrays
+        node_ids   = []
+        labels     = []
+        node_index = {}
+        for node in self.graph.nodes():
+            node_id             = str(node.node_id)
+            node_index[node_id] = len(node_ids)
+            node_ids.append(node_id)
+            labels  .append(self.get_node_label(node))
+        edge_indexes = []
+        for edge in self.graph.edges():
+            from_index = node_index.get(str(edge.from_node_id()))
+            to_index   = node_index.get(str(edge.to_node_id  ()))
+            if from_index is not None and to_index is not None:                 # skip edges to nodes that are not in the graph
+                edge_indexes.append(from_index)
+                edge_indexes.append(to_index  )
+        edges = np.array(edge_indexes, dtype=np.int32).reshape(-1, 2)
+        return Model__Matplotlib__Graph_Arrays(node_ids=node_ids, labels=labels, edges=edges)
+
+    def draw_graph_arrays(self, axes, graph_arrays: Model__Matplotlib__Graph_Arrays, positions: np.ndarray,
+                                node_size: int = 1000, node_color: str = 'lightblue', with_labels: bool = True, antialiased: bool = True, **kwargs):
+        node_kwargs, edge_kwargs, label_kwargs = self.draw_kwargs(kwargs)
+        if len(graph_arrays.edges):                                               # all edges in a single artist (same style as nx.draw_networkx)
+            segments = positions[graph_arrays.edges]                              # (edge_count, 2, 2) start/end points
+            edge_kwargs = dict(dict(colors='k', linewidths=1.0), **edge_kwargs)
+            axes.add_collection(LineCollection(segments, zorder=1, antialiaseds=antialiased, **edge_kwargs))
+        axes.scatter(positions[:, 0], positions[:, 1], s=node_size, c=node_color, zorder=2, antialiased=antialiased, **node_kwargs)     # all nodes in a single artist
+        if with_labels:
+            label_kwargs = dict(dict(size=12), **label_kwargs)
+            for (x, y), label in zip(positions.tolist(), graph_arrays.labels):
+                axes.text(x, y, label, horizontalalignment='center', verticalalignment='center', clip_on=True, antialiased=antialiased, **label_kwargs)
+        axes.autoscale_view()
+        axes.set_axis_off()
+
+    def draw_kwargs(self, kwargs: dict) -> tuple:                                 # splits nx.draw style kwargs into the node, edge and label artists' kwargs
+        unsupported = sorted(set(kwargs) - set(MATPLOTLIB__DRAW__NODE_KWARGS) - set(MATPLOTLIB__DRAW__EDGE_KWARGS) - set(MATPLOTLIB__DRAW__LABEL_KWARGS))
+        if unsupported:
+            supported = sorted([*MATPLOTLIB__DRAW__NODE_KWARGS, *MATPLOTLIB__DRAW__EDGE_KWARGS, *MATPLOTLIB__DRAW__LABEL_KWARGS, 'with_labels'])
+            raise ValueError(f"Unsupported draw options: {unsupported} (supported: {supported})")
+        return tuple({artist_name: kwargs[name] for name, artist_name in kwargs_map.items() if name in kwargs}
+                     for kwargs_map in (MATPLOTLIB__DRAW__NODE_KWARGS, MATPLOTLIB__DRAW__EDGE_KWARGS, MATPLOTLIB__DRAW__LABEL_KWARGS))
+
+    def layout_positions(self, G: nx.Graph, layout: str = 'spring', seed: int = None) -> Dict[str, tuple]:
+        return self.cached_layout(G.nodes(), G.edges(), layout=layout, seed=seed, graph=G)
 
-        buffer.seek(0)
-        return buffer.getvalue()                                                    # return bytes
+    def layout_positions__arrays(self, graph_arrays: Model__Matplotlib__Graph_Arrays, layout: str = 'spring', seed: int = None, prior_positions: dict = None) -> np.ndarray:
+        node_ids   = graph_arrays.node_ids
+        edge_pairs = [(node_ids[from_index], node_ids[to_index]) for from_index, to_index in graph_arrays.edges.tolist()]
+        positions  = self.cached_layout(node_ids, edge_pairs, layout=layout, seed=seed, edges=graph_arrays.edges, prior_positions=prior_positions)
+        return np.array([positions[node_id] for node_id in node_ids], dtype=float).reshape(-1, 2)
+
+    def prior_positions(self, positions: dict = None, layout_key: str = None) -> Optional[dict]:     # positions to seed the layout from (explicit positions win over the cached ones)
+        prior_positions = {}
+        if layout_key:
+            prior_positions.update(self.layout_cache.get(layout_key) or {})                    # an evicted (or unknown) key just means a fresh layout
+        if positions:
+            prior_positions.update({str(node_id): (float(x), float(y)) for node_id, (x, y) in positions.items()})
+        return prior_positions or None
+
+    def cached_layout(self, node_ids, edge_pairs, layout: str = 'spring', seed: int = None, graph: nx.Graph = None, edges: np.ndarray = None,
+                            prior_positions: dict = None) -> Dict[str, tuple]:
+        if layout not in MATPLOTLIB__LAYOUTS and layout not in MATPLOTLIB__LAYOUTS__NUMPY:
+            layout = 'spring'
+        seeded_from = self.layout_cache.positions_key(prior_positions) if prior_positions else None
+        cache_key   = self.layout_cache.cache_key(node_ids, edge_pairs, layout=layout, seed=seed, seeded_from=seeded_from)     # same key for the networkx and the arrays paths
+        positions   = self.layout_cache.get(cache_key)
+        if positions is None:
+            if prior_positions:
+                positions = self.incremental_layout(list(node_ids), edge_pairs, layout=layout, seed=seed, edges=edges, prior_positions=prior_positions)
+            elif layout in MATPLOTLIB__LAYOUTS__NUMPY:
+                positions = self.numpy_layout(list(node_ids), edge_pairs, layout=layout, seed=seed, edges=edges)
+            else:
+                positions = self.networkx_layout(node_ids, edge_pairs, layout=layout, seed=seed, graph=graph)
+            self.layout_cache.set(cache_key, positions)
+        self.layout_key = cache_key
+        return positions
+
+    def incremental_layout(self, node_ids: list, edge_pairs, layout: str, prior_positions: dict, seed: int = None, edges: np.ndarray = None) -> Dict[str, tuple]:
+        initial = np.array([prior_positions.get(node_id, (np.nan, np.nan)) for node_id in node_ids], dtype=float).reshape(-1, 2)
+        if np.isnan(initial).all():                                               # no nodes in common with the prior
+            if layout in MATPLOTLIB__LAYOUTS__NUMPY:
+                return self.numpy_layout(node_ids, edge_pairs, layout=layout, seed=seed, edges=edges)
+            return self.networkx_layout(node_ids, edge_pairs, layout=layout, seed=seed)
+        if edges is None:
+            edges = self.edges_array(node_ids, edge_pairs)
+        coords = self.layouts.incremental(edges, initial, seed=seed)
+        return {node_id: (x, y) for node_id, (x, y) in zip(node_ids, coords.tolist())}
+
+    def networkx_layout(self, node_ids, edge_pairs, layout: str, seed: int = None, graph: nx.Graph = None) -> Dict[str, tuple]:
+        if graph is None:
+            graph = nx.Graph()                                                    # bare graph (no attribute dicts), only used by the layout
+            graph.add_nodes_from(node_ids  )
+            graph.add_edges_from(edge_pairs)
+        layout_kwargs = dict(seed=seed) if layout in MATPLOTLIB__LAYOUTS__SEEDED else {}
+        positions     = MATPLOTLIB__LAYOUTS[layout](graph, **layout_kwargs)
+        return {node: (float(coords[0]), float(coords[1])) for node, coords in positions.items()}
+
+    def numpy_layout(self, node_ids: list, edge_pairs, layout: str, seed: int = None, edges: np.ndarray = None) -> Dict[str, tuple]:
+        if edges is None:                                                         # called from the networkx path
+            edges = self.edges_array(node_ids, edge_pairs)
+        coords = self.layouts.layout(layout, len(node_ids), edges, seed=seed)
+        return {node_id: (x, y) for node_id, (x, y) in zip(node_ids, coords.tolist())}
+
+    def edges_array(self, node_ids: list, edge_pairs) -> np.ndarray:
+        node_index = {node_id: index for index, node_id in enumerate(node_ids)}
+        return np.array([(node_index[source], node_index[target]) for source, target in edge_pairs], dtype=np.int64).reshape(-1, 2)
+
+    def create_figure(self, figsize: tuple) -> Figure:
+        figure = Figure(figsize=figsize, facecolor='w')
+        FigureCanvasAgg(figure)                                                   # attaches the canvas to the figure
+        return figure
+
+    def figure_to_bytes(self, figure: Figure, format: str, dpi: int, tight: bool = True) -> bytes:
+        buffer = BytesIO()                                                          # Save to bytes buffer
+        figure.savefig(buffer, format=format, dpi=dpi, bbox_inches='tight' if tight else None)     # a tight bounding box needs an extra draw (to measure the artists)
+        return buffer.getvalue()                                                    # return bytes (the figure is garbage collected, there is no pyplot registry to close it from)
 
     def format_output(self) -> Dict[str, Any]:                  # Format the processed data including positions for visualization
 
         base_output = super().format_output()                   # Get base output from parent class
 
         G = self.to_networkx()                                  # Calculate positions using NetworkX
-        pos = nx.spring_layout(G)                               # Calculate positions
+        pos = self.layout_positions(G, layout='spring')         # Calculate positions (or reuse the cached ones)
 
 
         pos_dict = {str(node): { 'x': float(coords[0]),         # Convert positions to serializable format
@@ -0,0 +1,74 @@
+import numpy as np
+from osbot_utils.type_safe.Type_Safe                                                      import Type_Safe
+from osbot_utils.utils.Env                                                                import get_env
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Graph_Arrays import Model__Matplotlib__Graph_Arrays
+from mgraph_ai_serverless.graph_engines.Graph_Engines__Domain_Types                       import GRAPH_ENGINES__DOMAIN_TYPES
+
+MATPLOTLIB__FAST_PARSE  = get_env('MGRAPH__MATPLOTLIB__FAST_PARSE', 'true').lower() == 'true'       # read graph_data straight into arrays (false: rebuild the full domain graph with from_json)
+GRAPH_DATA__NODE_LABELS = ('label', 'name', 'value')                                                # same order as MGraph__Export__Matplotlib.get_node_label
+
+GRAPH_DATA__READERS     = { graph_type: 'read__mgraph_schema' for graph_type in GRAPH_ENGINES__DOMAIN_TYPES }     # all current providers serialize with the base MGraph schema
+
+
+class Matplotlib__Graph_Data__Reader(Type_Safe):                            # validated reader for graph_data: extracts only what rendering needs (ids, labels and edge endpoints)
+
+    def read(self, graph_data: dict) -> Model__Matplotlib__Graph_Arrays:
+        if not graph_data:
+            raise ValueError("No graph provided for rendering")
+        if not isinstance(graph_data, dict):
+            raise ValueError("Invalid graph data: expected a json object")
+        graph_type  = graph_data.get('graph_type')
+        reader_name = GRAPH_DATA__READERS.get(graph_type)
+        if not reader_name:
+            raise ValueError(f"Unsupported domain type: {graph_type}")
+        return getattr(self, reader_name)(graph_data)
+
+    def read__mgraph_schema(self, graph_data: dict) -> Model__Matplotlib__Graph_Arrays:           # {'model': {'data': {'nodes': {id: {...}}, 'edges': {id: {...}}}}}
+        data  = self.dict_value(self.dict_value(graph_data, 'model', 'graph_data'), 'data', 'graph_data.model')
+        nodes = self.dict_value(data, 'nodes', 'graph_data.model.data')
+        edges = self.dict_value(data, 'edges', 'graph_data.model.data')
+
+        node_ids   = []
+        labels     = []
+        node_index = {}
+        for node in nodes.values():
+            if not isinstance(node, dict):
+                raise ValueError("Invalid graph data: nodes must be json objects")
+            node_id   = node.get('node_id'  )
+            node_type = node.get('node_type')
+            node_data = node.get('node_data') or {}
+            if not isinstance(node_id, str) or not isinstance(node_type, str) or not isinstance(node_data, dict):      # (in-process graph_data has str subclasses, i.e. Obj_Id)
+                raise ValueError(f"Invalid graph data: node {node_id!r} needs a string node_id and node_type, and an object node_data")
+            node_id             = str(node_id)
+            node_index[node_id] = len(node_ids)
+            node_ids.append(node_id)
+            labels  .append(self.node_label(node_data, node_type))
+
+        edge_indexes = []
+        for edge in edges.values():
+            if not isinstance(edge, dict):
+                raise ValueError("Invalid graph data: edges must be json objects")
+            from_node_id = edge.get('from_node_id')
+            to_node_id   = edge.get('to_node_id'  )
+            if not isinstance(from_node_id, str) or not isinstance(to_node_id, str):
+                raise ValueError(f"Invalid graph data: edge {from_node_id!r} -> {to_node_id!r} needs string from_node_id and to_node_id")
+            from_index = node_index.get(from_node_id)
+            to_index   = node_index.get(to_node_id  )
+            if from_index is not None and to_index is not None:                 # skip edges to nodes that are not in the graph (same as MGraph__Export__Matplotlib.to_arrays)
+                edge_indexes.append(from_index)
+                edge_indexes.append(to_index  )
+        edges_array = np.array(edge_indexes, dtype=np.int32).reshape(-1, 2)
+        return Model__Matplotlib__Graph_Arrays(node_ids=node_ids, labels=labels, edges=edges_array)
+
+    def node_label(self, node_data: dict, node_type: str) -> str:
+        for attr in GRAPH_DATA__NODE_LABELS:
+            node_label = node_data.get(attr)
+            if node_label:
+                return str(node_label)
+        return node_type.rsplit('.', 1)[-1]                                     # the schema's class name
+
+    def dict_value(self, data: dict, key: str, path: str) -> dict:
+        value = data.get(key)
+        if not isinstance(value, dict):
+            raise ValueError(f"Invalid graph data: {path}.{key} must be a json object")
+        return value
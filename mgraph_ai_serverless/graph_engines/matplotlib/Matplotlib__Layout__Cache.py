@@ -0,0 +1,89 @@
+import hashlib
+import threading
+from collections                     import OrderedDict
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+from osbot_utils.utils.Env           import get_env
+
+MATPLOTLIB__LAYOUT_CACHE__MAX_ITEMS     = int(get_env('MGRAPH__MATPLOTLIB__LAYOUT_CACHE__MAX_ITEMS'    , 128      ))     # max number of layouts kept
+MATPLOTLIB__LAYOUT_CACHE__MAX_POSITIONS = int(get_env('MGRAPH__MATPLOTLIB__LAYOUT_CACHE__MAX_POSITIONS', 1_000_000))     # max number of node positions kept (across all layouts)
+MATPLOTLIB__LAYOUT_CACHE__EVICTION      =     get_env('MGRAPH__MATPLOTLIB__LAYOUT_CACHE__EVICTION'     , 'lru'    )      # 'lru' or 'fifo'
+
+MATPLOTLIB__LAYOUT_CACHE__EVICTIONS = ('lru', 'fifo')
+
+
+class Matplotlib__Layout__Cache(Type_Safe):                                 # node positions by graph structure, so restyled re-renders skip the layout step
+    max_items     : int = MATPLOTLIB__LAYOUT_CACHE__MAX_ITEMS
+    max_positions : int = MATPLOTLIB__LAYOUT_CACHE__MAX_POSITIONS
+    eviction      : str = MATPLOTLIB__LAYOUT_CACHE__EVICTION
+    items         : OrderedDict                                             # cache_key -> {node_id: (x, y)}
+    positions     : int
+    hits          : int
+    misses        : int
+    evictions     : int
+    lock          = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.eviction not in MATPLOTLIB__LAYOUT_CACHE__EVICTIONS:
+            raise ValueError(f"Unsupported layout cache eviction policy: {self.eviction}")
+        self.lock = threading.RLock()
+
+    def cache_key(self, node_ids, edges, layout: str, seed: int = None, seeded_from: str = None) -> str:     # canonical hash: independent of the order nodes and edges were added in
+        hasher = hashlib.sha256(f'{layout}\n{seed}\n'.encode())
+        if seeded_from:                                                     # incremental layouts depend on the positions they started from
+            hasher.update(f's {seeded_from}\n'.encode())
+        for node_id in sorted(map(str, node_ids)):
+            hasher.update(f'n {node_id}\n'.encode())
+        for source, target in sorted({tuple(sorted((str(source), str(target)))) for source, target in edges}):  # the layouts are undirected (and ignore duplicate edges)
+            hasher.update(f'e {source} {target}\n'.encode())
+        return hasher.hexdigest()
+
+    def positions_key(self, positions: dict) -> str:                       # hash of a set of node positions (i.e. the prior of an incremental layout)
+        hasher = hashlib.sha256()
+        for node_id, (x, y) in sorted((str(node_id), position) for node_id, position in positions.items()):
+            hasher.update(f'{node_id} {float(x)!r} {float(y)!r}\n'.encode())
+        return hasher.hexdigest()
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.positions = 0
+
+    def get(self, cache_key: str):
+        with self.lock:
+            positions = self.items.get(cache_key)
+            if positions is None:
+                self.misses += 1
+                return None
+            if self.eviction == 'lru':
+                self.items.move_to_end(cache_key)
+            self.hits += 1
+            return positions
+
+    def set(self, cache_key: str, positions: dict):
+        with self.lock:
+            if len(positions) > self.max_positions:                         # never let a single layout flush the whole cache
+                return positions
+            if cache_key in self.items:
+                self.positions -= len(self.items.pop(cache_key))
+            self.items[cache_key]  = positions
+            self.positions        += len(positions)
+            while len(self.items) > self.max_items or self.positions > self.max_positions:
+                _, evicted      = self.items.popitem(last=False)            # oldest (fifo) or least recently used (lru)
+                self.positions -= len(evicted)
+                self.evictions += 1
+        return positions
+
+    def stats(self):
+        with self.lock:
+            return dict(hits          = self.hits          ,
+                        misses        = self.misses        ,
+                        evictions     = self.evictions     ,
+                        items         = len(self.items)    ,
+                        positions     = self.positions     ,
+                        max_items     = self.max_items     ,
+                        max_positions = self.max_positions ,
+                        eviction      = self.eviction      )
+
+
+matplotlib__layout_cache = Matplotlib__Layout__Cache()                      # process wide, so it survives across warm Lambda invocations
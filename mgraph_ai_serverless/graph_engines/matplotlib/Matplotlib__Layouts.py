@@ -0,0 +1,213 @@
+import numpy as np
+from functools                       import lru_cache
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+LAYOUT__FORCE_GRID__ITERATIONS        = 50                                      # force directed iterations (per level, for the multilevel layout)
+LAYOUT__FORCE_GRID__CELLS             = 64                                      # the repulsive forces are computed on a CELLS x CELLS grid
+LAYOUT__MULTILEVEL__COARSEST_SIZE     = 64                                      # stop coarsening when the graph is this small
+LAYOUT__MULTILEVEL__MIN_REDUCTION     = 0.05                                    # ... or when a level removes less than 5% of the nodes
+LAYOUT__MULTILEVEL__REFINE_ITERATIONS = 20
+LAYOUT__SPECTRAL__ITERATIONS          = 200                                     # subspace iterations of the sparse eigensolver
+LAYOUT__SPECTRAL__QR_EVERY            = 5                                       # the block is only re-orthonormalised every few iterations (columns are normalised in between)
+LAYOUT__SPECTRAL__BLOCK_SIZE          = 6                                       # eigenvectors iterated together (more than the 2 needed, converges faster)
+LAYOUT__INCREMENTAL__ITERATIONS       = 15                                      # refinement iterations after the new nodes are placed
+LAYOUT__INCREMENTAL__TEMPERATURE      = 0.02                                    # max step (in a unit square) of the refinement
+LAYOUT__INCREMENTAL__MOBILITY         = 0.1                                     # how far the already placed nodes can move, relative to the new ones
+LAYOUT__INCREMENTAL__PLACEMENT_ROUNDS = 10                                      # new nodes that are up to this many hops away from a placed node are put next to their neighbours
+
+
+@lru_cache(maxsize=8)
+def force_kernel_fft(cells: int):                                           # FFT of the repulsive force kernel (x/d^2, y/d^2) for a unit cell size (it scales with 1/cell_size)
+    offsets   = np.arange(-(cells - 1), cells, dtype=float)
+    dx, dy    = np.meshgrid(offsets, offsets, indexing='ij')
+    distance2 = dx * dx + dy * dy
+    distance2[cells - 1, cells - 1] = np.inf                                # no self force
+    size      = 3 * cells - 2                                               # zero padded, so the FFT convolution doesn't wrap around
+    return np.fft.rfft2(dx / distance2, s=(size, size)), np.fft.rfft2(dy / distance2, s=(size, size))
+
+
+class Matplotlib__Layouts(Type_Safe):                                       # NumPy layouts that scale to 100k+ nodes (work on int edge arrays, no networkx graph)
+
+    def layout(self, layout: str, node_count: int, edges: np.ndarray, seed: int = None) -> np.ndarray:
+        layout_method = getattr(self, f'layout__{layout}', None)
+        if layout_method is None:
+            raise ValueError(f"Unsupported layout: {layout}")
+        if node_count == 0:
+            return np.zeros((0, 2))
+        edges = self.simple_edges(edges)
+        return self.rescale(layout_method(node_count, edges, np.random.default_rng(seed)))
+
+    def layout__force_grid(self, node_count: int, edges: np.ndarray, rng, positions: np.ndarray = None,
+                                 iterations: int = LAYOUT__FORCE_GRID__ITERATIONS, temperature: float = 0.1, mobility: np.ndarray = None) -> np.ndarray:
+        # Fruchterman-Reingold, with the O(n^2) repulsion replaced by a particle-mesh approximation:
+        # node masses are binned on a grid and convolved (via FFT) with the 1/d force kernel, so each iteration is O(n + e + cells^2 log cells)
+        if positions is None:
+            positions = rng.random((node_count, 2))
+        positions = positions.astype(float, copy=True)
+        k         = 1 / np.sqrt(node_count)                                 # ideal edge length in a unit square
+        for iteration in range(iterations):
+            displacement  = self.repulsion__grid(positions, k)
+            displacement += self.attraction(positions, edges, k)
+            length        = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 1e-9)
+            step          = temperature * (1 - iteration / iterations)      # linear cooling
+            limit         = np.minimum(length, step)
+            if mobility is not None:                                        # per node max step multiplier
+                limit    *= mobility
+            positions    += displacement / length[:, None] * limit[:, None]
+        return positions
+
+    def incremental(self, edges: np.ndarray, initial: np.ndarray, seed: int = None,
+                          iterations: int = LAYOUT__INCREMENTAL__ITERATIONS) -> np.ndarray:
+        # initial has the prior positions, with NaN rows for the new nodes: these are placed at the centroid of their placed
+        # neighbours, then a short, cool refinement (where the placed nodes barely move) settles them, in the prior's coordinates
+        rng        = np.random.default_rng(seed)
+        edges      = self.simple_edges(edges)
+        placed     = ~np.isnan(initial).any(axis=1)
+        positions  = np.where(placed[:, None], initial, 0.0)
+        known      = placed.copy()
+        minimum    = positions[known].min(axis=0)
+        extent     = max(float((positions[known].max(axis=0) - minimum).max()), 1e-9)
+        positions  = self.place_new_nodes(positions, placed, edges)
+        unplaced   = ~placed                                                # not connected to any placed node
+        positions[unplaced] = minimum + rng.random((int(unplaced.sum()), 2)) * extent
+        new_nodes  = ~known
+        spread     = 0.5 * extent / np.sqrt(len(positions))
+        positions[new_nodes] += rng.normal(scale=spread, size=(int(new_nodes.sum()), 2))     # so new nodes with the same neighbours don't overlap
+
+        unit       = (positions - minimum) / extent                         # the force layout works in a unit square
+        mobility   = np.where(known, LAYOUT__INCREMENTAL__MOBILITY, 1.0)
+        unit       = self.layout__force_grid(len(unit), edges, rng, positions=unit, iterations=iterations,
+                                             temperature=LAYOUT__INCREMENTAL__TEMPERATURE, mobility=mobility)
+        return unit * extent + minimum
+
+    def place_new_nodes(self, positions: np.ndarray, placed: np.ndarray, edges: np.ndarray) -> np.ndarray:      # updates placed (in place)
+        if len(edges) == 0:
+            return positions
+        source = np.concatenate([edges[:, 0], edges[:, 1]])
+        target = np.concatenate([edges[:, 1], edges[:, 0]])
+        for _ in range(LAYOUT__INCREMENTAL__PLACEMENT_ROUNDS):              # each round places the new nodes that are one hop further away
+            links  = placed[target] & ~placed[source]
+            if not links.any():
+                break
+            counts = np.bincount(source[links], minlength=len(positions))
+            newly  = counts > 0
+            for axis in (0, 1):
+                totals                  = np.bincount(source[links], weights=positions[target[links], axis], minlength=len(positions))
+                positions[newly, axis]  = totals[newly] / counts[newly]
+            placed |= newly
+        return positions
+
+    def layout__multilevel(self, node_count: int, edges: np.ndarray, rng) -> np.ndarray:
+        levels = [(node_count, edges, None)]                                # (node_count, edges, parent of each node in the next (coarser) level)
+        while levels[-1][0] > LAYOUT__MULTILEVEL__COARSEST_SIZE:
+            level_count, level_edges, _ = levels[-1]
+            parents, coarse_count       = self.coarsen(level_count, level_edges, rng)
+            if coarse_count > level_count * (1 - LAYOUT__MULTILEVEL__MIN_REDUCTION):
+                break
+            levels[-1]   = (level_count, level_edges, parents)
+            coarse_edges = self.simple_edges(parents[level_edges])
+            levels.append((coarse_count, coarse_edges, None))
+
+        coarse_count, coarse_edges, _ = levels.pop()
+        positions = self.layout__force_grid(coarse_count, coarse_edges, rng, iterations=LAYOUT__FORCE_GRID__ITERATIONS * 2)
+        while levels:                                                       # prolongation: each node starts at its parent's position, then a short (cooler) refinement
+            level_count, level_edges, parents = levels.pop()
+            spread    = 0.5 / np.sqrt(level_count)
+            positions = positions[parents] + rng.normal(scale=spread, size=(level_count, 2))
+            positions = self.layout__force_grid(level_count, level_edges, rng, positions=positions,
+                                                iterations=LAYOUT__MULTILEVEL__REFINE_ITERATIONS, temperature=spread * 4)
+        return positions
+
+    def layout__spectral_sparse(self, node_count: int, edges: np.ndarray, rng) -> np.ndarray:
+        # 2nd and 3rd eigenvectors of the normalized adjacency, via subspace iteration with sparse (edge list) mat-vecs
+        degree       = np.bincount(edges.ravel(), minlength=node_count).astype(float) if len(edges) else np.zeros(node_count)
+        inv_sqrt_deg = 1 / np.sqrt(np.maximum(degree, 1))
+        trivial      = np.sqrt(degree)                                      # eigenvector of the largest eigenvalue (deflated)
+        trivial     /= max(np.linalg.norm(trivial), 1e-12)
+        block_size   = min(LAYOUT__SPECTRAL__BLOCK_SIZE, max(node_count - 1, 1))
+        vectors      = rng.normal(size=(node_count, block_size))
+        adjacency    = (np.concatenate([edges[:, 0], edges[:, 1]]), np.concatenate([edges[:, 1], edges[:, 0]]))    # both directions, so each mat-vec is a single bincount per column
+        for iteration in range(LAYOUT__SPECTRAL__ITERATIONS):
+            vectors  = self.normalized_adjacency__matmul(vectors, adjacency, inv_sqrt_deg) + vectors      # (A_norm + I) is positive semi-definite, so the largest eigenvalues dominate
+            vectors -= np.outer(trivial, trivial @ vectors)
+            if iteration % LAYOUT__SPECTRAL__QR_EVERY == 0:
+                vectors, _ = np.linalg.qr(vectors)                          # re-orthonormalise the block
+            else:
+                vectors /= np.linalg.norm(vectors, axis=0)
+        vectors, _ = np.linalg.qr(vectors)
+        projected              = vectors.T @ (self.normalized_adjacency__matmul(vectors, adjacency, inv_sqrt_deg) + vectors)   # Rayleigh-Ritz, to order the vectors by eigenvalue
+        eigenvalues, rotation  = np.linalg.eigh(projected)
+        eigenvectors           = vectors @ rotation[:, ::-1]
+        positions              = eigenvectors[:, :2] * inv_sqrt_deg[:, None]
+        if positions.shape[1] < 2:
+            positions = np.column_stack([positions, np.zeros(node_count)])
+        return positions
+
+    def normalized_adjacency__matmul(self, vectors: np.ndarray, adjacency: tuple, inv_sqrt_deg: np.ndarray) -> np.ndarray:    # D^-1/2 A D^-1/2 @ vectors
+        source, target = adjacency
+        scaled         = (vectors * inv_sqrt_deg[:, None]).T.copy()        # one contiguous row per vector, for fast gathers
+        result         = np.empty_like(scaled)
+        for row in range(len(scaled)):                                      # bincount is much faster than np.add.at
+            result[row] = np.bincount(source, weights=scaled[row][target], minlength=len(vectors))
+        return result.T * inv_sqrt_deg[:, None]
+
+    def repulsion__grid(self, positions: np.ndarray, k: float, cells: int = LAYOUT__FORCE_GRID__CELLS) -> np.ndarray:
+        minimum   = positions.min(axis=0)
+        extent    = max(float((positions.max(axis=0) - minimum).max()), 1e-9)
+        cell_size = extent / (cells - 1)
+        cell      = np.rint((positions - minimum) / cell_size).astype(np.int64)
+        density   = np.bincount(cell[:, 0] * cells + cell[:, 1], minlength=cells * cells).reshape(cells, cells).astype(float)
+
+        kernel_fft_x, kernel_fft_y = force_kernel_fft(cells)
+        size           = 3 * cells - 2
+        density_fft    = np.fft.rfft2(density, s=(size, size))
+        field_x        = np.fft.irfft2(density_fft * kernel_fft_x, s=(size, size)) / cell_size
+        field_y        = np.fft.irfft2(density_fft * kernel_fft_y, s=(size, size)) / cell_size
+        sample_x       = cell[:, 0] + cells - 1
+        sample_y       = cell[:, 1] + cells - 1
+        return k * k * np.column_stack([field_x[sample_x, sample_y], field_y[sample_x, sample_y]])
+
+    def attraction(self, positions: np.ndarray, edges: np.ndarray, k: float) -> np.ndarray:      # d^2 / k along each edge
+        displacement = np.zeros_like(positions)
+        if len(edges):
+            delta    = positions[edges[:, 0]] - positions[edges[:, 1]]
+            distance = np.hypot(delta[:, 0], delta[:, 1])
+            force    = delta * (distance / k)[:, None]
+            for axis in (0, 1):
+                displacement[:, axis] -= np.bincount(edges[:, 0], weights=force[:, axis], minlength=len(positions))
+                displacement[:, axis] += np.bincount(edges[:, 1], weights=force[:, axis], minlength=len(positions))
+        return displacement
+
+    def coarsen(self, node_count: int, edges: np.ndarray, rng):              # vectorised: nodes with a lower random key than all their neighbours become centres, the others join their lowest key centre neighbour
+        key     = rng.random(node_count)
+        parents = np.arange(node_count)
+        if len(edges):
+            source          = np.concatenate([edges[:, 0], edges[:, 1]])
+            target          = np.concatenate([edges[:, 1], edges[:, 0]])
+            neighbour_key   = np.full(node_count, np.inf)
+            np.minimum.at(neighbour_key, source, key[target])
+            is_centre       = key < neighbour_key
+            joins           = ~is_centre[source] & is_centre[target]
+            source, target  = source[joins], target[joins]
+            order           = np.lexsort((key[target], source))
+            sources, first  = np.unique(source[order], return_index=True)
+            parents[sources] = target[order][first]
+        groups, parents = np.unique(parents, return_inverse=True)
+        return parents, len(groups)
+
+    def simple_edges(self, edges: np.ndarray) -> np.ndarray:                # undirected, no self loops, no duplicates
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        edges = np.sort(edges, axis=1)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        if len(edges) == 0:
+            return edges
+        width = int(edges.max()) + 1
+        pairs = np.unique(edges[:, 0] * width + edges[:, 1])                # 1D keys are much faster to de-duplicate than rows
+        return np.column_stack([pairs // width, pairs % width])
+
+    def rescale(self, positions: np.ndarray) -> np.ndarray:                 # centred in [-1, 1] (same as networkx's layouts)
+        positions = positions - positions.mean(axis=0)
+        scale     = np.abs(positions).max()
+        if scale > 0:
+            positions = positions / scale
+        return positions
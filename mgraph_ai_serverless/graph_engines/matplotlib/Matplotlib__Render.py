@@ -1,21 +1,27 @@
-from osbot_utils.utils.Objects                                                        import type_full_name
-from mgraph_ai.mgraph.domain.Domain__MGraph__Graph                                    import Domain__MGraph__Graph
-from mgraph_ai.providers.json.domain.Domain__MGraph__Json__Graph                      import Domain__MGraph__Json__Graph
-from mgraph_ai.providers.simple.domain.Domain__Simple__Graph                          import Domain__Simple__Graph
-from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render   import Model__Matplotlib__Render
-from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib         import MGraph__Export__Matplotlib
-from osbot_utils.type_safe.Type_Safe                                                  import Type_Safe
-
-DOMAIN_TYPES = { type_full_name(Domain__MGraph__Graph      ) : Domain__MGraph__Graph       ,        # todo: see if there is a better way to do this (that is safe and doesn't allow any type of class from being created)
-                 type_full_name(Domain__Simple__Graph      ) : Domain__Simple__Graph       ,                           # allow-list of supported domain types
-                 type_full_name(Domain__MGraph__Json__Graph) : Domain__MGraph__Json__Graph }
+from importlib                                                                      import import_module
+from mgraph_ai.mgraph.domain.Domain__MGraph__Graph                                  import Domain__MGraph__Graph
+from mgraph_ai_serverless.graph_engines.Graph_Engines__Domain_Types                 import GRAPH_ENGINES__DOMAIN_TYPES
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Layout import Model__Matplotlib__Layout
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render import Model__Matplotlib__Render
+from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib       import MGraph__Export__Matplotlib
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Pool         import matplotlib__render_pool
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Graph_Data__Reader   import Matplotlib__Graph_Data__Reader, MATPLOTLIB__FAST_PARSE
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+
+def domain_type_class(graph_type: str) -> type:                                         # 'module.path.Class' to the Class (only called with the allow-listed names)
+    module_name, class_name = graph_type.rsplit('.', 1)
+    return getattr(import_module(module_name), class_name)
+
+DOMAIN_TYPES = { graph_type: domain_type_class(graph_type) for graph_type in GRAPH_ENGINES__DOMAIN_TYPES }     # the classes of the (shared) allow-list of supported domain types
 
 # todo: add this env var so that we dont get this error in AWS
 #               Matplotlib created a temporary cache directory at /tmp/matplotlib-r6_022ek because there was an issue with the default path (/home/sbx_user1051/.config/matplotlib); it is highly recommended to set the MPLCONFIGDIR environment variable to a writable directory, in particular to speed up the import of Matplotlib and to better support multiprocessing.
 #       also look at this error (in AWS Lambda) Fontconfig error: No writable cache directories
 
 class Matplotlib__Render(Type_Safe):
-
+    render_pool       = matplotlib__render_pool                                             # only used when enabled (MGRAPH__MATPLOTLIB__POOL=true)
+    graph_data_reader : Matplotlib__Graph_Data__Reader
+    fast_parse        : bool = MATPLOTLIB__FAST_PARSE
 
     def create_graph_from_graph_data(self, graph_data):
         if not graph_data:
@@ -27,24 +33,63 @@ class Matplotlib__Render(Type_Safe):
             raise ValueError(f"Unsupported domain type: {graph_type}")
         return domain_type.from_json(graph_data)                      # Reconstruct the graph from JSON
 
+    def create_exporter(self, graph_data) -> MGraph__Export__Matplotlib:
+        if self.fast_parse:                                                                     # compact arrays straight from the json (no domain/model/schema objects)
+            return MGraph__Export__Matplotlib(graph_arrays=self.graph_data_reader.read(graph_data))
+        graph = self.create_graph_from_graph_data(graph_data=graph_data)
+        return MGraph__Export__Matplotlib(graph=graph)
+
     def render_graph(self, matplotlib_render: Model__Matplotlib__Render) -> bytes:         # Main render method
-        graph_data       = matplotlib_render.graph_data
-        graph            = self.create_graph_from_graph_data(graph_data=graph_data)
-        screenshot_bytes = self.create_image(matplotlib_render=matplotlib_render, graph=graph)
-        return screenshot_bytes
+        image_bytes, _ = self.render_graph__with_layout_key(matplotlib_render)
+        return image_bytes
+
+    def render_graph__with_layout_key(self, matplotlib_render: Model__Matplotlib__Render) -> tuple:       # (image bytes, layout cache key), the key can seed the next render of the same (evolving) graph
+        if self.render_pool.enabled:
+            return self.render_pool.render_graph(matplotlib_render)                          # in a worker process (so concurrent renders use all cores)
+        return self.render_graph__in_process(matplotlib_render)
+
+    def render_graph__in_process(self, matplotlib_render: Model__Matplotlib__Render) -> tuple:
+        exporter = self.create_exporter(graph_data=matplotlib_render.graph_data)
+        return self.exporter_image(exporter=exporter, matplotlib_render=matplotlib_render)
+
+    def layout_graph(self, matplotlib_layout: Model__Matplotlib__Layout) -> dict:          # node positions only (the client draws the graph)
+        if self.render_pool.enabled:
+            return self.render_pool.layout_graph(matplotlib_layout)
+        return self.layout_graph__in_process(matplotlib_layout)
+
+    def layout_graph__in_process(self, matplotlib_layout: Model__Matplotlib__Layout) -> dict:
+        with self.create_exporter(graph_data=matplotlib_layout.graph_data) as _:
+            return _.to_layout(layout     = matplotlib_layout.layout     ,
+                               seed       = matplotlib_layout.seed       ,
+                               positions  = matplotlib_layout.positions  ,
+                               layout_key = matplotlib_layout.layout_key ,
+                               encoding   = matplotlib_layout.encoding   )
 
     def create_image(self, matplotlib_render: Model__Matplotlib__Render, graph: Domain__MGraph__Graph) -> bytes:
+        image_bytes, _ = self.create_image__with_layout_key(matplotlib_render=matplotlib_render, graph=graph)
+        return image_bytes
+
+    def create_image__with_layout_key(self, matplotlib_render: Model__Matplotlib__Render, graph: Domain__MGraph__Graph) -> tuple:
         with MGraph__Export__Matplotlib(graph=graph) as _:
             _.process_graph()
+            return self.exporter_image(exporter=_, matplotlib_render=matplotlib_render)
 
+    def exporter_image(self, exporter: MGraph__Export__Matplotlib, matplotlib_render: Model__Matplotlib__Render) -> tuple:
+        with exporter as _:
             render_params = { 'layout'     : matplotlib_render.layout         ,                 # Extract render parameters
+                              'seed'       : matplotlib_render.seed           ,
                               'figsize'    : matplotlib_render.figsize        ,
                               'node_size'  : matplotlib_render.node_size      ,
                               'node_color' : matplotlib_render.node_color     ,
                               'format'     : matplotlib_render.output_format  ,
-                              'dpi'        : matplotlib_render.dpi            }
+                              'dpi'        : matplotlib_render.dpi            ,
+                              'max_pixels' : matplotlib_render.max_pixels     ,
+                              'preview'    : matplotlib_render.preview        ,
+                              'positions'  : matplotlib_render.positions      ,
+                              'layout_key' : matplotlib_render.layout_key     }
 
-            return _.to_image(**render_params)                                           # Generate the image
+            image_bytes = _.to_image(**render_params)                                    # Generate the image
+            return image_bytes, _.layout_key
 
     # def process_graph(self) -> Dict[str, Any]:                                              # Process graph to data format
     #     if not self.graph:
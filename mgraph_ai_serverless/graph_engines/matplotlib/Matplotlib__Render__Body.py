@@ -0,0 +1,76 @@
+import dataclasses
+import json
+from enum                                                                           import Enum
+from typing                                                                         import get_args, get_origin, Any, Union
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render import Model__Matplotlib__Render
+
+try:
+    import orjson                                                           # optional (pip install mgraph_ai_serverless[fast-json]): faster than the stdlib decoder, and it reads the body bytes without decoding them to a str first
+    JSON__DECODER = 'orjson'
+except ImportError:
+    orjson        = None
+    JSON__DECODER = 'json'
+
+
+class Matplotlib__Render__Body(Type_Safe):                                  # decodes a raw request body into Model__Matplotlib__Render, validating only the envelope (graph_data is validated by Matplotlib__Graph_Data__Reader)
+
+    def json_loads(self, body: bytes):
+        try:
+            if orjson:
+                return orjson.loads(body)
+            return json.loads(body)
+        except ValueError as error:                                         # (orjson.JSONDecodeError is a ValueError too)
+            raise ValueError(f"Invalid json body: {error}")
+
+    def decode(self, body: bytes, model_type: type = Model__Matplotlib__Render):
+        data = self.json_loads(body)
+        if not isinstance(data, dict):
+            raise ValueError("Invalid json body: expected a json object")
+        kwargs = {}
+        for field in dataclasses.fields(model_type):                        # unknown fields are ignored (same as FastAPI's body parsing)
+            if field.name in data:
+                kwargs[field.name] = self.field_value(field.name, field.type, data[field.name])
+        return model_type(**kwargs)                                         # graph_data is passed as decoded (no copy, no per item validation)
+
+    def field_value(self, name: str, annotation, value):
+        origin = get_origin(annotation)
+        args   = get_args  (annotation)
+        if origin is Union:                                                 # Optional[...]
+            if value is None:
+                return None
+            annotation = next(arg for arg in args if arg is not type(None))
+            origin     = get_origin(annotation)
+            args       = get_args  (annotation)
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            try:
+                return annotation(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {name}: {value!r} (expected one of {[item.value for item in annotation]})")
+        if origin is tuple:                                                 # i.e. figsize: Tuple[int, int]
+            if not isinstance(value, list) or len(value) != len(args):
+                raise ValueError(f"Invalid value for {name}: expected a list with {len(args)} items")
+            return tuple(self.field_value(name, arg, item) for arg, item in zip(args, value))
+        if origin is dict or annotation is dict:
+            if not isinstance(value, dict):
+                raise ValueError(f"Invalid value for {name}: expected a json object")
+            if len(args) == 2 and args[1] is not Any:                      # i.e. positions: Dict[str, Tuple[float, float]] (graph_data's Dict[str, Any] is not walked)
+                return {key: self.field_value(name, args[1], item) for key, item in value.items()}
+            return value
+        if annotation is bool:
+            if type(value) is not bool:
+                raise ValueError(f"Invalid value for {name}: expected a boolean")
+            return value
+        if annotation is int:
+            if type(value) is not int:                                      # (bool is an int subclass, so it is rejected here)
+                raise ValueError(f"Invalid value for {name}: expected an integer")
+            return value
+        if annotation is float:
+            if type(value) not in (int, float):
+                raise ValueError(f"Invalid value for {name}: expected a number")
+            return float(value)
+        if annotation is str:
+            if type(value) is not str:
+                raise ValueError(f"Invalid value for {name}: expected a string")
+            return value
+        return value
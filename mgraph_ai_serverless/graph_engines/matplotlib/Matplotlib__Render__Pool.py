@@ -0,0 +1,140 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures                                                             import ProcessPoolExecutor
+from concurrent.futures.process                                                     import BrokenProcessPool
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.utils.Env                                                          import get_env
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render import Model__Matplotlib__Render
+
+MATPLOTLIB__POOL                         = get_env('MGRAPH__MATPLOTLIB__POOL', 'false').lower() == 'true'                # render in worker processes (uses all cores, but needs /dev/shm, so it is not available in AWS Lambda)
+MATPLOTLIB__POOL__WORKERS                = int  (get_env('MGRAPH__MATPLOTLIB__POOL__WORKERS'              , os.cpu_count() or 1))
+MATPLOTLIB__POOL__MAX_QUEUE              = int  (get_env('MGRAPH__MATPLOTLIB__POOL__MAX_QUEUE'            , 0                  ))  # max renders submitted (running + waiting), 0 means 4 per worker
+MATPLOTLIB__POOL__QUEUE_TIMEOUT          = float(get_env('MGRAPH__MATPLOTLIB__POOL__QUEUE_TIMEOUT'        , 10                 ))  # seconds a render waits for a queue slot before being rejected
+MATPLOTLIB__POOL__RENDER_TIMEOUT         = float(get_env('MGRAPH__MATPLOTLIB__POOL__RENDER_TIMEOUT'       , 60                 ))  # seconds a request waits for its render (after getting a queue slot)
+MATPLOTLIB__POOL__MAX_RENDERS_PER_WORKER = int  (get_env('MGRAPH__MATPLOTLIB__POOL__MAX_RENDERS_PER_WORKER', 200                ))  # workers are recycled after this many tasks (caps leaks and fragmentation), the first workers' start-up task counts as one
+MATPLOTLIB__POOL__START_METHOD           =       get_env('MGRAPH__MATPLOTLIB__POOL__START_METHOD'         , 'forkserver'       )   # fork is not supported with worker recycling
+
+MATPLOTLIB__POOL__PRELOAD = ['numpy', 'networkx', 'matplotlib.figure', 'matplotlib.backends.backend_agg',                   # imported once in the forkserver, so new (and recycled) workers start with them loaded
+                             'mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render']                           # (also replaces the default '__main__' preload, which would re-run the app's startup code)
+
+
+def worker__init():                                                         # runs once in each new worker, so the first render doesn't pay for the imports and the font cache
+    from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Engines import mgraph_ai_serverless__engines
+    mgraph_ai_serverless__engines.import_engine('matplotlib')
+    from matplotlib                      import font_manager
+    from matplotlib.figure               import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    font_manager.findfont(font_manager.FontProperties())                    # loads (or builds) the font list cache
+    figure = Figure(figsize=(1, 1))
+    figure.text(0.5, 0.5, 'warm-up')
+    FigureCanvasAgg(figure).draw()                                          # warms up the text layout and Agg code paths
+
+def worker__render_graph(matplotlib_render: Model__Matplotlib__Render) -> tuple:
+    from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render import Matplotlib__Render
+    return Matplotlib__Render().render_graph__in_process(matplotlib_render)  # (image bytes, layout key): the bytes are pickled straight into the result pipe (no base64 or extra buffers)
+
+def worker__layout_graph(matplotlib_layout) -> dict:
+    from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render import Matplotlib__Render
+    return Matplotlib__Render().layout_graph__in_process(matplotlib_layout)
+
+
+class Matplotlib__Render__Pool(Type_Safe):                                  # optional process pool for the CPU (and GIL) bound layout + Agg rasterization
+    enabled                : bool  = MATPLOTLIB__POOL
+    workers                : int   = MATPLOTLIB__POOL__WORKERS
+    max_queue              : int   = MATPLOTLIB__POOL__MAX_QUEUE
+    queue_timeout          : float = MATPLOTLIB__POOL__QUEUE_TIMEOUT
+    render_timeout         : float = MATPLOTLIB__POOL__RENDER_TIMEOUT
+    max_renders_per_worker : int   = MATPLOTLIB__POOL__MAX_RENDERS_PER_WORKER
+    start_method           : str   = MATPLOTLIB__POOL__START_METHOD
+    submitted              : int
+    rejected               : int
+    timed_out              : int
+    restarts               : int                                            # executors replaced after a worker died (i.e. OOM or a crash in a C extension)
+    executor               = None
+    queue_slots            = None
+    lock                   = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.executor is None:
+                workers          = max(self.workers, 1)
+                mp_context       = multiprocessing.get_context(self.start_method)
+                if self.start_method == 'forkserver':
+                    mp_context.set_forkserver_preload(MATPLOTLIB__POOL__PRELOAD)                                        # modules that fail to import are skipped
+                if self.queue_slots is None:                                # (kept when a broken executor is replaced, since its renders may still hold slots)
+                    self.queue_slots = threading.BoundedSemaphore(self.queue_size())
+                self.executor    = ProcessPoolExecutor(max_workers         = workers                                       ,
+                                                       mp_context          = mp_context                                    ,
+                                                       initializer         = worker__init                                  ,
+                                                       max_tasks_per_child = self.max_renders_per_worker or None           )
+                for _ in range(workers):                                    # start all the workers now (ProcessPoolExecutor only spawns them on demand), these tasks count toward max_tasks_per_child
+                    self.executor.submit(os.getpid)
+        return self.executor
+
+    def queue_size(self) -> int:
+        return self.max_queue or max(self.workers, 1) * 4
+
+    def stop(self):
+        with self.lock:
+            if self.executor:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+                self.executor = None
+
+    def run(self, target, *args):                                           # runs target(*args) in a worker, blocking the calling (threadpool) thread until it is done
+        executor    = self.start()
+        queue_slots = self.queue_slots
+        if not queue_slots.acquire(timeout=self.queue_timeout):
+            with self.lock:
+                self.rejected += 1
+            raise TimeoutError(f"Matplotlib render queue is full (max {self.queue_size()} renders)")
+        future = None
+        try:
+            with self.lock:
+                self.submitted += 1
+            future = executor.submit(target, *args)
+            return future.result(timeout=self.render_timeout)
+        except TimeoutError:                                                # (concurrent.futures.TimeoutError is TimeoutError since python 3.11)
+            with self.lock:
+                self.timed_out += 1
+            raise TimeoutError(f"Matplotlib render timed out (after {self.render_timeout} seconds)") from None
+        except BrokenProcessPool:                                           # a worker died, so this executor can't run anything else
+            self.restart(executor)
+            raise
+        finally:
+            if future is None or future.cancel() or future.done():
+                queue_slots.release()
+            else:                                                           # timed out while running: the render keeps its queue slot until it finishes in its worker
+                future.add_done_callback(lambda _: queue_slots.release())
+
+    def restart(self, executor):                                            # replaces a broken executor (the next run starts a new one)
+        with self.lock:
+            if self.executor is executor:
+                self.executor  = None
+                self.restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def render_graph(self, matplotlib_render: Model__Matplotlib__Render) -> tuple:
+        return self.run(worker__render_graph, matplotlib_render)
+
+    def layout_graph(self, matplotlib_layout) -> dict:
+        return self.run(worker__layout_graph, matplotlib_layout)
+
+    def stats(self):
+        with self.lock:
+            return dict(enabled                = self.enabled               ,
+                        started                = self.executor is not None  ,
+                        workers                = self.workers               ,
+                        max_queue              = self.queue_size()          ,
+                        max_renders_per_worker = self.max_renders_per_worker,
+                        render_timeout         = self.render_timeout        ,
+                        submitted              = self.submitted             ,
+                        rejected               = self.rejected              ,
+                        timed_out              = self.timed_out             ,
+                        restarts               = self.restarts              )
+
+matplotlib__render_pool = Matplotlib__Render__Pool()                        # one pool per process (shared by all routes and requests)
@@ -0,0 +1,8 @@
+import numpy as np
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Model__Matplotlib__Graph_Arrays(Type_Safe):                           # compact graph: node i is node_ids[i] / labels[i], edges are (from_index, to_index) rows
+    node_ids : list
+    labels   : list
+    edges    : np.ndarray = None                                            # int32 array with shape (edge_count, 2)
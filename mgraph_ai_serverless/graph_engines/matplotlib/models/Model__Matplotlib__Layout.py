@@ -0,0 +1,12 @@
+from dataclasses                                                                             import dataclass
+from typing                                                                                  import Tuple, Dict, Any, Optional
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Layout_Encoding import Model__Matplotlib__Layout_Encoding
+
+@dataclass
+class Model__Matplotlib__Layout:                                                                # layout only (no rasterization), for clients that draw the graph themselves
+    graph_data      : Dict[str, Any]                     = None                    # Serialized graph data
+    layout          : str                                = 'spring'                # Layout algorithm to use (same as Model__Matplotlib__Render, and the same layout cache)
+    seed            : Optional[int]                      = None                    # Seed for the spring, random and NumPy layouts (part of the layout cache key)
+    positions       : Optional[Dict[str, Tuple[float, float]]] = None            # Prior node positions (see Model__Matplotlib__Render)
+    layout_key      : Optional[str]                      = None                    # Layout cache key of a previous render or layout
+    encoding        : Model__Matplotlib__Layout_Encoding = Model__Matplotlib__Layout_Encoding.objects
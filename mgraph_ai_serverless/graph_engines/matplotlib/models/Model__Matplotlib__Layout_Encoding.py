@@ -0,0 +1,5 @@
+from enum import Enum
+
+class Model__Matplotlib__Layout_Encoding(str, Enum):
+    objects = 'objects'      # nodes as {id, label, x, y} and edges as {source, target}
+    flat    = 'flat'         # parallel arrays: node_ids, labels, positions [x0, y0, x1, y1, ...] and edges [from0, to0, from1, to1, ...] (node indexes)
@@ -1,14 +1,19 @@
 from dataclasses                                                                            import dataclass
 from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Output_Format  import Model__Matplotlib__Output_Format
-from typing                                                                                 import Tuple, Dict, Any
+from typing                                                                                 import Tuple, Dict, Any, Optional
 
 # todo: refactor the config into a separate class (i.e. top level should just be graph and config)
 @dataclass
 class Model__Matplotlib__Render:
     graph_data      : Dict[str, Any]                   = None                    # Serialized graph data
-    layout          : str                              = 'spring'                # Layout algorithm to use
+    layout          : str                              = 'spring'                # Layout algorithm to use (force_grid, multilevel and spectral_sparse scale to 100k+ nodes)
+    seed            : Optional[int]                    = None                    # Seed for the spring, random and NumPy layouts (part of the layout cache key)
     figsize         : Tuple[int, int]                  = (10, 10)                # Figure size in inches
     node_size       : int                              = 1000                    # Size of nodes
     node_color      : str                              = 'lightblue'             # Color of nodes
     output_format   : Model__Matplotlib__Output_Format = Model__Matplotlib__Output_Format.png
-    dpi             : int                              = 300                     # Resolution in dots per inch
\ No newline at end of file
+    dpi             : int                              = 300                     # Resolution in dots per inch
+    max_pixels      : Optional[int]                    = None                    # Pixel budget (width * height), the dpi is lowered to fit it (i.e. 1_000_000 for a 1000x1000 image)
+    preview         : bool                             = False                   # Fast preview: low dpi, no antialiasing, and no labels on large graphs
+    positions       : Optional[Dict[str, Tuple[float, float]]] = None            # Prior node positions (i.e. from the previous render): kept nodes barely move and new ones are placed next to their neighbours
+    layout_key      : Optional[str]                    = None                    # Layout cache key of a previous render (its X-Matplotlib-Layout-Key header), used as prior positions (if it is still cached)
\ No newline at end of file
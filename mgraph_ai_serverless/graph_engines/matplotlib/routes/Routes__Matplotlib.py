@@ -1,33 +1,80 @@
-from fastapi                                                                          import Response, HTTPException
-from starlette.status                                                                 import HTTP_400_BAD_REQUEST
-from mgraph_ai.providers.json.domain.Domain__MGraph__Json__Graph                      import Domain__MGraph__Json__Graph
-from mgraph_ai.providers.simple.domain.Domain__Simple__Graph                          import Domain__Simple__Graph
-from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render   import Model__Matplotlib__Render
-from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render                 import Matplotlib__Render
-from osbot_fast_api.api.Fast_API_Routes                                               import Fast_API_Routes
+from fastapi                                                                        import Request, Response, HTTPException
+from starlette.concurrency                                                          import run_in_threadpool
+from starlette.status                                                               import HTTP_400_BAD_REQUEST, HTTP_503_SERVICE_UNAVAILABLE
+from fastapi.responses                                                              import JSONResponse
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Layout import Model__Matplotlib__Layout
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render import Model__Matplotlib__Render
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Layout__Cache        import matplotlib__layout_cache
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Pool         import matplotlib__render_pool
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Body         import Matplotlib__Render__Body
+from osbot_fast_api.api.Fast_API_Routes                                             import Fast_API_Routes
 
-ROUTES__MATPLOTLIB__RENDER = ['/render-graph']
-
-DOMAIN_TYPES = { 'Domain__Simple__Graph'      : Domain__Simple__Graph       ,                           # allow-list of supported domain types
-                 'Domain__MGraph__Json__Graph': Domain__MGraph__Json__Graph }
+ROUTES__MATPLOTLIB__RENDER = ['/render-graph', '/render-graph-raw', '/layout', '/layout-cache-stats', '/render-pool-stats']
 
 class Routes__Matplotlib(Fast_API_Routes):
-    tag                : str = 'matplotlib'
-    matplotlib__render : Matplotlib__Render
+    tag         : str = 'matplotlib'
+    render_body : Matplotlib__Render__Body
+
+    @property
+    def matplotlib__render(self):                                                       # created (and imported) on first use: matplotlib, networkx and mgraph_ai are the slowest imports of the app
+        if getattr(self, '_matplotlib__render', None) is None:                            # (a property, so it is still used, and can still be set, as an attribute)
+            from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render import Matplotlib__Render
+            self._matplotlib__render = Matplotlib__Render()
+        return self._matplotlib__render
+
+    @matplotlib__render.setter
+    def matplotlib__render(self, matplotlib__render):
+        self._matplotlib__render = matplotlib__render
 
     def render_graph(self, matplotlib_render: Model__Matplotlib__Render) -> Response:
         try:
-            bytes_data = self.matplotlib__render.render_graph(matplotlib_render)                                           # Generate the image
+            bytes_data, layout_key = self.matplotlib__render.render_graph__with_layout_key(matplotlib_render)            # Generate the image
         except ValueError as value_error:
             raise HTTPException(status_code = HTTP_400_BAD_REQUEST,
                                 detail      = value_error.args[0]        )
+        except TimeoutError as timeout_error:                                                                               # the render pool's queue is full
+            raise HTTPException(status_code = HTTP_503_SERVICE_UNAVAILABLE,
+                                detail      = timeout_error.args[0]              )
 
         if type(matplotlib_render.output_format) is str:
             format_type = matplotlib_render.output_format
         else:
             format_type = matplotlib_render.output_format.value
-        return Response(content=bytes_data,
-                       media_type=f"image/{format_type}")
+        return Response(content    = bytes_data                                   ,
+                        media_type = f"image/{format_type}"                       ,
+                        headers    = {'X-Matplotlib-Layout-Key': layout_key or ''})  # send it back as layout_key, to seed the layout of the next version of this graph
+
+    async def render_graph_raw(self, request: Request) -> Response:                    # same as render_graph, but the body is decoded with orjson and only its envelope is validated (for large graph_data payloads)
+        body = await request.body()
+        try:
+            matplotlib_render = self.render_body.decode(body)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST,
+                                detail      = value_error.args[0]        )
+        return await run_in_threadpool(self.render_graph, matplotlib_render)                # (the render is CPU bound, so it must not block the event loop)
+
+    def layout(self, matplotlib_layout: Model__Matplotlib__Layout) -> JSONResponse:        # nodes, edges and positions as json (shares the layout cache with render_graph)
+        try:
+            layout_data = self.matplotlib__render.layout_graph(matplotlib_layout)
+        except ValueError as value_error:
+            raise HTTPException(status_code = HTTP_400_BAD_REQUEST,
+                                detail      = value_error.args[0]        )
+        except TimeoutError as timeout_error:
+            raise HTTPException(status_code = HTTP_503_SERVICE_UNAVAILABLE,
+                                detail      = timeout_error.args[0]              )
+        return JSONResponse(content=layout_data)                                                   # skips FastAPI's (slow, recursive) jsonable_encoder
+
+    def layout_cache_stats(self):                                                        # only this (main) process's cache: when the render pool is enabled, each worker has its own (not included)
+        stats          = matplotlib__layout_cache.stats()
+        stats['scope'] = 'main process only (render pool workers have their own caches)' if matplotlib__render_pool.enabled else 'main process'
+        return stats
+
+    def render_pool_stats(self):
+        return matplotlib__render_pool.stats()
 
     def setup_routes(self):
-        self.add_route(self.render_graph, methods=['POST'])
\ No newline at end of file
+        self.add_route    (self.render_graph    , methods=['POST'])
+        self.add_route    (self.render_graph_raw, methods=['POST'])
+        self.add_route    (self.layout          , methods=['POST'])
+        self.add_route_get(self.layout_cache_stats)
+        self.add_route_get(self.render_pool_stats )
\ No newline at end of file
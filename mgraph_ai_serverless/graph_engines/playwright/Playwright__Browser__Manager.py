@@ -0,0 +1,141 @@
+import asyncio
+import threading
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Playwright__Browser__Manager(Type_Safe):                              # one Chromium per process, launched once and shared by all requests (and warm Lambda invocations)
+    launches        : int                                                   # each request gets its own (isolated) browser context, so its per request cost is opening a page
+    contexts_opened : int
+    contexts_closed : int
+    last_error      : str = None
+    browser         = None
+    playwright      = None
+    loop            = None                                                  # playwright objects are bound to the event loop they were created in, so they all live in this loop (in its own thread)
+    thread          = None
+    lock            = None
+    launch_lock     = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+
+    # methods that can be called from any thread
+
+    def event_loop(self):
+        with self.lock:
+            if self.loop is None:
+                self.loop   = asyncio.new_event_loop()
+                self.thread = threading.Thread(target=self.loop.run_forever, name='playwright-browser', daemon=True)
+                self.thread.start()
+            return self.loop
+
+    def run(self, coroutine, timeout: float = None):                        # from sync code
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.event_loop())
+        return future.result(timeout)
+
+    async def run_async(self, coroutine):                                   # from another event loop (i.e. the one each Flow runs in)
+        loop = self.event_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    def stop(self):                                                         # closes the browser and playwright, and stops the loop
+        with self.lock:
+            loop, thread = self.loop, self.thread
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        with self.lock:
+            self.loop        = None
+            self.thread      = None
+            self.launch_lock = None
+
+    def status(self):
+        browser = self.browser
+        return dict(started           = self.loop is not None                          ,
+                    browser_connected = bool(browser and browser.is_connected())       ,
+                    launches          = self.launches                                  ,
+                    contexts_opened   = self.contexts_opened                           ,
+                    contexts_open     = self.contexts_opened - self.contexts_closed    ,
+                    last_error        = self.last_error                                )
+
+    # coroutines that run in the manager's loop (use run or run_async to call them)
+
+    async def start_playwright(self):
+        if self.playwright is None:
+            from playwright.async_api import async_playwright
+            self.playwright = await async_playwright().start()
+        return self.playwright
+
+    async def get_browser(self, launch_kwargs):                             # launch_kwargs is a function, only called when the browser needs to be (re)launched
+        if self.launch_lock is None:
+            self.launch_lock = asyncio.Lock()
+        async with self.launch_lock:                                        # concurrent requests wait for the same launch
+            if self.browser is None or self.browser.is_connected() is False:
+                await self.launch(launch_kwargs())
+            return self.browser
+
+    async def launch(self, launch_kwargs: dict):
+        self.browser = None
+        playwright   = await self.start_playwright()
+        try:
+            browser = await playwright.chromium.launch(**launch_kwargs)
+        except Exception as error:                                          # the playwright driver might be the one that died, so restart it and try again once
+            self.last_error = self.error_message(error)
+            await self.stop_playwright()
+            playwright = await self.start_playwright()
+            browser    = await playwright.chromium.launch(**launch_kwargs)
+        browser.on('disconnected', self.on_disconnected)
+        self.browser   = browser
+        self.launches += 1
+        return browser
+
+    def error_message(self, error: Exception) -> str:
+        lines = str(error).strip().splitlines() or ['']
+        return f'{type(error).__name__}: {lines[0]}'                        # (playwright's errors can have multi line banners)
+
+    def on_disconnected(self, browser):                                     # i.e. chromium crashed (or was killed), the next request relaunches it
+        if self.browser is browser:
+            self.browser    = None
+            self.last_error = 'browser disconnected'
+
+    async def new_context(self, launch_kwargs, **context_kwargs):
+        browser = await self.get_browser(launch_kwargs)
+        try:
+            context = await browser.new_context(**context_kwargs)
+        except Exception:
+            if browser.is_connected():
+                raise
+            browser = await self.get_browser(launch_kwargs)                 # crashed since the check, so relaunch (once)
+            context = await browser.new_context(**context_kwargs)
+        self.contexts_opened += 1
+        return context
+
+    async def close_context(self, context):
+        try:
+            await context.close()
+        except Exception as error:                                          # the browser might be gone already
+            self.last_error = self.error_message(error)
+        self.contexts_closed += 1
+
+    async def close(self):
+        if self.browser:
+            browser, self.browser = self.browser, None
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        await self.stop_playwright()
+
+    async def stop_playwright(self):
+        if self.playwright:
+            playwright, self.playwright = self.playwright, None
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+playwright__browser_manager = Playwright__Browser__Manager()                # one per process (survives across warm Lambda invocations)
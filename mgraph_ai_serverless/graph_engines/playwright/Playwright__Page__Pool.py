@@ -0,0 +1,141 @@
+import asyncio
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+from osbot_utils.utils.Env                                                           import get_env
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager      import playwright__browser_manager
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Render__Ready         import Playwright__Render__Ready
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Scheduler       import playwright__page_scheduler
+from mgraph_ai_serverless.graph_engines.playwright.models.Model__Page_Pool__Renderer import Model__Page_Pool__Renderer
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets         import web_root__assets
+
+PLAYWRIGHT__PAGE_POOL                       = get_env('MGRAPH__PLAYWRIGHT__PAGE_POOL', 'true').lower() == 'true'      # keep mermaid/cytoscape pages loaded between renders
+PLAYWRIGHT__PAGE_POOL__SIZE                 = int(get_env('MGRAPH__PLAYWRIGHT__PAGE_POOL__SIZE'                , 2  ))     # max pages per renderer (also the max concurrent renders per renderer)
+PLAYWRIGHT__PAGE_POOL__MAX_RENDERS_PER_PAGE = int(get_env('MGRAPH__PLAYWRIGHT__PAGE_POOL__MAX_RENDERS_PER_PAGE', 100))     # pages are recycled after this many renders (caps DOM and JS heap growth)
+
+
+class Playwright__Page__Pool(Type_Safe):                                    # pages already loaded with a renderer library: a render is evaluate + screenshot + reset (no navigation)
+    enabled               : bool = PLAYWRIGHT__PAGE_POOL
+    size                  : int  = PLAYWRIGHT__PAGE_POOL__SIZE
+    max_renders_per_page  : int  = PLAYWRIGHT__PAGE_POOL__MAX_RENDERS_PER_PAGE
+    renders               : int
+    pages_created         : int
+    pages_recycled        : int
+    contexts              : dict                                            # target_url -> BrowserContext (one per renderer)
+    idle_pages            : dict                                            # target_url -> [Page]
+    page_renders          : dict                                            # Page       -> renders done in it
+    slots                 : dict                                            # target_url -> asyncio.Semaphore
+    render_ready          : Playwright__Render__Ready                       # (its timeout is the max time for prepare_js and render_js)
+    browser_manager       = playwright__browser_manager
+    page_scheduler        = playwright__page_scheduler                      # renders count against the process wide max pages (and have its queue and request timeouts)
+    web_root_assets       = web_root__assets
+
+    def render(self, renderer: Model__Page_Pool__Renderer, diagram) -> bytes:            # from sync code, returns the screenshot (png) bytes
+        return self.browser_manager.run(self.render_async(renderer, diagram))
+
+    def prefill(self, renderer: Model__Page_Pool__Renderer, pages: int = None):           # loads the pages before the first render
+        return self.browser_manager.run(self.prefill_async(renderer, pages or self.size))
+
+    def stop(self):                                                         # closes the pooled pages (the browser is closed by the browser manager)
+        if self.contexts or self.slots:
+            self.browser_manager.run(self.stop_async())
+
+    def stats(self):
+        return dict(enabled              = self.enabled                                                    ,
+                    size                 = self.size                                                       ,
+                    max_renders_per_page = self.max_renders_per_page                                       ,
+                    renders              = self.renders                                                    ,
+                    pages_created        = self.pages_created                                              ,
+                    pages_recycled       = self.pages_recycled                                             ,
+                    idle_pages           = {target_url: len(pages) for target_url, pages in self.idle_pages.items()})
+
+    # coroutines that run in the browser manager's loop
+
+    async def render_async(self, renderer: Model__Page_Pool__Renderer, diagram) -> bytes:
+        async with self.renderer_slots(renderer):
+            return await self.page_scheduler.run_async(self.render_page(renderer, diagram))
+
+    async def render_page(self, renderer: Model__Page_Pool__Renderer, diagram) -> bytes:
+        page = await self.acquire_page(renderer)
+        try:
+            await self.evaluate(page, renderer.render_js, diagram)          # the diagram is passed as an argument (not pasted into the js code)
+            if renderer.wait_for:
+                await asyncio.sleep(renderer.wait_for)
+            screenshot = await page.screenshot(full_page=True)
+        except BaseException:                                               # (including the page scheduler's timeout, which cancels the render)
+            await self.close_page(page)                                     # the page (or the browser) might be in a bad state
+            raise
+        self.renders += 1
+        await self.release_page(renderer, page)
+        return screenshot
+
+    def renderer_slots(self, renderer: Model__Page_Pool__Renderer) -> asyncio.Semaphore:
+        slots = self.slots.get(renderer.target_url)
+        if slots is None:
+            slots = self.slots[renderer.target_url] = asyncio.Semaphore(max(self.size, 1))
+        return slots
+
+    async def acquire_page(self, renderer: Model__Page_Pool__Renderer):
+        idle_pages = self.idle_pages.setdefault(renderer.target_url, [])
+        while idle_pages:
+            page = idle_pages.pop()
+            if page.is_closed() is False and page.context.browser.is_connected():
+                return page
+            self.page_renders.pop(page, None)                               # closed, or its browser crashed
+        return await self.new_page(renderer)
+
+    async def new_page(self, renderer: Model__Page_Pool__Renderer):
+        context = self.contexts.get(renderer.target_url)
+        if context is None or context.browser.is_connected() is False:
+            context = await self.browser_manager.new_context(self.launch_kwargs)
+            await self.web_root_assets.route_context(context)
+            self.contexts[renderer.target_url] = context
+        page = await context.new_page()
+        await page.goto(renderer.target_url)
+        if renderer.prepare_js:
+            await self.evaluate(page, renderer.prepare_js)
+        self.page_renders[page] = 0
+        self.pages_created     += 1
+        return page
+
+    async def evaluate(self, page, js_code: str, *args):                    # render (and prepare) functions return a promise that resolves once the page has rendered
+        return await asyncio.wait_for(page.evaluate(js_code, *args), self.render_ready.timeout)
+
+    async def release_page(self, renderer: Model__Page_Pool__Renderer, page):
+        self.page_renders[page] = self.page_renders.get(page, 0) + 1
+        if self.page_renders[page] >= self.max_renders_per_page:
+            await self.close_page(page)
+            return
+        try:
+            if renderer.reset_js:
+                await page.evaluate(renderer.reset_js)
+        except Exception:
+            await self.close_page(page)
+            return
+        self.idle_pages.setdefault(renderer.target_url, []).append(page)
+
+    async def close_page(self, page):
+        self.page_renders.pop(page, None)
+        self.pages_recycled += 1
+        try:
+            await page.close()
+        except Exception:                                                   # (already closed, or the browser is gone)
+            pass
+
+    async def prefill_async(self, renderer: Model__Page_Pool__Renderer, pages: int):
+        idle_pages = self.idle_pages.setdefault(renderer.target_url, [])
+        while len(idle_pages) < min(pages, self.size):
+            idle_pages.append(await self.new_page(renderer))
+        return len(idle_pages)
+
+    async def stop_async(self):
+        for context in self.contexts.values():
+            await self.browser_manager.close_context(context)
+        self.contexts    .clear()
+        self.idle_pages  .clear()
+        self.page_renders.clear()
+        self.slots       .clear()
+
+    def launch_kwargs(self):
+        from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless import Playwright__Serverless
+        return Playwright__Serverless().browser__launch_kwargs()
+
+playwright__page_pool = Playwright__Page__Pool()                            # one per process (the pages live in the shared browser)
@@ -0,0 +1,128 @@
+import asyncio
+import os
+import time
+from collections                                  import deque
+from osbot_utils.type_safe.Type_Safe              import Type_Safe
+from osbot_utils.utils.Env                        import get_env
+from osbot_utils.decorators.methods.cache_on_self import cache_on_self
+
+PLAYWRIGHT__MAX_PAGES         = int  (get_env('MGRAPH__PLAYWRIGHT__MAX_PAGES'        , 0  ))      # max pages working at the same time (in the shared browser), 0 means sized from the container's memory and cpus
+PLAYWRIGHT__PAGE_MEMORY_MB    = int  (get_env('MGRAPH__PLAYWRIGHT__PAGE_MEMORY_MB'   , 100))      # (used to size max pages) memory each page's renderer process needs
+PLAYWRIGHT__BROWSER_MEMORY_MB = int  (get_env('MGRAPH__PLAYWRIGHT__BROWSER_MEMORY_MB', 400))      # (used to size max pages) memory for chromium's main processes and this (python) process
+PLAYWRIGHT__QUEUE_TIMEOUT     = float(get_env('MGRAPH__PLAYWRIGHT__QUEUE_TIMEOUT'    , 10 ))      # seconds a request waits for a free page before being rejected
+PLAYWRIGHT__REQUEST_TIMEOUT   = float(get_env('MGRAPH__PLAYWRIGHT__REQUEST_TIMEOUT'  , 30 ))      # max seconds a request can use its page for
+
+
+class Playwright__Page__Scheduler(Type_Safe):                               # bounded number of pages working at once in the shared browser, handed out in arrival (fifo) order
+    max_pages         : int   = PLAYWRIGHT__MAX_PAGES
+    page_memory_mb    : int   = PLAYWRIGHT__PAGE_MEMORY_MB
+    browser_memory_mb : int   = PLAYWRIGHT__BROWSER_MEMORY_MB
+    queue_timeout     : float = PLAYWRIGHT__QUEUE_TIMEOUT
+    request_timeout   : float = PLAYWRIGHT__REQUEST_TIMEOUT
+    running           : int
+    completed         : int
+    rejected          : int
+    timed_out         : int
+    waiters           = None                                                # futures of the requests waiting for a page (only used in the browser manager's loop)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.waiters = deque()
+
+    @cache_on_self
+    def page_slots(self) -> int:
+        if self.max_pages:
+            return self.max_pages
+        pages_for_memory = (self.memory_mb() - self.browser_memory_mb) // max(self.page_memory_mb, 1)
+        return max(1, min(self.cpu_count() * 2, pages_for_memory))          # pages spend most of their time waiting (on the network and on chromium), so 2 per cpu
+
+    def cpu_count(self) -> int:
+        if hasattr(os, 'sched_getaffinity'):                                # the cpus this container can use (not the host's)
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+
+    def memory_mb(self) -> int:                                             # the container's memory limit (AWS Lambda, cgroup v2 or v1) or else the machine's memory
+        lambda_memory = get_env('AWS_LAMBDA_FUNCTION_MEMORY_SIZE')
+        if lambda_memory:
+            return int(lambda_memory)
+        physical_mb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+        for cgroup_file in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+            try:
+                with open(cgroup_file) as file:
+                    limit = file.read().strip()
+            except OSError:
+                continue
+            if limit.isdigit():                                             # (cgroup v2 uses 'max' for no limit, and v1 a huge number)
+                return min(int(limit) // (1024 * 1024), physical_mb)
+        return physical_mb
+
+    def stats(self):
+        return dict(max_pages       = self.page_slots()     ,
+                    running         = self.running          ,
+                    queued          = len(self.waiters)     ,
+                    completed       = self.completed        ,
+                    rejected        = self.rejected         ,
+                    timed_out       = self.timed_out        ,
+                    queue_timeout   = self.queue_timeout    ,
+                    request_timeout = self.request_timeout  )
+
+    # coroutines (and methods) that run in the browser manager's loop
+
+    async def acquire(self, timeout: float = None):                         # waits (in arrival order) for a free page, raises TimeoutError if none is free after queue_timeout
+        if self.running < self.page_slots() and not self.waiters:
+            self.running += 1
+            return
+        timeout = self.queue_timeout if timeout is None else timeout
+        waiter  = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)                         # release hands its page straight to this waiter (so running is not decremented)
+        except BaseException as error:
+            if waiter.done() and not waiter.cancelled():                    # the page was handed over just as this request gave up
+                self.release()
+            elif waiter in self.waiters:
+                self.waiters.remove(waiter)
+            if isinstance(error, asyncio.TimeoutError):
+                self.rejected += 1
+                raise TimeoutError(f"Playwright page queue is full (max {self.page_slots()} pages, waited {timeout} seconds)") from None
+            raise
+
+    def release(self):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():                                           # (skips the ones that gave up)
+                waiter.set_result(True)
+                return
+        self.running -= 1
+
+    async def run_async(self, coroutine, deadline: float = None):           # runs coroutine with a page slot, until the request's deadline (time.monotonic) or request_timeout
+        try:
+            await self.acquire()
+        except BaseException:
+            coroutine.close()
+            raise
+        try:
+            return await self.with_deadline(coroutine, deadline or time.monotonic() + self.request_timeout)
+        except TimeoutError:
+            self.timed_out += 1
+            raise
+        finally:
+            self.completed += 1
+            self.release()
+
+    async def with_deadline(self, coroutine, deadline: float = None):       # (the caller counts the timed out requests, since a request can make many calls)
+        if deadline is None:
+            return await coroutine
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            coroutine.close()
+            raise self.timeout_error()
+        try:
+            return await asyncio.wait_for(coroutine, remaining)
+        except asyncio.TimeoutError:
+            raise self.timeout_error() from None
+
+    def timeout_error(self) -> TimeoutError:
+        return TimeoutError(f"Playwright request timed out (after {self.request_timeout} seconds)")
+
+playwright__page_scheduler = Playwright__Page__Scheduler()                  # one per process (shared by the flows and the page pool)
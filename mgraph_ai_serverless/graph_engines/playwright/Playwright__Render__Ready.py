@@ -0,0 +1,20 @@
+import asyncio
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+from osbot_utils.utils.Env           import get_env
+
+PLAYWRIGHT__RENDER_TIMEOUT = float(get_env('MGRAPH__PLAYWRIGHT__RENDER_TIMEOUT', 10))     # max seconds to wait for a page to signal that it has rendered (or for a selector)
+
+RENDER_READY__JS           = "() => Promise.resolve(window.renderDone).then(() => true)"  # the web_root pages set window.renderDone to the current render's promise (pages without it are ready straight away)
+
+
+class Playwright__Render__Ready(Type_Safe):                                 # waits for a page's own 'render done' signal (instead of sleeping for a fixed time)
+    timeout : float = PLAYWRIGHT__RENDER_TIMEOUT
+
+    async def wait_for_render(self, page, timeout: float = None):           # raises asyncio.TimeoutError if the render is not done in time, and the page's error if the render failed
+        return await asyncio.wait_for(page.evaluate(RENDER_READY__JS), self.timeout_value(timeout))
+
+    async def wait_for_selector(self, page, selector: str, timeout: float = None):
+        return await page.wait_for_selector(selector, timeout=self.timeout_value(timeout) * 1000)      # (playwright's timeouts are in milliseconds)
+
+    def timeout_value(self, timeout: float = None) -> float:
+        return self.timeout if timeout is None else timeout
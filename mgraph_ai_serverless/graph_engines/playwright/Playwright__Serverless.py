@@ -1,49 +1,114 @@
+import time
 from osbot_utils.utils.Files import file_exists
+from osbot_utils.utils.Env   import get_env
 
-from osbot_utils.type_safe.Type_Safe                import Type_Safe
-from osbot_playwright.playwright.api.Playwright_CLI import Playwright_CLI
-from playwright.async_api                           import async_playwright, Playwright, Browser, Page, Response
-from osbot_utils.decorators.methods.cache_on_self   import cache_on_self
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_playwright.playwright.api.Playwright_CLI                             import Playwright_CLI
+from playwright.async_api                                                       import Playwright, Browser, BrowserContext, Page, Response
+from osbot_utils.decorators.methods.cache_on_self                               import cache_on_self
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager import playwright__browser_manager
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Render__Ready     import Playwright__Render__Ready
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Scheduler  import playwright__page_scheduler
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets    import web_root__assets
 
 #LINUX__PLAYWRIGHT__CHROME__PATH = '/root/.cache/ms-playwright/chromium-1148/chrome-linux/chrome'  # todo: find better way to handle this, the problem was that we were installing chrome during the docker setup, but that was not picked up by the playwright process
 LINUX__PLAYWRIGHT__CHROME__PATH = '/opt/playwright/chromium-1148/chrome-linux/chrome'
 
-class Playwright__Serverless(Type_Safe):
-    browser        : Browser             = None
-    page           : Page                = None
-    playwright     : Playwright          = None
-    playwright_cli : Playwright_CLI
-    response       : Response            = None
-    screenshot     : bytes               = None
+PLAYWRIGHT__CHROMIUM__ARGS          = ["--disable-gpu", "--no-zygote", "--disable-dev-shm-usage"]    # lambda safe: no zygote (forking) process, and no /dev/shm (which is only 64Mb there)
+PLAYWRIGHT__CHROMIUM__ARGS__LAMBDA  = ["--single-process"]                                        # lambda can't start chromium's sandboxed renderer processes (so pages share the browser process there)
+
+class Playwright__Serverless(Type_Safe):                                    # one per request: its pages live in their own browser context, in the process wide (warm) browser
+    browser         : Browser             = None
+    context         : BrowserContext      = None
+    deadline        : float                                                 # (time.monotonic) set when the page slot is acquired, every browser call after it is bounded by it (0: no deadline)
+    page            : Page                = None
+    page_slot       : bool                                                  # holds one of the page scheduler's slots (from new_page, or acquire_page_slot, until stop/close)
+    playwright      : Playwright          = None
+    playwright_cli  : Playwright_CLI
+    render_ready    : Playwright__Render__Ready
+    response        : Response            = None
+    screenshot      : bytes               = None
+    browser_manager = playwright__browser_manager
+    page_scheduler  = playwright__page_scheduler
+    web_root_assets = web_root__assets                                      # serves WEB_ROOT__URL (the web_root pages) from memory
 
     async def new_page(self):
-        browser   = await self.launch()
-        self.page = await browser.new_page()
+        if self.page_slot is False:
+            await self.browser_manager.run_async(self.page_slot__acquire())
+        if self.context is None:
+            self.context = await self.on_browser_loop(self.browser_manager.new_context(self.browser__launch_kwargs))
+            await self.on_browser_loop(self.web_root_assets.route_context(self.context))
+        self.page = await self.on_browser_loop(self.context.new_page())
         return self.page
 
-    async def goto(self, url) -> Response:
-        self.response = await self.page.goto(url)
+    async def goto(self, url, wait_until: str = None) -> Response:          # wait_until: load (default), domcontentloaded, networkidle or commit
+        self.response = await self.on_browser_loop(self.page.goto(url, wait_until=wait_until))
         return self.response
 
     async def launch(self):
         if self.browser is None:
-            playwright   = await self.start()
-            self.browser = await playwright.chromium.launch(**self.browser__launch_kwargs())
+            self.browser = await self.on_browser_loop(self.browser_manager.get_browser(self.browser__launch_kwargs))
         return self.browser
 
     async def start(self) -> Playwright:
         if self.playwright is None:
-            self.playwright = await async_playwright().start()
+            self.playwright = await self.on_browser_loop(self.browser_manager.start_playwright())
         return self.playwright
 
-    async def stop(self):
-        if self.playwright:
-            await self.playwright.stop()
+    async def stop(self):                                                   # closes this request's context (and its pages), the browser stays up for the next request
+        if self.context or self.page_slot:
+            await self.browser_manager.run_async(self.release())
+
+    def close(self):                                                        # same as stop, from sync code (i.e. after a Flow's run)
+        if self.context or self.page_slot:
+            self.browser_manager.run(self.release())
+
+    def acquire_page_slot(self):                                            # from sync code (i.e. before a Flow's run), raises TimeoutError if the page queue is full
+        if self.page_slot is False:
+            self.browser_manager.run(self.page_slot__acquire())
+
+    def check_deadline(self):                                               # raises TimeoutError if this request ran out of time (the Flows only log their tasks' errors)
+        if self.deadline and time.monotonic() > self.deadline:
+            self.page_scheduler.timed_out += 1
+            raise self.page_scheduler.timeout_error()
+
+    async def page_slot__acquire(self):                                     # (runs in the browser manager's loop)
+        await self.page_scheduler.acquire()
+        self.page_slot = True
+        self.deadline  = time.monotonic() + self.page_scheduler.request_timeout
+
+    async def release(self):                                                # (runs in the browser manager's loop) closes the context and frees the page slot
+        context, self.context, self.page = self.context, None, None
+        if context:
+            await self.browser_manager.close_context(context)
+        if self.page_slot:
+            self.page_slot = False
+            self.deadline  = 0.0
+            self.page_scheduler.completed += 1
+            self.page_scheduler.release()
 
     async def screenshot_bytes(self, full_page=False, path=None, **kwargs):
-        self.screenshot = await self.page.screenshot(full_page=full_page, path=path, **kwargs)
+        self.screenshot = await self.on_browser_loop(self.page.screenshot(full_page=full_page, path=path, **kwargs))
         return self.screenshot
 
+    async def page_content(self) -> str:
+        return await self.on_browser_loop(self.page.content())
+
+    async def page_evaluate(self, js_code: str):
+        return await self.on_browser_loop(self.page.evaluate(js_code))
+
+    async def page_pdf(self, **kwargs) -> bytes:
+        return await self.on_browser_loop(self.page.pdf(**kwargs))
+
+    async def wait_for_render(self, timeout: float = None):                 # waits for the page's window.renderDone (set by the web_root pages)
+        return await self.on_browser_loop(self.render_ready.wait_for_render(self.page, timeout))
+
+    async def wait_for_selector(self, selector: str, timeout: float = None):
+        return await self.on_browser_loop(self.render_ready.wait_for_selector(self.page, selector, timeout))
+
+    async def on_browser_loop(self, coroutine):                             # the playwright objects can only be used from the browser manager's event loop
+        return await self.browser_manager.run_async(self.page_scheduler.with_deadline(coroutine, self.deadline or None))
+
     # sync methods
 
     def browser__exists(self):
@@ -54,8 +119,11 @@ class Playwright__Serverless(Type_Safe):
             return self.playwright_cli.install__chrome()            #       and                   : /root/.cache/ms-playwright/ffmpeg-1010
         return True
 
-    def browser__launch_kwargs(self):
-        return dict(args=["--disable-gpu", "--single-process"],
+    def browser__launch_kwargs(self):                               # (--single-process only on lambda, elsewhere concurrent pages get their own renderer processes)
+        args = list(PLAYWRIGHT__CHROMIUM__ARGS)
+        if get_env('AWS_LAMBDA_FUNCTION_NAME'):
+            args += PLAYWRIGHT__CHROMIUM__ARGS__LAMBDA
+        return dict(args=args,
                     executable_path=self.chrome_path())
 
     @cache_on_self
@@ -1,14 +1,18 @@
-from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless import Playwright__Serverless
-from osbot_utils.type_safe.Type_Safe                import Type_Safe
-from osbot_utils.helpers.flows.decorators.task      import task
-from playwright.async_api                           import Browser
-from osbot_utils.helpers.flows.Flow                 import Flow
-from osbot_utils.helpers.flows.decorators.flow      import flow
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless    import Playwright__Serverless
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Render__Ready import PLAYWRIGHT__RENDER_TIMEOUT
+from osbot_utils.type_safe.Type_Safe                                         import Type_Safe
+from osbot_utils.helpers.flows.decorators.task                               import task
+from playwright.async_api                                                    import Browser
+from osbot_utils.helpers.flows.Flow                                          import Flow
+from osbot_utils.helpers.flows.decorators.flow                               import flow
 
 class Flow__Playwright__Get_Page_Html(Type_Safe):
 
     playwright_serverless : Playwright__Serverless
-    url                   : str = 'https://www.google.com'
+    url                   : str   = 'https://www.google.com'
+    wait_until            : str   = 'load'                                  # see Model__Page__Wait_Until (i.e. networkidle for pages that fetch their content)
+    wait_for_selector     : str   = None                                    # css selector that must be on the page before its html is read
+    render_timeout        : float = PLAYWRIGHT__RENDER_TIMEOUT
 
     @task()
     def check_config(self) -> Browser:
@@ -26,11 +30,13 @@ class Flow__Playwright__Get_Page_Html(Type_Safe):
     @task()
     async def open_url(self) -> Browser:
         print(f"opening url: {self.url}")
-        await self.playwright_serverless.goto(self.url)
+        await self.playwright_serverless.goto(self.url, wait_until=self.wait_until)
+        if self.wait_for_selector:
+            await self.playwright_serverless.wait_for_selector(self.wait_for_selector, timeout=self.render_timeout)
 
     @task()
     async def print_html(self, flow_data: dict) -> Browser:
-        page_content = await self.playwright_serverless.page.content()
+        page_content = await self.playwright_serverless.page_content()
         flow_data['page_content'] = page_content
         print(f"got page content with size: {len(page_content)}")
 
@@ -44,6 +50,11 @@ class Flow__Playwright__Get_Page_Html(Type_Safe):
         return 'all done'
 
     def run(self):
-        with self.flow_playwright__get_page_html() as _:
-            _.execute_flow()
-            return _.data
\ No newline at end of file
+        try:
+            self.playwright_serverless.acquire_page_slot()                  # waits (in arrival order) for a free page in the shared browser, raises TimeoutError if the queue is full
+            with self.flow_playwright__get_page_html() as _:
+                _.execute_flow()
+                self.playwright_serverless.check_deadline()                 # raises TimeoutError if the flow ran out of time
+                return _.data
+        finally:
+            self.playwright_serverless.close()                              # closes this run's browser context and frees its page slot (the browser is kept for the next run)
\ No newline at end of file
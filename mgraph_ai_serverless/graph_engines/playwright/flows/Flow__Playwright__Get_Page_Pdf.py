@@ -1,16 +1,20 @@
-from osbot_utils.type_safe.Type_Safe import Type_Safe
-
-from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless import Playwright__Serverless
-from osbot_utils.utils.Misc                                     import bytes_to_base64
-from osbot_utils.helpers.flows.decorators.task                  import task
-from playwright.async_api                                       import Browser
-from osbot_utils.helpers.flows.Flow                             import Flow
-from osbot_utils.helpers.flows.decorators.flow                  import flow
+import asyncio
+from osbot_utils.type_safe.Type_Safe                                         import Type_Safe
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless    import Playwright__Serverless
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Render__Ready import PLAYWRIGHT__RENDER_TIMEOUT
+from osbot_utils.utils.Misc                                                  import bytes_to_base64
+from osbot_utils.helpers.flows.decorators.task                               import task
+from playwright.async_api                                                    import Browser
+from osbot_utils.helpers.flows.Flow                                          import Flow
+from osbot_utils.helpers.flows.decorators.flow                               import flow
 
 class Flow__Playwright__Get_Page_Pdf(Type_Safe):             # refactor with Flow__Playwright__Get_Page_Html since 90% of the code is the same
 
     playwright_serverless : Playwright__Serverless
-    url                   : str = 'https://httpbin.org/get'
+    url                   : str   = 'https://httpbin.org/get'
+    wait_until            : str   = 'load'                                  # see Model__Page__Wait_Until (i.e. networkidle for pages that fetch their content)
+    wait_for_selector     : str   = None                                    # css selector that must be on the page before the pdf is printed
+    render_timeout        : float = PLAYWRIGHT__RENDER_TIMEOUT
 
     @task()
     def check_config(self) -> Browser:
@@ -28,13 +32,22 @@ class Flow__Playwright__Get_Page_Pdf(Type_Safe):             # refactor with Flo
     @task()
     async def open_url(self) -> Browser:
         print(f"opening url: {self.url}")
-        await self.playwright_serverless.goto(self.url)
-        import asyncio
-        await asyncio.sleep(1)
+        await self.playwright_serverless.goto(self.url, wait_until=self.wait_until)
+        if self.wait_for_selector:
+            await self.playwright_serverless.wait_for_selector(self.wait_for_selector, timeout=self.render_timeout)
+        await self.wait_for_render()
+
+    async def wait_for_render(self):                                        # the web_root pages set window.renderDone (other pages are ready once loaded)
+        try:
+            await self.playwright_serverless.wait_for_render(timeout=self.render_timeout)
+        except asyncio.TimeoutError:
+            print(f"page did not signal render done after {self.render_timeout} seconds")
+        except Exception as error:
+            print(f"Error rendering page: {error}")
 
     @task()
     async def capture_pdf(self, flow_data: dict) -> Browser:
-        pdf_bytes = await self.playwright_serverless.page.pdf(print_background=True)
+        pdf_bytes = await self.playwright_serverless.page_pdf(print_background=True)
         flow_data['pdf_bytes'] = pdf_bytes
         print(f"got pdf_bytes with size: {len(pdf_bytes)}")
 
@@ -56,6 +69,11 @@ class Flow__Playwright__Get_Page_Pdf(Type_Safe):             # refactor with Flo
         return 'all done'
 
     def run(self):
-        with self.flow_playwright__get_page_pdf() as _:
-            _.execute_flow()
-            return _.data
\ No newline at end of file
+        try:
+            self.playwright_serverless.acquire_page_slot()                  # waits (in arrival order) for a free page in the shared browser, raises TimeoutError if the queue is full
+            with self.flow_playwright__get_page_pdf() as _:
+                _.execute_flow()
+                self.playwright_serverless.check_deadline()                 # raises TimeoutError if the flow ran out of time
+                return _.data
+        finally:
+            self.playwright_serverless.close()                              # closes this run's browser context and frees its page slot (the browser is kept for the next run)
\ No newline at end of file
@@ -0,0 +1,9 @@
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+
+
+class Model__Page_Pool__Renderer(Type_Safe):                                # a page that is loaded once (with its JS library), and then renders many diagrams
+    target_url : str                                                        # page with the renderer library (pages are pooled per target_url)
+    prepare_js : str   = None                                               # runs once after the page is loaded
+    render_js  : str                                                        # function that receives the diagram (as its only argument) and renders it (if it returns a promise, it is awaited)
+    reset_js   : str   = None                                               # runs after each render, so that the next one starts from a clean page
+    wait_for   : float = 0.0                                                # extra seconds to wait after render_js (only for renderers that can't signal when they are done)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+class Model__Page__Wait_Until(str, Enum):                                   # when page.goto considers the navigation done
+    load             = 'load'                # the load event (default)
+    domcontentloaded = 'domcontentloaded'    # the DOMContentLoaded event
+    networkidle      = 'networkidle'         # no network requests for 500ms (for pages that fetch their content)
+    commit           = 'commit'              # the response was received (nothing rendered yet)
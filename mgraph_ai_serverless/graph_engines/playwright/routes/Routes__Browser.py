@@ -1,16 +1,21 @@
 import io
 
-from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless                       import Playwright__Serverless
-from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Html        import Flow__Playwright__Get_Page_Html
-from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Pdf         import Flow__Playwright__Get_Page_Pdf
-from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Screenshot  import Flow__Playwright__Get_Page_Screenshot
-from osbot_fast_api.api.Fast_API_Routes                                                         import Fast_API_Routes
-from starlette.responses                                                                        import StreamingResponse
-
-ROUTES__EXPECTED_PATHS__BROWSER = ['/browser/install-browser' ,
-                                   '/browser/url-html'        ,
-                                   '/browser/url-pdf'         ,
-                                   '/browser/url-screenshot'  ]
+from osbot_fast_api.api.Fast_API_Routes                                           import Fast_API_Routes
+from fastapi                                                                      import HTTPException
+from starlette.responses                                                          import StreamingResponse
+from starlette.status                                                             import HTTP_503_SERVICE_UNAVAILABLE
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager   import playwright__browser_manager
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool         import playwright__page_pool
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Scheduler    import playwright__page_scheduler
+from mgraph_ai_serverless.graph_engines.playwright.models.Model__Page__Wait_Until import Model__Page__Wait_Until
+
+ROUTES__EXPECTED_PATHS__BROWSER = ['/browser/browser-status'      ,
+                                   '/browser/install-browser'     ,
+                                   '/browser/page-pool-stats'     ,
+                                   '/browser/page-scheduler-stats',
+                                   '/browser/url-html'            ,
+                                   '/browser/url-pdf'             ,
+                                   '/browser/url-screenshot'      ]
 
 class Routes__Browser(Fast_API_Routes):
     tag : str = 'browser'
@@ -21,18 +26,25 @@ class Routes__Browser(Fast_API_Routes):
     #     result             = playwright_browser.browser__install()
     #     return dict(status=result)
 
-    def url_html(self, url="https://httpbin.org/get"):
+    def url_html(self, url="https://httpbin.org/get", wait_until: Model__Page__Wait_Until = Model__Page__Wait_Until.load, wait_for_selector: str = None):
         #self.install_browser()                                              # todo: BUG: for now, put the check there to make sure the browser is installed
+        from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Html import Flow__Playwright__Get_Page_Html    # playwright is only imported on first use
         with Flow__Playwright__Get_Page_Html() as _:
-            _.url = url
-            result = _.run()
+            _.url               = url
+            _.wait_until        = wait_until.value
+            _.wait_for_selector = wait_for_selector
+            result = self.run_flow(_)
             return result
 
-    def url_pdf(self, url="https://httpbin.org/get", return_file:bool=False):           # todo: refactor with url_screenshot
+    def url_pdf(self, url="https://httpbin.org/get", return_file:bool=False,                                   # todo: refactor with url_screenshot
+                wait_until: Model__Page__Wait_Until = Model__Page__Wait_Until.load, wait_for_selector: str = None):
         #self.install_browser()                                                          # todo:  BUG: for now, put the check there to make sure the browser is installed
+        from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Pdf import Flow__Playwright__Get_Page_Pdf
         with Flow__Playwright__Get_Page_Pdf() as _:
-            _.url = url
-            run_data   =_.run()
+            _.url               = url
+            _.wait_until        = wait_until.value
+            _.wait_for_selector = wait_for_selector
+            run_data   = self.run_flow(_)
             pdf_bytes  = run_data.get('pdf_bytes' )
             pdf_base64 = run_data.get('pdf_base64')
 
@@ -46,11 +58,15 @@ class Routes__Browser(Fast_API_Routes):
 
             return response
 
-    def url_screenshot(self, url="https://httpbin.org/get", return_file:bool=False):
+    def url_screenshot(self, url="https://httpbin.org/get", return_file:bool=False,
+                       wait_until: Model__Page__Wait_Until = Model__Page__Wait_Until.load, wait_for_selector: str = None):
         #self.install_browser()                                                           # todo:  BUG: for now, put the check there to make sure the browser is installed
+        from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Screenshot import Flow__Playwright__Get_Page_Screenshot
         with Flow__Playwright__Get_Page_Screenshot() as _:
-            _.url = url
-            run_data = _.run()
+            _.url               = url
+            _.wait_until        = wait_until.value
+            _.wait_for_selector = wait_for_selector
+            run_data = self.run_flow(_)
             screenshot_base64 = run_data.get('screenshot_base64')
             screenshot_bytes  = run_data.get('screenshot_bytes')
             if return_file:
@@ -63,15 +79,35 @@ class Routes__Browser(Fast_API_Routes):
 
             return response
 
+    def run_flow(self, flow):
+        try:
+            return flow.run()
+        except TimeoutError as timeout_error:                                   # no free page in time (see the page scheduler), or the request timed out
+            raise HTTPException(status_code = HTTP_503_SERVICE_UNAVAILABLE,
+                                detail      = timeout_error.args[0]        )
+
+    def browser_status(self):                                                   # the shared (warm) browser: launches, open contexts and last error
+        return playwright__browser_manager.status()
+
+    def page_pool_stats(self):                                                  # mermaid/cytoscape pages kept loaded between renders
+        return playwright__page_pool.stats()
+
+    def page_scheduler_stats(self):                                             # pages working (and queued) in the shared browser
+        return playwright__page_scheduler.stats()
+
     def chrome_path(self):
+        from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless import Playwright__Serverless
         return Playwright__Serverless().chrome_path()
 
     def setup_routes(self):
-        self.add_route_get(self.url_html        )
-        self.add_route_get(self.url_pdf         )
-        self.add_route_get(self.url_screenshot  )
-        #self.add_route_get(self.install_browser )
-        self.add_route_get(self.chrome_path     )
+        self.add_route_get(self.url_html            )
+        self.add_route_get(self.url_pdf             )
+        self.add_route_get(self.url_screenshot      )
+        #self.add_route_get(self.install_browser     )
+        self.add_route_get(self.chrome_path         )
+        self.add_route_get(self.browser_status      )
+        self.add_route_get(self.page_pool_stats     )
+        self.add_route_get(self.page_scheduler_stats)
 
         # self.add_route_get(self.launch_browser)
         # self.add_route_get(self.new_page      )
@@ -1,5 +1,7 @@
 import io
+from fastapi                                                                     import HTTPException
 from starlette.responses                                                         import StreamingResponse, Response
+from starlette.status                                                            import HTTP_503_SERVICE_UNAVAILABLE
 from mgraph_ai_serverless.graph_engines.playwright.models.Model__Render__Mermaid import Model__Render__Mermaid
 from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Render     import Web_Root__Render
 from osbot_fast_api.api.Fast_API_Routes                                          import Fast_API_Routes
@@ -10,7 +12,7 @@ class Routes__Web_Root(Fast_API_Routes):
 
     def render_file(self, target_page = 'examples/hello-world.html'):
         target_url = self.web_root_render.target_url(target_page=target_page)
-        run_data   = self.web_root_render.render_page(target_url)
+        run_data   = self.render(self.web_root_render.render_page, target_url)
         screenshot_bytes = run_data.get('screenshot_bytes')
 
         screenshot_stream = io.BytesIO(screenshot_bytes)
@@ -20,19 +22,7 @@ class Routes__Web_Root(Fast_API_Routes):
         return response
 
     def render_mermaid(self, render_mermaid: Model__Render__Mermaid) -> Response:
-
-        js_code = f"""
-                    new_graph = `{render_mermaid.mermaid_code}`
-                    document.querySelector('.mermaid').innerHTML = new_graph
-                        document.querySelector('.mermaid').removeAttribute('data-processed');
-                    
-                    mermaid.init(undefined, ".mermaid");
-                    """
-
-        target_url = self.web_root_render.target_url('mermaid/index.html')
-        run_data = self.web_root_render.render_page(target_url, js_code=js_code)
-        screenshot_bytes = run_data.get('screenshot_bytes')
-
+        screenshot_bytes  = self.render(self.web_root_render.render__mermaid, render_mermaid.mermaid_code)     # uses the page pool (when enabled)
         screenshot_stream = io.BytesIO(screenshot_bytes)
         response = StreamingResponse(screenshot_stream,
                                      media_type="image/png",
@@ -47,7 +37,7 @@ class Routes__Web_Root(Fast_API_Routes):
                    """
 
         target_url = self.web_root_render.target_url(target_page=target_page)
-        run_data   = self.web_root_render.render_page(target_url, js_code=js_code)
+        run_data   = self.render(self.web_root_render.render_page, target_url, js_code=js_code)
         screenshot_bytes = run_data.get('screenshot_bytes')
 
         screenshot_stream = io.BytesIO(screenshot_bytes)
@@ -57,6 +47,13 @@ class Routes__Web_Root(Fast_API_Routes):
         return response
 
 
+    def render(self, render_method, *args, **kwargs):
+        try:
+            return render_method(*args, **kwargs)
+        except TimeoutError as timeout_error:                                   # no free page in time (see the page scheduler), or the render timed out
+            raise HTTPException(status_code = HTTP_503_SERVICE_UNAVAILABLE,
+                                detail      = timeout_error.args[0]        )
+
     def setup_routes(self):
         self.add_route_get (self.render_file   )
         self.add_route_get (self.render_js     )
@@ -0,0 +1,130 @@
+import hashlib
+import os
+from urllib.parse                    import urlsplit, unquote
+from urllib.request                  import urlopen
+import mgraph_ai_serverless
+from osbot_utils.type_safe.Type_Safe import Type_Safe
+from osbot_utils.utils.Env           import get_env
+from osbot_utils.utils.Files         import path_combine
+
+PLAYWRIGHT__WEB_ROOT__IN_PROCESS = get_env('MGRAPH__PLAYWRIGHT__WEB_ROOT__IN_PROCESS', 'true').lower() == 'true'    # serve the web_root pages to chromium from the package files (false: over http, from the /static route)
+
+WEB_ROOT__URL  = 'http://web-root.local/'                                   # not a real host: every request to it is intercepted (and answered from the package files)
+WEB_ROOT__PATH = path_combine(mgraph_ai_serverless.path, 'web_root')
+WEB_ROOT__LIBS = { 'lib/mermaid/mermaid.min.js'     : 'https://cdn.jsdelivr.net/npm/mermaid@11.4.1/dist/mermaid.min.js'           ,     # vendored js libraries (pinned), with the url they are vendored from
+                   'lib/cytoscape/cytoscape.min.js' : 'https://cdnjs.cloudflare.com/ajax/libs/cytoscape/3.30.4/cytoscape.min.js' }
+WEB_ROOT__LIBS__SHA256SUMS = 'lib/SHA256SUMS'                               # pinned sha256 of each library (sha256sum format), committed with the libraries (see pin_libs)
+WEB_ROOT__ASSET_TYPES = { '.html' : 'text/html'              ,              # allow-list of the file types served (with their content type), so that i.e. .py files are never served
+                          '.js'   : 'text/javascript'        ,
+                          '.css'  : 'text/css'               ,
+                          '.json' : 'application/json'       ,
+                          '.svg'  : 'image/svg+xml'          ,
+                          '.png'  : 'image/png'              }
+
+
+class Web_Root__Assets(Type_Safe):                                          # answers chromium's requests for the web_root pages (and their js libraries) from memory, so renders need no network or http hop
+    web_root       : str = WEB_ROOT__PATH
+    assets         : dict                                                   # path -> (bytes, content_type), each file is only read once per process
+    assets_served  : int
+
+    def asset(self, path: str):                                             # returns None for files that don't exist, are outside web_root or are not an allowed type
+        asset = self.assets.get(path)
+        if asset is None:
+            file_path = self.file_path(path)
+            if file_path is None:
+                return None
+            with open(file_path, 'rb') as file:
+                asset = self.assets[path] = (file.read(), self.content_type(path))
+        return asset
+
+    def file_path(self, path: str):
+        if self.content_type(path) is None:
+            return None
+        web_root  = os.path.realpath(self.web_root)
+        file_path = os.path.realpath(os.path.join(web_root, path))
+        if file_path.startswith(web_root + os.sep) and os.path.isfile(file_path):       # (no ../ escapes)
+            return file_path
+
+    def content_type(self, path: str):                                      # None for the file types that are not served
+        return WEB_ROOT__ASSET_TYPES.get(os.path.splitext(path)[1].lower())
+
+    def url_path(self, url: str) -> str:
+        return unquote(urlsplit(url).path).lstrip('/')
+
+    def vendor_libs(self):                                                  # (required packaging step, see the Dockerfile) downloads the libraries that are not in web_root/lib yet and checks all of them against their pinned sha256
+        pins     = self.lib_pins()
+        vendored = []
+        for path in self.missing_libs():
+            lib_bytes = self.download_lib(path)
+            self.check_lib(path, lib_bytes, pins)                           # (before writing, so a bad download is never left in web_root)
+            self.save_lib (path, lib_bytes)
+            vendored.append(path)
+        for path in WEB_ROOT__LIBS:
+            self.check_lib(path, self.lib_bytes(path), pins)
+        return vendored
+
+    def pin_libs(self):                                                     # (run once, with network access, when a library version changes) downloads the missing libraries and writes their sha256 to SHA256SUMS, commit both
+        for path in self.missing_libs():
+            self.save_lib(path, self.download_lib(path))
+        pins = {path: hashlib.sha256(self.lib_bytes(path)).hexdigest() for path in WEB_ROOT__LIBS}
+        with open(os.path.join(self.web_root, WEB_ROOT__LIBS__SHA256SUMS), 'w') as file:
+            file.write(''.join(f'{sha256}  {os.path.relpath(path, "lib")}\n' for path, sha256 in pins.items()))
+        return pins
+
+    def lib_pins(self) -> dict:                                             # path -> pinned sha256
+        sha256sums = os.path.join(self.web_root, WEB_ROOT__LIBS__SHA256SUMS)
+        if os.path.isfile(sha256sums) is False:
+            raise FileNotFoundError(f"web_root libraries are not pinned: {WEB_ROOT__LIBS__SHA256SUMS} is missing (see Web_Root__Assets.pin_libs)")
+        pins = {}
+        with open(sha256sums) as file:
+            for line in file:
+                if line.strip():
+                    sha256, file_name = line.split(maxsplit=1)
+                    pins[os.path.join('lib', file_name.strip())] = sha256
+        return pins
+
+    def check_lib(self, path: str, lib_bytes: bytes, pins: dict):
+        if path not in pins:
+            raise ValueError(f"web_root library is not pinned: {path} (see Web_Root__Assets.pin_libs)")
+        sha256 = hashlib.sha256(lib_bytes).hexdigest()
+        if sha256 != pins[path]:
+            raise ValueError(f"web_root library sha256 mismatch for {path}: expected {pins[path]} but got {sha256}")
+
+    def download_lib(self, path: str) -> bytes:
+        with urlopen(WEB_ROOT__LIBS[path]) as response:
+            return response.read()
+
+    def save_lib(self, path: str, lib_bytes: bytes):
+        file_path = os.path.join(self.web_root, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(lib_bytes)
+
+    def lib_bytes(self, path: str) -> bytes:
+        with open(os.path.join(self.web_root, path), 'rb') as file:
+            return file.read()
+
+    def missing_libs(self) -> list:
+        return [path for path in WEB_ROOT__LIBS if os.path.isfile(os.path.join(self.web_root, path)) is False]
+
+    def stats(self):
+        return dict(assets_cached  = len(self.assets)    ,
+                    assets_served  = self.assets_served   ,
+                    missing_libs   = self.missing_libs()  )
+
+    # coroutines that run in the browser manager's loop
+
+    async def route_context(self, context):                                 # only WEB_ROOT__URL is intercepted, all other requests go to the network as usual
+        await context.route(WEB_ROOT__URL + '**', self.on_route)
+
+    async def on_route(self, route):
+        path  = self.url_path(route.request.url)
+        asset = self.asset(path)
+        if asset is None:
+            await route.fulfill(status=404, body=f'not found: {path}', content_type='text/plain')
+            return
+        body, content_type = asset
+        self.assets_served += 1
+        await route.fulfill(status=200, body=body, content_type=content_type)
+
+web_root__assets = Web_Root__Assets()                                       # one per process (shared by all browser contexts)
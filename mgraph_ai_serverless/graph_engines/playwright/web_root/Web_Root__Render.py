@@ -1,15 +1,41 @@
-from osbot_utils.utils.Json                                                                     import json_dumps
-from osbot_utils.utils.Http                                                                     import url_join_safe
-from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Screenshot  import Flow__Playwright__Get_Page_Screenshot
-from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
+from osbot_utils.utils.Json                                                          import json_dumps
+from osbot_utils.utils.Http                                                          import url_join_safe
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool            import playwright__page_pool
+from mgraph_ai_serverless.graph_engines.playwright.models.Model__Page_Pool__Renderer import Model__Page_Pool__Renderer
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets         import PLAYWRIGHT__WEB_ROOT__IN_PROCESS, WEB_ROOT__URL
 
 URL__LOCAL_SERVER = 'http://localhost:8080/static'
 
+PAGE_POOL__MERMAID__RENDER_JS    = """async (mermaid_code) => {
+                                        const element = document.querySelector('.mermaid');
+                                        element.removeAttribute('data-processed');
+                                        element.textContent = mermaid_code;                         // text (not html), mermaid decodes the entities
+                                        await mermaid.init(undefined, element);
+                                    }"""
+PAGE_POOL__MERMAID__PREPARE_JS   = "() => window.renderDone"                                        # the page's own (default) diagram
+PAGE_POOL__MERMAID__RESET_JS     = """() => {
+                                        const element = document.querySelector('.mermaid');
+                                        element.removeAttribute('data-processed');
+                                        element.textContent = '';
+                                        document.querySelectorAll('body > [id^="dmermaid"]').forEach(item => item.remove());   // left behind by failed renders
+                                    }"""
+PAGE_POOL__CYTOSCAPE__PREPARE_JS = """async () => {
+                                        await window.renderDone;
+                                        const state = cy.json();
+                                        delete state.elements;
+                                        window.page_pool__initial_state = state;                    // style, zoom and pan before any render
+                                    }"""
+PAGE_POOL__CYTOSCAPE__RENDER_JS  = "(cytoscape_json) => updateGraph(JSON.parse(cytoscape_json))"
+PAGE_POOL__CYTOSCAPE__RESET_JS   = "() => { cy.elements().remove(); cy.json(window.page_pool__initial_state); }"
+
 
 class Web_Root__Render(Type_Safe):
-    target_server = URL__LOCAL_SERVER
+    target_server = WEB_ROOT__URL if PLAYWRIGHT__WEB_ROOT__IN_PROCESS else URL__LOCAL_SERVER       # WEB_ROOT__URL is served from memory (see Web_Root__Assets)
+    page_pool     = playwright__page_pool                                   # used (when enabled) by render__mermaid and render__cytoscape
 
-    def render_page(self, target_url, js_code=None, wait_for=0):
+    def render_page(self, target_url, js_code=None, wait_for=0):            # the flow waits for the page's window.renderDone, wait_for is an extra (fixed) delay
+        from mgraph_ai_serverless.graph_engines.playwright.flows.Flow__Playwright__Get_Page_Screenshot import Flow__Playwright__Get_Page_Screenshot     # playwright is only imported on first use
         with Flow__Playwright__Get_Page_Screenshot() as _:
             _.url      = target_url
             _.js_code  = js_code
@@ -19,19 +45,23 @@ class Web_Root__Render(Type_Safe):
 
     def render__cytoscape(self, cytoscape_data):
         cytoscape_json = json_dumps(cytoscape_data)                         # Convert the Python dict to a JSON string
+        if self.page_pool.enabled:
+            return self.page_pool.render(self.renderer__cytoscape(), cytoscape_json)
         js_code          = f"updateGraph({cytoscape_json});"                     # Create JavaScript code to update the graph
         target_url       = self.target_url('cytoscape/index.html')
-        run_data         = self.render_page(target_url, js_code=js_code, wait_for=0.5)
+        run_data         = self.render_page(target_url, js_code=js_code)
         screenshot_bytes = run_data.get('screenshot_bytes')
         return screenshot_bytes
 
     def render__mermaid(self, mermaid_code):
+        if self.page_pool.enabled:
+            return self.page_pool.render(self.renderer__mermaid(), mermaid_code)
         js_code = f"""
                     new_graph = `{mermaid_code}`
                     document.querySelector('.mermaid').innerHTML = new_graph
                         document.querySelector('.mermaid').removeAttribute('data-processed');
                     
-                    mermaid.init(undefined, ".mermaid");
+                    window.renderDone = mermaid.init(undefined, ".mermaid");
                     """
 
         target_url       = self.target_url('mermaid/index.html')
@@ -39,5 +69,17 @@ class Web_Root__Render(Type_Safe):
         screenshot_bytes = run_data.get('screenshot_bytes')
         return screenshot_bytes
 
+    def renderer__cytoscape(self) -> Model__Page_Pool__Renderer:
+        return Model__Page_Pool__Renderer(target_url = self.target_url('cytoscape/index.html'),
+                                          prepare_js = PAGE_POOL__CYTOSCAPE__PREPARE_JS       ,
+                                          render_js  = PAGE_POOL__CYTOSCAPE__RENDER_JS        ,
+                                          reset_js   = PAGE_POOL__CYTOSCAPE__RESET_JS         )
+
+    def renderer__mermaid(self) -> Model__Page_Pool__Renderer:
+        return Model__Page_Pool__Renderer(target_url = self.target_url('mermaid/index.html'),
+                                          prepare_js = PAGE_POOL__MERMAID__PREPARE_JS       ,
+                                          render_js  = PAGE_POOL__MERMAID__RENDER_JS        ,
+                                          reset_js   = PAGE_POOL__MERMAID__RESET_JS         )
+
     def target_url(self, target_page='examples/hello-world.html'):
         return url_join_safe(self.target_server, target_page)
\ No newline at end of file
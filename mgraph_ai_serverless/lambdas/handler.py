@@ -1,11 +1,25 @@
-from mangum                                              import Mangum
-from osbot_utils.utils.Env                               import get_env
-from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Fast_API import MGraph_AI_Serverless__Fast_API
+from mangum                                                                     import Mangum
+from osbot_utils.utils.Env                                                      import get_env
+from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Engines                import mgraph_ai_serverless__engines, ENGINES__WARMUP
+from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Fast_API               import MGraph_AI_Serverless__Fast_API
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Pool     import matplotlib__render_pool
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager import playwright__browser_manager
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool       import playwright__page_pool
 
-fast_api__mgraph_ai_serverless = MGraph_AI_Serverless__Fast_API().setup()
+fast_api__mgraph_ai_serverless = MGraph_AI_Serverless__Fast_API().setup()          # the routes import their engines (matplotlib, playwright, ...) on first use
 app                  = fast_api__mgraph_ai_serverless.app()
 run                  = Mangum(app)
 
+if matplotlib__render_pool.enabled:                                                 # pre-warmed workers (each one imports matplotlib/networkx and loads the font cache)
+    app.add_event_handler('startup' , matplotlib__render_pool.start)                # on startup (not import), so the worker processes never start pools of their own
+    app.add_event_handler('shutdown', matplotlib__render_pool.stop )
+
+app.add_event_handler('shutdown', playwright__page_pool.stop      )                  # (handlers run in order: the pooled pages are closed before the browser)
+app.add_event_handler('shutdown', playwright__browser_manager.stop)                  # the browser is launched on first use, and then kept up (across requests and warm invocations)
+
+if ENGINES__WARMUP:
+    mgraph_ai_serverless__engines.warmup_start()                                    # so (in most cases) the engines are already loaded by the time the first render request arrives
+
 if __name__ == "__main__":                              # pragma: no cover
     import uvicorn
     port = get_env('PORT', 8080)
@@ -0,0 +1,33 @@
+import time
+import pytest
+from unittest                                                                           import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Libgvc     import Graphviz__Backend__Libgvc
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Subprocess import Graphviz__Backend__Subprocess
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot     import GRAPHVIZ__DOT__SAMPLE_GRAPH_1
+
+BENCH__ITERATIONS = 50
+
+# run with: pytest -s tests/benchmarks/graph_engines/graphviz/test__bench__Graphviz__Backends.py
+
+class test__bench__Graphviz__Backends(TestCase):
+
+    def render_ms(self, backend, output_format):                                        # average ms per render
+        backend.render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, output_format)                    # warm up (loads the plugins in libgvc)
+        start = time.perf_counter()
+        for _ in range(BENCH__ITERATIONS):
+            backend.render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, output_format)
+        return (time.perf_counter() - start) * 1000 / BENCH__ITERATIONS
+
+    def test_bench__subprocess_vs_libgvc(self):
+        backend__libgvc     = Graphviz__Backend__Libgvc    ()
+        backend__subprocess = Graphviz__Backend__Subprocess()
+        if backend__libgvc.is_available() is False:
+            pytest.skip("graphviz shared libraries (libgvc) are not installed")
+
+        print()
+        print(f"{'format':8} | {'subprocess (ms)':>16} | {'libgvc (ms)':>12} | {'speedup':>8}")
+        for output_format in ['svg', 'png', 'pdf']:
+            subprocess_ms = self.render_ms(backend__subprocess, output_format)
+            libgvc_ms     = self.render_ms(backend__libgvc    , output_format)
+            print(f"{output_format:8} | {subprocess_ms:16.2f} | {libgvc_ms:12.2f} | {subprocess_ms / libgvc_ms:7.1f}x")
+            assert libgvc_ms < subprocess_ms
@@ -0,0 +1,60 @@
+import random
+import time
+import tracemalloc
+import networkx as nx
+from unittest                                                                   import TestCase
+from mgraph_ai.providers.simple.MGraph__Simple                                  import MGraph__Simple
+from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib   import MGraph__Export__Matplotlib
+
+BENCH__NODES = 5_000
+BENCH__EDGES = 50_000
+
+# run with: pytest -s tests/benchmarks/graph_engines/matplotlib/test__bench__MGraph__Export__Matplotlib.py
+
+class test__bench__MGraph__Export__Matplotlib(TestCase):                        # networkx ingestion + nx.draw_networkx vs arrays + LineCollection/scatter
+
+    @classmethod
+    def setUpClass(cls):
+        mgraph_simple = MGraph__Simple()
+        random_edges  = random.Random(42)
+        with mgraph_simple.edit() as edit:
+            nodes = [edit.new_node(value=f'node {index}') for index in range(BENCH__NODES)]
+            for _ in range(BENCH__EDGES):
+                edit.new_edge(from_node_id = random_edges.choice(nodes).node_id,
+                              to_node_id   = random_edges.choice(nodes).node_id)
+        cls.exporter = MGraph__Export__Matplotlib(graph=mgraph_simple.graph)
+
+    def measure(self, target):                                                  # (result, ms, peak MB) - timed without tracemalloc, since it slows allocations down
+        start  = time.perf_counter()
+        result = target()
+        ms     = (time.perf_counter() - start) * 1000
+        tracemalloc.start()
+        target()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, ms, peak / 1024 / 1024
+
+    def draw__networkx(self, G, positions):
+        axes = self.exporter.create_figure((10, 10)).add_axes((0, 0, 1, 1))
+        nx.draw_networkx(G, pos=positions, ax=axes, with_labels=False, node_size=100)
+        axes.figure.canvas.draw()
+
+    def draw__arrays(self, graph_arrays, positions):
+        axes = self.exporter.create_figure((10, 10)).add_axes((0, 0, 1, 1))
+        self.exporter.draw_graph_arrays(axes, graph_arrays, positions, node_size=100, with_labels=False)
+        axes.figure.canvas.draw()
+
+    def test_bench__networkx_vs_arrays(self):
+        G           , networkx_ingest_ms, networkx_ingest_mb = self.measure(self.exporter.to_networkx)
+        graph_arrays, arrays_ingest_ms  , arrays_ingest_mb   = self.measure(self.exporter.to_arrays  )
+        positions__dict   = self.exporter.layout_positions        (G           , layout='circular')     # layout is not part of the comparison
+        positions__arrays = self.exporter.layout_positions__arrays(graph_arrays, layout='circular')
+        _, networkx_draw_ms, networkx_draw_mb = self.measure(lambda: self.draw__networkx(G           , positions__dict  ))
+        _, arrays_draw_ms  , arrays_draw_mb   = self.measure(lambda: self.draw__arrays  (graph_arrays, positions__arrays))
+
+        print()
+        print(f"{BENCH__NODES} nodes, {BENCH__EDGES} edges")
+        print(f"{'step':8} | {'networkx (ms)':>14} | {'arrays (ms)':>12} | {'networkx (MB)':>14} | {'arrays (MB)':>12}")
+        print(f"{'ingest':8} | {networkx_ingest_ms:14.1f} | {arrays_ingest_ms:12.1f} | {networkx_ingest_mb:14.1f} | {arrays_ingest_mb:12.1f}")
+        print(f"{'draw'  :8} | {networkx_draw_ms  :14.1f} | {arrays_draw_ms  :12.1f} | {networkx_draw_mb  :14.1f} | {arrays_draw_mb  :12.1f}")
+        assert arrays_ingest_mb < networkx_ingest_mb
@@ -0,0 +1,40 @@
+import random
+import time
+from unittest                                                                   import TestCase
+from mgraph_ai.providers.simple.MGraph__Simple                                  import MGraph__Simple
+from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib   import MGraph__Export__Matplotlib
+
+BENCH__GRAPHS = [(50, 80), (400, 800)]                                          # (nodes, edges)
+BENCH__MODES  = {'default (300 dpi)'  : dict(                    ),
+                 'max_pixels 1M'      : dict(max_pixels=1_000_000),
+                 'preview'            : dict(preview=True        )}
+
+# run with: pytest -s tests/benchmarks/graph_engines/matplotlib/test__bench__MGraph__Export__Matplotlib__Render_Modes.py
+
+class test__bench__MGraph__Export__Matplotlib__Render_Modes(TestCase):         # latency and PNG size per render mode (the layout is cached, so this is rasterization + encoding)
+
+    def exporter(self, node_count, edge_count):
+        mgraph_simple = MGraph__Simple()
+        random_edges  = random.Random(42)
+        with mgraph_simple.edit() as edit:
+            nodes = [edit.new_node(value=f'node {index}') for index in range(node_count)]
+            for _ in range(edge_count):
+                edit.new_edge(from_node_id = random_edges.choice(nodes).node_id,
+                              to_node_id   = random_edges.choice(nodes).node_id)
+        return MGraph__Export__Matplotlib(graph=mgraph_simple.graph)
+
+    def test_bench__render_modes(self):
+        print()
+        print(f"{'graph':14} | {'mode':18} | {'ms':>8} | {'bytes':>9} | {'saved':>6}")
+        for node_count, edge_count in BENCH__GRAPHS:
+            exporter = self.exporter(node_count, edge_count)
+            exporter.to_image(layout='spring', seed=42, dpi=10)                  # computes (and caches) the layout
+            default_bytes = None
+            for mode, render_kwargs in BENCH__MODES.items():
+                start       = time.perf_counter()
+                image_bytes = exporter.to_image(layout='spring', seed=42, **render_kwargs)
+                ms          = (time.perf_counter() - start) * 1000
+                default_bytes = default_bytes or len(image_bytes)
+                saved         = 1 - len(image_bytes) / default_bytes
+                print(f"{f'{node_count}n / {edge_count}e':14} | {mode:18} | {ms:8.1f} | {len(image_bytes):9} | {saved:6.0%}")
+                assert image_bytes.startswith(b'\x89PNG')
@@ -0,0 +1,50 @@
+import json
+import random
+import time
+import tracemalloc
+from unittest                                                                     import TestCase
+from mgraph_ai.providers.simple.MGraph__Simple                                    import MGraph__Simple
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render             import Matplotlib__Render
+from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib     import MGraph__Export__Matplotlib
+
+BENCH__GRAPHS = [(500, 1000), (2000, 4000)]                                    # (nodes, edges)
+
+# run with: pytest -s tests/benchmarks/graph_engines/matplotlib/test__bench__Matplotlib__Graph_Data__Reader.py
+
+class test__bench__Matplotlib__Graph_Data__Reader(TestCase):                    # graph_data -> arrays: fast path reader vs from_json (full domain graph) + to_arrays
+
+    def graph_data(self, node_count, edge_count):                               # (a json round trip, so the data is what a request body parses into)
+        mgraph_simple = MGraph__Simple()
+        random_edges  = random.Random(42)
+        with mgraph_simple.edit() as edit:
+            nodes = [edit.new_node(value=f'node {index}') for index in range(node_count)]
+            for _ in range(edge_count):
+                edit.new_edge(from_node_id = random_edges.choice(nodes).node_id,
+                              to_node_id   = random_edges.choice(nodes).node_id)
+        return json.loads(json.dumps(mgraph_simple.graph.json()))
+
+    def measure(self, target):                                                  # timed without tracemalloc (which slows down allocation heavy code a lot), then run again for the peak
+        start   = time.perf_counter()
+        result  = target()
+        ms      = (time.perf_counter() - start) * 1000
+        tracemalloc.start()
+        target()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, ms, peak / 1024 / 1024
+
+    def test_bench__read_vs_from_json(self):
+        fast_parse = Matplotlib__Render(fast_parse=True )
+        from_json  = Matplotlib__Render(fast_parse=False)
+        print()
+        print(f"{'graph':16} | {'path':10} | {'ms':>9} | {'peak MB':>8}")
+        for node_count, edge_count in BENCH__GRAPHS:
+            graph_data = self.graph_data(node_count, edge_count)
+            arrays_fast, ms_fast, peak_fast = self.measure(lambda: fast_parse.create_exporter(graph_data).to_arrays())
+            arrays_full, ms_full, peak_full = self.measure(lambda: MGraph__Export__Matplotlib(graph=from_json.create_graph_from_graph_data(graph_data)).to_arrays())
+            for path, ms, peak in (('from_json', ms_full, peak_full), ('reader', ms_fast, peak_fast)):
+                print(f"{f'{node_count}n / {edge_count}e':16} | {path:10} | {ms:9.1f} | {peak:8.2f}")
+            print(f"{'':16} | {'speedup':10} | {ms_full / ms_fast:8.1f}x | {peak_full / peak_fast:7.1f}x")
+            assert arrays_fast.node_ids       == arrays_full.node_ids
+            assert arrays_fast.labels         == arrays_full.labels
+            assert arrays_fast.edges.tolist() == arrays_full.edges.tolist()
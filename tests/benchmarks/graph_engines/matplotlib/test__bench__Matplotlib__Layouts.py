@@ -0,0 +1,46 @@
+import time
+import networkx as nx
+import numpy    as np
+from unittest                                                           import TestCase
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Layouts  import Matplotlib__Layouts
+
+BENCH__NODE_COUNTS       = [100, 1_000, 10_000, 100_000]
+BENCH__NETWORKX__LAYOUTS = {'spring': 2_000, 'spectral': 2_000}                  # networkx layouts are only timed up to this many nodes (they are quadratic / dense)
+BENCH__NUMPY__LAYOUTS    = ['force_grid', 'multilevel', 'spectral_sparse']
+
+# run with: pytest -s tests/benchmarks/graph_engines/matplotlib/test__bench__Matplotlib__Layouts.py
+
+class test__bench__Matplotlib__Layouts(TestCase):
+
+    def random_edges(self, node_count):                                         # a path (so the graph is connected) plus node_count random edges
+        rng  = np.random.default_rng(42)
+        path = np.column_stack([np.arange(node_count - 1), np.arange(1, node_count)])
+        return np.vstack([path, rng.integers(0, node_count, (node_count, 2))])
+
+    def layout_seconds(self, layout, node_count, edges):
+        start = time.perf_counter()
+        if layout in BENCH__NETWORKX__LAYOUTS:
+            graph = nx.Graph()
+            graph.add_nodes_from(range(node_count))
+            graph.add_edges_from(edges.tolist())
+            getattr(nx, f'{layout}_layout')(graph)
+        else:
+            Matplotlib__Layouts().layout(layout, node_count, edges, seed=42)
+        return time.perf_counter() - start
+
+    def test_bench__layouts(self):
+        layouts = list(BENCH__NETWORKX__LAYOUTS) + BENCH__NUMPY__LAYOUTS
+        print()
+        print(f"{'nodes':>8} | {'edges':>8} | " + ' | '.join(f'{layout + " (s)":>19}' for layout in layouts))
+        for node_count in BENCH__NODE_COUNTS:
+            edges = self.random_edges(node_count)
+            cells = []
+            for layout in layouts:
+                if node_count > BENCH__NETWORKX__LAYOUTS.get(layout, node_count):
+                    cells.append(f"{'-':>19}")
+                    continue
+                try:
+                    cells.append(f'{self.layout_seconds(layout, node_count, edges):19.3f}')
+                except ImportError:                                                 # networkx needs scipy for the larger graphs
+                    cells.append(f"{'(needs scipy)':>19}")
+            print(f'{node_count:8} | {len(edges):8} | ' + ' | '.join(cells))
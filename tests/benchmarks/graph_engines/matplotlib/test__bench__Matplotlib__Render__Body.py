@@ -0,0 +1,54 @@
+import json
+import time
+import tracemalloc
+from unittest                                                                       import TestCase
+from pydantic                                                                       import TypeAdapter
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Body         import Matplotlib__Render__Body, JSON__DECODER
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render import Model__Matplotlib__Render
+
+BENCH__PAYLOAD_MB = 10
+BENCH__NODE_TYPE  = 'mgraph_ai.providers.simple.schemas.Schema__Simple__Node.Schema__Simple__Node'
+BENCH__EDGE_TYPE  = 'mgraph_ai.mgraph.schemas.Schema__MGraph__Edge.Schema__MGraph__Edge'
+BENCH__GRAPH_TYPE = 'mgraph_ai.providers.simple.domain.Domain__Simple__Graph.Domain__Simple__Graph'
+
+# run with: pytest -s tests/benchmarks/graph_engines/matplotlib/test__bench__Matplotlib__Render__Body.py
+
+class test__bench__Matplotlib__Render__Body(TestCase):                          # request body -> Model__Matplotlib__Render: FastAPI's path (stdlib json + pydantic) vs the raw body path
+
+    def body(self, size_mb):                                                    # graph_data with the same shape as MGraph's graph.json() (built directly, since creating MGraph nodes is slow)
+        nodes, edges = {}, {}
+        index        = 0
+        while index == 0 or index % 1000 or len(json.dumps(dict(nodes=nodes, edges=edges))) < size_mb * 1024 * 1024:
+            node_id, edge_id = f'{index:08x}', f'e{index:07x}'
+            nodes[node_id]   = dict(node_data=dict(value=f'node {index}', name=f'Node {index}'), node_id=node_id, node_type=BENCH__NODE_TYPE)
+            edges[edge_id]   = dict(edge_config=dict(edge_id=edge_id), edge_data={}, edge_type=BENCH__EDGE_TYPE,
+                                    from_node_id=node_id, to_node_id=f'{index // 2:08x}')
+            index += 1
+        graph_data = dict(graph_type=BENCH__GRAPH_TYPE, model=dict(data=dict(nodes=nodes, edges=edges)))
+        return json.dumps(dict(graph_data=graph_data, layout='force_grid', preview=True)).encode()
+
+    def measure(self, target, body):
+        start   = time.perf_counter()
+        target(body)
+        ms      = (time.perf_counter() - start) * 1000
+        tracemalloc.start()
+        target(body)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return ms, peak / 1024 / 1024
+
+    def test_bench__decode(self):
+        body         = self.body(BENCH__PAYLOAD_MB)
+        type_adapter = TypeAdapter(Model__Matplotlib__Render)                   # what FastAPI validates the body model with
+        render_body  = Matplotlib__Render__Body()
+        paths        = {'fastapi (json + pydantic)'   : lambda data: type_adapter.validate_python(json.loads(data)),
+                        f'raw body ({JSON__DECODER})' : render_body.decode                                          }
+        print()
+        print(f"payload: {len(body) / 1024 / 1024:.1f} MB")
+        print(f"{'path':28} | {'ms':>8} | {'peak MB':>8}")
+        results = {}
+        for path, target in paths.items():
+            self.measure(target, body)                                          # warm up
+            results[path] = self.measure(target, body)
+            print(f"{path:28} | {results[path][0]:8.1f} | {results[path][1]:8.1f}")
+        assert render_body.decode(body).graph_data == type_adapter.validate_python(json.loads(body)).graph_data
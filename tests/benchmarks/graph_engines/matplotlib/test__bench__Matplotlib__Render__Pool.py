@@ -0,0 +1,60 @@
+import os
+import random
+import time
+from concurrent.futures                                                             import ThreadPoolExecutor
+from unittest                                                                       import TestCase
+from mgraph_ai.providers.simple.MGraph__Simple                                      import MGraph__Simple
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render               import Matplotlib__Render
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Pool         import Matplotlib__Render__Pool
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render import Model__Matplotlib__Render
+
+BENCH__RENDERS = 32
+BENCH__NODES   = 300
+BENCH__EDGES   = 600
+
+# run with: pytest -s tests/benchmarks/graph_engines/matplotlib/test__bench__Matplotlib__Render__Pool.py
+
+class test__bench__Matplotlib__Render__Pool(TestCase):                         # renders/second: threads in one process (GIL bound) vs a pool of 1..cpu_count worker processes
+
+    @classmethod
+    def setUpClass(cls):
+        cls.render_configs = [Model__Matplotlib__Render(graph_data=cls.graph_data(seed), layout='spring', seed=seed, dpi=100)     # different graphs, so the layout cache doesn't hide the work
+                              for seed in range(BENCH__RENDERS)]
+
+    @classmethod
+    def graph_data(cls, seed):
+        mgraph_simple = MGraph__Simple()
+        random_edges  = random.Random(seed)
+        with mgraph_simple.edit() as edit:
+            nodes = [edit.new_node(value=f'node {index}') for index in range(BENCH__NODES)]
+            for _ in range(BENCH__EDGES):
+                edit.new_edge(from_node_id = random_edges.choice(nodes).node_id,
+                              to_node_id   = random_edges.choice(nodes).node_id)
+        return mgraph_simple.graph.json()
+
+    def renders_per_second(self, render_graph, concurrency) -> float:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:           # same as FastAPI's threadpool calling the sync route
+            results = list(executor.map(render_graph, self.render_configs))
+        assert all(len(result) > 0 for result in results)
+        return BENCH__RENDERS / (time.perf_counter() - start)
+
+    def test_bench__threads_vs_pool(self):
+        cpu_count = os.cpu_count() or 1
+        in_process = Matplotlib__Render()
+        print()
+        print(f"{BENCH__RENDERS} renders of {BENCH__NODES} nodes / {BENCH__EDGES} edges, on {cpu_count} cores")
+        print(f"{'mode':20} | {'renders/s':>10} | {'speedup':>8}")
+        baseline = self.renders_per_second(in_process.render_graph, concurrency=cpu_count)                 # the pool is disabled by default
+        print(f"{'threads':20} | {baseline:10.2f} | {1:8.2f}")
+        workers = 1
+        while workers <= cpu_count:
+            render_pool = Matplotlib__Render__Pool(enabled=True, workers=workers)
+            try:
+                render_pool.start()
+                render_pool.render_graph(self.render_configs[0])                 # wait for the workers to be up (and warmed up)
+                throughput = self.renders_per_second(lambda render_config: render_pool.render_graph(render_config)[0], concurrency=workers * 2)
+            finally:
+                render_pool.stop()
+            print(f"{f'pool ({workers} workers)':20} | {throughput:10.2f} | {throughput / baseline:8.2f}")
+            workers *= 2
@@ -0,0 +1,42 @@
+import time
+from concurrent.futures                                                         import ThreadPoolExecutor
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool       import Playwright__Page__Pool
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Scheduler  import Playwright__Page__Scheduler
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets    import WEB_ROOT__URL
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Render    import Web_Root__Render
+
+BENCH__REQUESTS    = 24                                                         # concurrent mermaid renders per mode
+BENCH__CLIENTS     = 8                                                          # (threads, same as FastAPI's threadpool calling the sync routes)
+BENCH__MAX_PAGES   = [1, 2, 4, 8]
+
+# run with: pytest -s tests/benchmarks/graph_engines/playwright/test__bench__Playwright__Page__Scheduler.py
+
+class test__bench__Playwright__Page__Scheduler(TestCase):                      # throughput of concurrent renders in one (shared) browser vs max pages
+
+    def mermaid_code(self, index):
+        return f'graph TD\n    A{index} --> B{index}\n    A{index} --> C{index}\n    B{index} --> D{index}'
+
+    def test_bench__max_pages(self):
+        print()
+        print(f"{'max pages':>9} | {'renders/s':>9} | {'avg ms':>8} | {'p95 ms':>8} | scheduler")
+        for max_pages in BENCH__MAX_PAGES:
+            page_scheduler  = Playwright__Page__Scheduler(max_pages=max_pages)
+            page_pool       = Playwright__Page__Pool(enabled=True, size=max_pages, page_scheduler=page_scheduler)
+            web_root_render = Web_Root__Render(target_server=WEB_ROOT__URL, page_pool=page_pool)
+            page_pool.prefill(web_root_render.renderer__mermaid())             # (so that page loads are not part of the timings)
+
+            def render(index):
+                start            = time.perf_counter()
+                screenshot_bytes = web_root_render.render__mermaid(self.mermaid_code(index))
+                assert screenshot_bytes.startswith(b'\x89PNG')
+                return (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=BENCH__CLIENTS) as executor:
+                timings = sorted(executor.map(render, range(BENCH__REQUESTS)))
+            duration = time.perf_counter() - start
+            stats    = page_scheduler.stats()
+            print(f"{max_pages:9} | {BENCH__REQUESTS / duration:9.1f} | {sum(timings) / len(timings):8.1f} | {timings[int(len(timings) * 0.95) - 1]:8.1f} | "
+                  f"completed={stats['completed']} rejected={stats['rejected']} timed_out={stats['timed_out']}")
+            page_pool.stop()
@@ -0,0 +1,55 @@
+import time
+from unittest                                                                   import TestCase
+from osbot_fast_api.utils.Fast_API_Server                                       import Fast_API_Server
+from mgraph_ai_serverless.testing.mgraph_ai_serverless__objs_for_tests          import mgraph_ai_serverless__fast_api__app
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool       import Playwright__Page__Pool
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Render    import Web_Root__Render
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets    import WEB_ROOT__URL
+
+BENCH__DIAGRAMS = 10                                                            # diagrams rendered per renderer and mode
+
+# run with: pytest -s tests/benchmarks/graph_engines/playwright/test__bench__Web_Root__Render__Page_Pool.py
+
+class test__bench__Web_Root__Render__Page_Pool(TestCase):                      # per diagram latency: navigate + load the library every time vs pooled (pre-loaded) pages, with the pages served over http (/static) or in-process
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fast_api_server = Fast_API_Server(app=mgraph_ai_serverless__fast_api__app)
+        cls.fast_api_server.start()
+        cls.target_server   = f'http://localhost:{cls.fast_api_server.port}/static'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fast_api_server.stop()
+
+    def mermaid_code(self, index):
+        return f'graph TD\n    A{index} --> B{index}\n    A{index} --> C{index}\n    B{index} --> D{index}\n    C{index} --> D{index}'
+
+    def cytoscape_data(self, index):
+        return dict(elements=dict(nodes=[dict(data=dict(id=f'n{index}_{node}', label=f'Node {node}')) for node in range(5)],
+                                  edges=[dict(data=dict(id=f'e{index}_{node}', source=f'n{index}_{node}', target=f'n{index}_{node + 1}')) for node in range(4)]))
+
+    def test_bench__page_pool(self):
+        page_pool            = Playwright__Page__Pool(enabled=True)
+        page_pool__in_process = Playwright__Page__Pool(enabled=True)
+        renders   = {'mermaid'   : lambda web_root_render, index: web_root_render.render__mermaid  (self.mermaid_code  (index)),
+                     'cytoscape' : lambda web_root_render, index: web_root_render.render__cytoscape(self.cytoscape_data(index))}
+        modes     = {'no pool (http)'         : Web_Root__Render(target_server=self.target_server, page_pool=Playwright__Page__Pool(enabled=False)),
+                     'page pool (http)'       : Web_Root__Render(target_server=self.target_server, page_pool=page_pool                           ),
+                     'no pool (in-process)'   : Web_Root__Render(target_server=WEB_ROOT__URL     , page_pool=Playwright__Page__Pool(enabled=False)),
+                     'page pool (in-process)' : Web_Root__Render(target_server=WEB_ROOT__URL     , page_pool=page_pool__in_process               )}
+        print()
+        print(f"{'renderer':10} | {'mode':22} | {'first ms':>9} | {'avg ms':>8} | {'p95 ms':>8}")
+        for renderer, render in renders.items():
+            for mode, web_root_render in modes.items():
+                timings = []
+                for index in range(BENCH__DIAGRAMS):
+                    start            = time.perf_counter()
+                    screenshot_bytes = render(web_root_render, index)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    assert screenshot_bytes.startswith(b'\x89PNG')
+                rest = sorted(timings[1:])                                      # (the first render also launches the browser, or fills the pool)
+                print(f"{renderer:10} | {mode:22} | {timings[0]:9.1f} | {sum(rest) / len(rest):8.1f} | {rest[int(len(rest) * 0.95) - 1]:8.1f}")
+        print(page_pool.stats())
+        page_pool            .stop()
+        page_pool__in_process.stop()
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+from unittest                                                       import TestCase
+from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Engines    import ENGINES__MODULES
+
+BENCH__HANDLER_MODULE = 'mgraph_ai_serverless.lambdas.handler'
+BENCH__TOP_MODULES    = 15
+BENCH__ENGINE_LIBS    = ['matplotlib.figure', 'networkx', 'mgraph_ai', 'playwright.async_api', 'boto3']     # the third party imports that used to be paid for at cold start
+
+# run with: pytest -s tests/benchmarks/lambdas/test__bench__handler__import_time.py
+
+class test__bench__handler__import_time(TestCase):                             # cold start import cost: the handler (engines imported lazily) vs each engine's modules
+
+    def import_times(self, module_name) -> dict:                                # module -> cumulative ms (from python's -X importtime report, in a new process)
+        env    = dict(os.environ, MGRAPH__ENGINES__WARMUP='false')
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'], capture_output=True, text=True, env=env)
+        times  = {}
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and 'cumulative' not in line:
+                _, cumulative, name = line[len('import time:'):].split('|')
+                times[name.strip()] = int(cumulative) / 1000
+        if result.returncode != 0:
+            times[module_name] = None                                           # i.e. an engine dependency that is not installed here
+        return times
+
+    def test_bench__import_time(self):
+        handler_times = self.import_times(BENCH__HANDLER_MODULE)
+        print()
+        print(f"{'module':90} | {'cumulative (ms)':>15}")
+        for name, ms in sorted(handler_times.items(), key=lambda item: -item[1])[:BENCH__TOP_MODULES]:
+            print(f"{name:90} | {ms:15.1f}")
+        print()
+        print(f"{'engine module (imported on first use)':90} | {'cumulative (ms)':>15}")
+        for module_names in list(ENGINES__MODULES.values()) + [BENCH__ENGINE_LIBS]:
+            for module_name in module_names:
+                ms = self.import_times(module_name).get(module_name)
+                print(f"{module_name:90} | {'(not installed)' if ms is None else f'{ms:15.1f}'}")
+        assert handler_times.get(BENCH__HANDLER_MODULE) is not None
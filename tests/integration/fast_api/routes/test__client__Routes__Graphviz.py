@@ -1,4 +1,7 @@
 from unittest                                                                       import TestCase
+from osbot_utils.utils.Json                                                         import json_loads
+from osbot_utils.utils.Zip                                                          import zip_bytes__file, zip_bytes__file_list
+from mgraph_ai.providers.simple.MGraph__Simple__Test_Data                           import MGraph__Simple__Test_Data
 from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot import GRAPHVIZ__DOT__SAMPLE_GRAPH_1
 from mgraph_ai_serverless.testing.mgraph_ai_serverless__objs_for_tests              import mgraph_ai_serverless__fast_api__client
 
@@ -16,3 +19,87 @@ class test__client__Routes__Graphviz(TestCase):
         assert len(response.content) > 0
         assert type(response.content) is bytes
         #file_create_from_bytes('/tmp/graphviz_render_dot.png', response.content)
+
+    def test_render_dot__admission(self):                                       # Test the pre-parser's headers and rejections
+        response = self.client.post('/graphviz/render-dot', json={ "dot_source": GRAPHVIZ__DOT__SAMPLE_GRAPH_1 })
+        assert response.headers['x-graphviz-engine'] == 'dot'
+        assert response.headers['x-graphviz-nodes' ] == '3'
+        assert response.headers['x-graphviz-edges' ] == '3'
+
+        response = self.client.post('/graphviz/render-dot', json={ "dot_source": "digraph { a -> b" })
+        assert response.status_code == 400
+        assert response.json()      == {'detail': "Invalid DOT source: unbalanced '{'"}
+
+        response = self.client.post('/graphviz/render-dot', json={ "dot_source": "digraph { a; = b }" })     # passes the pre-parse, but not graphviz
+        assert response.status_code == 400
+        assert response.json()['detail'].startswith('Graphviz render failed:')
+
+    def test_render_dot_batch(self):                                            # Test batch rendering (with one invalid item)
+        payload  = { "items": [ { "dot_source": GRAPHVIZ__DOT__SAMPLE_GRAPH_1, "output_format": "png" },
+                                { "dot_source": GRAPHVIZ__DOT__SAMPLE_GRAPH_1, "output_format": "svg" },
+                                { "dot_source": "digraph { a -> "            , "output_format": "png" }],
+                     "max_workers": 2 }
+        response = self.client.post('/graphviz/render-dot-batch', json=payload)
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/zip'
+
+        zip_bytes = response.content
+        manifest  = json_loads(zip_bytes__file(zip_bytes, 'manifest.json'))
+        assert zip_bytes__file_list(zip_bytes)  == ['0000.png', '0001.svg', 'manifest.json']
+        assert [item.get('file_name') for item in manifest] == ['0000.png', '0001.svg', None]
+        assert 'error' in manifest[2]
+        assert zip_bytes__file(zip_bytes, '0000.png').startswith(b'\x89PNG')
+
+    def test_render_dot_stream(self):                                           # Test streaming render (body is the raw DOT source)
+        response = self.client.post('/graphviz/render-dot-stream?output_format=svg', content=GRAPHVIZ__DOT__SAMPLE_GRAPH_1)
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'image/svg'
+        assert b'<svg'                          in response.content
+        assert response.headers['x-graphviz-nodes'] == '3'                        # same admission (and plan headers) as the other routes
+
+        response = self.client.post('/graphviz/render-dot-stream', content='digraph { a -> ')
+        assert response.status_code             == 400
+        assert response.json()['detail']        == "Invalid DOT source: '->' needs a node or subgraph on each side (at position 12)"
+
+        response = self.client.post('/graphviz/render-dot-stream', content='digraph { a; = b }')
+        assert response.status_code             == 400
+        assert response.json()['detail'].startswith('Graphviz render failed:')
+
+        for content in ['', ' \n\t ']:                                           # empty bodies are rejected (before the stream starts)
+            response = self.client.post('/graphviz/render-dot-stream', content=content)
+            assert response.status_code     == 400
+            assert response.json()['detail'] == 'No DOT source provided'
+
+    def test_render_dot_async(self):                                            # Test async render (and its timeout)
+        payload  = { "dot_source"   : GRAPHVIZ__DOT__SAMPLE_GRAPH_1 ,
+                     "output_format": "svg"                         }
+        response = self.client.post('/graphviz/render-dot-async', json=payload)
+        assert response.status_code == 200
+        assert b'<svg'              in response.content
+
+        edges    = '\n'.join(f'n{i} -> n{(i * 7) % 2000};' for i in range(2000))           # big enough to take more than 1ms
+        payload  = { "dot_source"   : f'digraph {{ {edges} }}' ,
+                     "output_format": "png"                    ,
+                     "timeout"      : 0.001                    }
+        response = self.client.post('/graphviz/render-dot-async', json=payload)
+        assert response.status_code      == 504
+        assert response.json()['detail'] == 'Graphviz render timed out after 0.001 seconds'
+
+    def test_render_dot_formats(self):                                          # Test several formats in one response
+        payload  = { "dot_source"    : GRAPHVIZ__DOT__SAMPLE_GRAPH_1 ,
+                     "output_formats": ["svg", "png"]                }
+        response = self.client.post('/graphviz/render-dot-formats', json=payload)
+        assert response.status_code                       == 200
+        assert response.headers['content-type']           == 'application/zip'
+        assert zip_bytes__file_list(response.content)     == ['graph.png', 'graph.svg']
+
+    def test_render_mgraph(self):                                               # Test MGraph graph_data rendered by graphviz
+        graph_data = MGraph__Simple__Test_Data().create().graph.json()
+        response   = self.client.post('/graphviz/render-mgraph', json={ "graph_data": graph_data, "output_format": "svg" })
+        assert response.status_code                  == 200
+        assert response.headers['x-graphviz-engine'] == 'dot'
+        assert b'<svg' in response.content
+
+        response = self.client.post('/graphviz/render-mgraph', json={ "graph_data": { "graph_type": "aaa" } })
+        assert response.status_code == 400
+        assert response.json()      == {'detail': 'Unsupported domain type: aaa'}
@@ -0,0 +1,25 @@
+import pytest
+from unittest                                                                           import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Libgvc     import Graphviz__Backend__Libgvc
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Subprocess import Graphviz__Backend__Subprocess
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot     import GRAPHVIZ__DOT__SAMPLE_GRAPH_1
+
+
+class test__int__Graphviz__Backends(TestCase):
+
+    def test_render__subprocess(self):
+        with Graphviz__Backend__Subprocess() as _:
+            assert _.render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, 'png').startswith(b'\x89PNG')
+            assert b'<svg'  in _.render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, 'svg')
+            with self.assertRaises(ValueError) as context:                      # same error type as libgvc for bad input
+                _.render('digraph { a -> }', 'png')
+            assert context.exception.args[0].startswith('Graphviz render failed: ')
+
+    def test_render__libgvc(self):
+        with Graphviz__Backend__Libgvc() as _:
+            if _.is_available() is False:
+                pytest.skip("graphviz shared libraries (libgvc) are not installed")
+            assert _.render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, 'png').startswith(b'\x89PNG')
+            assert _.render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, 'svg') == Graphviz__Backend__Subprocess().render(GRAPHVIZ__DOT__SAMPLE_GRAPH_1, 'svg')
+            with self.assertRaises(ValueError):
+                _.render('this is not dot', 'png')
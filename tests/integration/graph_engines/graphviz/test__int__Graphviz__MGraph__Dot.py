@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from unittest                                                                           import TestCase
+from mgraph_ai.providers.simple.MGraph__Simple                                          import MGraph__Simple
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Dot__Stats                   import Graphviz__Dot__Stats
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__MGraph__Dot                  import Graphviz__MGraph__Dot
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                       import Graphviz__Render
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_MGraph  import Model__Graphviz__Render_MGraph
+
+
+class test__int__Graphviz__MGraph__Dot(TestCase):
+
+    def setUp(self):
+        self.mgraph_simple = MGraph__Simple()
+        self.mgraph_dot    = Graphviz__MGraph__Dot()
+        with self.mgraph_simple.edit() as edit:
+            self.node1 = edit.new_node(value='Node 1')
+            self.node2 = edit.new_node(value='Node "2"')
+            self.edge  = edit.new_edge(from_node_id=self.node1.node_id, to_node_id=self.node2.node_id)
+        self.graph_data = self.mgraph_simple.graph.json()
+
+    def test_dot_source(self):
+        node1_id, node2_id = str(self.node1.node_id), str(self.node2.node_id)
+        assert self.mgraph_dot.dot_source(self.graph_data) == ( 'digraph {\n'
+                                                               f'    "{node1_id}" [label="Node 1"];\n'
+                                                               f'    "{node2_id}" [label="Node \\"2\\""];\n'
+                                                               f'    "{node1_id}" -> "{node2_id}";\n'
+                                                                '}\n')
+        stats = Graphviz__Dot__Stats().dot_stats(self.mgraph_dot.dot_source(self.graph_data))
+        assert (stats.node_count, stats.edge_count) == (2, 1)
+
+    def test_dot_source__invalid(self):
+        for graph_data, expected_error in [(None                , 'No graph provided for rendering'                                   ),
+                                           ({'graph_type': 'aa'}, 'Unsupported domain type: aa'                                       ),
+                                           ({'graph_type': self.graph_data['graph_type']}, "Invalid graph_data: model.data must contain 'nodes' and 'edges'")]:
+            with self.assertRaises(ValueError) as context:
+                self.mgraph_dot.dot_source(graph_data)
+            assert context.exception.args[0] == expected_error
+
+    def test_dot_source__light_imports(self):                                  # the domain type allow-list is checked without importing matplotlib, networkx or mgraph_ai
+        code   = ('import sys\n'
+                  'from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__MGraph__Dot import Graphviz__MGraph__Dot\n'
+                  'graph_data = dict(graph_type=\'mgraph_ai.mgraph.domain.Domain__MGraph__Graph.Domain__MGraph__Graph\', model=dict(data=dict(nodes={}, edges={})))\n'
+                  'Graphviz__MGraph__Dot().dot_source(graph_data)\n'
+                  'print(sorted(name for name in ("matplotlib", "networkx", "mgraph_ai") if name in sys.modules))')
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        assert result.stdout.strip() == '[]'
+
+    def test_render_mgraph(self):
+        render_mgraph = Model__Graphviz__Render_MGraph(graph_data=self.graph_data)
+        assert Graphviz__Render().render_mgraph(render_mgraph).startswith(b'\x89PNG')
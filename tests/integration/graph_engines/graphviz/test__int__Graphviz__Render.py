@@ -1,8 +1,9 @@
-from unittest                                                                       import TestCase
-from mgraph_ai.providers.json.MGraph__Json                                          import MGraph__Json
-from mgraph_ai.providers.simple.MGraph__Simple__Test_Data                           import MGraph__Simple__Test_Data
-from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                   import Graphviz__Render
-from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot import Model__Graphviz__Render_Dot
+from unittest                                                                               import TestCase
+from mgraph_ai.providers.json.MGraph__Json                                                  import MGraph__Json
+from mgraph_ai.providers.simple.MGraph__Simple__Test_Data                                   import MGraph__Simple__Test_Data
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                           import Graphviz__Render
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot         import Model__Graphviz__Render_Dot
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot_Formats import Model__Graphviz__Render_Dot_Formats
 
 
 class test__int__Graphviz__Render(TestCase):
@@ -36,4 +37,33 @@ class test__int__Graphviz__Render(TestCase):
             render_config = Model__Graphviz__Render_Dot(dot_source=dot_text)
             result = _.render_dot(render_config)
             assert isinstance(result, bytes)
-            assert len(result) > 0
\ No newline at end of file
+            assert len(result) > 0
+
+    def test_render_dot__cache(self):                                           # Test that repeated renders are served from the cache
+        graphviz_render = Graphviz__Render()
+        render_config   = Model__Graphviz__Render_Dot(dot_source=self.dot_text)
+        result_1        = graphviz_render.render_dot(render_config)
+        result_2        = graphviz_render.render_dot(render_config)
+        assert result_1 == result_2
+        assert graphviz_render.cache_stats().get('misses') == 1
+        assert graphviz_render.cache_stats().get('hits'  ) == 1
+
+    def test_render_dot__reuse_layout(self):                                    # Test that the layout is computed once and reused across formats
+        graphviz_render = Graphviz__Render()
+        for output_format in ['svg', 'png', 'pdf']:
+            render_config = Model__Graphviz__Render_Dot(dot_source    = self.dot_text ,
+                                                        output_format = output_format ,
+                                                        reuse_layout  = True          )
+            assert len(graphviz_render.render_dot(render_config)) > 0
+        layout_stats = graphviz_render.cache_stats().get('layouts')
+        assert layout_stats.get('misses') == 1
+        assert layout_stats.get('hits'  ) == 2
+
+    def test_render_dot_formats(self):                                          # Test multiple formats from a single request
+        graphviz_render = Graphviz__Render()
+        render_formats  = Model__Graphviz__Render_Dot_Formats(dot_source=self.dot_text)
+        results         = graphviz_render.render_dot_formats(render_formats)
+        assert list(results) == ['graph.png', 'graph.svg', 'graph.pdf']
+        assert results['graph.png'].startswith(b'\x89PNG')
+        assert results['graph.pdf'].startswith(b'%PDF'  )
+        assert b'<svg' in results['graph.svg']
@@ -1,8 +1,11 @@
+import json
 from unittest                                                                          import TestCase
 from fastapi                                                                           import Response
 from mgraph_ai.providers.simple.MGraph__Simple__Test_Data                              import MGraph__Simple__Test_Data
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Layout    import Model__Matplotlib__Layout
 from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render    import Model__Matplotlib__Render
 from mgraph_ai_serverless.graph_engines.matplotlib.routes.Routes__Matplotlib           import Routes__Matplotlib
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render                  import Matplotlib__Render
 
 
 class test_Routes__Matplotlib(TestCase):
@@ -18,6 +21,8 @@ class test_Routes__Matplotlib(TestCase):
     def test_init(self):                                                            # Test initialization
         assert type(self.routes)        is Routes__Matplotlib
         assert 'matplotlib'             == self.routes.tag
+        assert type(self.routes.matplotlib__render) is Matplotlib__Render          # created on first use (still an attribute)
+        assert self.routes.matplotlib__render       is self.routes.matplotlib__render
 
     def test_render_graph_direct(self):                                             # Test direct method call
         response = self.routes.render_graph(self.render_config)
@@ -50,3 +55,21 @@ class test_Routes__Matplotlib(TestCase):
             assert isinstance(response, Response)
             assert len(response.body) > 0
 
+
+    def test_layout(self):                                                          # Test the layout only (json) route
+        graph_data = self.test_graph.graph.json()
+        response   = self.routes.layout(Model__Matplotlib__Layout(graph_data=graph_data, layout='circular'))
+        layout     = json.loads(response.body)
+        assert response.media_type          == 'application/json'
+        assert list(layout)                 == ['layout', 'layout_key', 'nodes', 'edges']
+        assert len(layout['nodes'])         == len(graph_data['model']['data']['nodes'])
+        assert list(layout['nodes'][0])     == ['id', 'label', 'x', 'y']
+
+        flat = json.loads(self.routes.layout(Model__Matplotlib__Layout(graph_data=graph_data, layout='circular', encoding='flat')).body)
+        assert flat['layout_key']           == layout['layout_key']                 # same graph structure, same cached layout
+        assert len(flat['positions'])       == 2 * len(flat['node_ids'])
+        assert len(flat['edges'    ])       == 2 * len(layout['edges'])
+        assert flat['positions'][:2]        == [layout['nodes'][0]['x'], layout['nodes'][0]['y']]
+
+        render_response = self.routes.render_graph(Model__Matplotlib__Render(graph_data=graph_data, layout='circular'))
+        assert render_response.headers.get('X-Matplotlib-Layout-Key') == layout['layout_key']      # renders share the layout cache
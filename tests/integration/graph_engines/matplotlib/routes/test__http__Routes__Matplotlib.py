@@ -30,6 +30,28 @@ class test__http__Routes__Matplotlib(TestCase):
         assert response.content.startswith(b'\x89PNG')                         # Verify PNG header
         #file_create_from_bytes('/tmp/test_render.png', response.content)      # Save test output
 
+    def test_http__render_graph_raw(self):                                     # same image, but the body is decoded with orjson (only the envelope is validated)
+        render_config = Model__Matplotlib__Render(graph_data = self.test_graph.graph.json(), layout='circular', dpi=50)
+        json_data     = asdict(render_config)
+        response_raw  = self.fast_api_server.requests_post('/matplotlib/render-graph-raw', data=json_data)
+        response      = self.fast_api_server.requests_post('/matplotlib/render-graph'    , data=json_data)
+
+        assert response_raw.status_code                         == 200
+        assert response_raw.headers['content-type']             == 'image/png'
+        assert response_raw.headers['x-matplotlib-layout-key']  == response.headers['x-matplotlib-layout-key']
+        assert response_raw.content                             == response.content
+
+        json_data['dpi'] = 'high'
+        response = self.fast_api_server.requests_post('/matplotlib/render-graph-raw', data=json_data)
+        assert response.status_code      == 400
+        assert response.json()['detail'] == 'Invalid value for dpi: expected an integer'
+
+        json_data['dpi'] = 50
+        json_data['graph_data']['graph_type'] = 'InvalidDomainType'
+        response = self.fast_api_server.requests_post('/matplotlib/render-graph-raw', data=json_data)
+        assert response.status_code      == 400
+        assert response.json()['detail'] == 'Unsupported domain type: InvalidDomainType'
+
     def test_http__render_graph_formats(self):                                # Test different formats
         formats = ['png', 'svg', 'pdf']
         for format in formats:
@@ -1,3 +1,4 @@
+import numpy as np
 import networkx as nx
 from unittest                                                                   import TestCase
 from mgraph_ai.providers.simple.schemas.Schema__Simple__Node                    import Schema__Simple__Node
@@ -7,6 +8,9 @@ from osbot_utils.utils.Objects
 from mgraph_ai.mgraph.actions.exporters.MGraph__Export__Base                    import MGraph__Export__Base
 from mgraph_ai.providers.simple.MGraph__Simple                                  import MGraph__Simple
 
+def png_size(png_bytes):                                                                # (width, height) from the PNG's IHDR chunk
+    return int.from_bytes(png_bytes[16:20], 'big'), int.from_bytes(png_bytes[20:24], 'big')
+
 class test_MGraph__Export__NetworkX(TestCase):
 
     def setUp(self):                                                                    # Initialize test environment
@@ -113,6 +117,88 @@ class test_MGraph__Export__NetworkX(TestCase):
                     image_data[0:5].startswith(b'<?xml vers')                            # Check SVG header
                 #file_create_from_bytes(f'/tmp/test_image_{layout}.{format}', image_data) # Save image to file
 
+    def test_layout_positions(self):                                                    # Test the structural layout cache
+        with self.mgraph_simple.edit() as edit:
+            node_1 = edit.new_node(value='test1')
+            node_2 = edit.new_node(value='test2')
+            edit.new_edge(from_node_id=node_1.node_id, to_node_id=node_2.node_id)
+
+        layout_cache = self.exporter.layout_cache
+        G            = self.exporter.to_networkx()
+        positions    = self.exporter.layout_positions(G, layout='spring', seed=42)
+        hits         = layout_cache.hits
+        assert self.exporter.layout_positions(G, layout='spring', seed=42) is positions     # same structure, layout and seed: layout is skipped
+        assert layout_cache.hits                                           == hits + 1
+        assert self.exporter.layout_positions(G, layout='spring', seed=43) is not positions
+
+        self.exporter.to_image(layout='spring', seed=42, node_color='red', dpi=72)          # restyled render reuses the cached positions
+        assert layout_cache.hits == hits + 2
+
+    def test_layout_positions__incremental(self):                                       # Test seeding the layout from a previous render
+        with self.mgraph_simple.edit() as edit:
+            node_1 = edit.new_node(value='test1')
+            node_2 = edit.new_node(value='test2')
+            edit.new_edge(from_node_id=node_1.node_id, to_node_id=node_2.node_id)
+
+        self.exporter.to_image(layout='spring', seed=42, dpi=72)
+        layout_key = self.exporter.layout_key
+        prior      = self.exporter.layout_cache.get(layout_key)
+
+        with self.mgraph_simple.edit() as edit:                                         # the graph evolves: one more node
+            node_3 = edit.new_node(value='test3')
+            edit.new_edge(from_node_id=node_3.node_id, to_node_id=node_1.node_id)
+
+        graph_arrays    = self.exporter.to_arrays()
+        prior_positions = self.exporter.prior_positions(layout_key=layout_key)
+        positions       = self.exporter.layout_positions__arrays(graph_arrays, layout='spring', seed=42, prior_positions=prior_positions)
+        node_index      = {node_id: index for index, node_id in enumerate(graph_arrays.node_ids)}
+        assert prior_positions                   == prior
+        assert self.exporter.layout_key          != layout_key
+        for node_id in (str(node_1.node_id), str(node_2.node_id)):                      # the existing nodes stay where they were
+            assert np.abs(positions[node_index[node_id]] - prior[node_id]).max() < 0.1
+
+        assert self.exporter.prior_positions(layout_key='an-unknown-key')                 is None       # i.e. evicted: the layout starts from scratch
+        assert self.exporter.prior_positions(positions={node_1.node_id: (1, 2)}, layout_key=layout_key)[str(node_1.node_id)] == (1.0, 2.0)
+
+    def test_render_dpi(self):                                                          # Test the pixel budget and preview dpi
+        with self.exporter as _:
+            assert _.render_dpi((10, 10), dpi=300                              ) == 300
+            assert _.render_dpi((10, 10), dpi=300, max_pixels=1_000_000        ) == 100     # 1000 x 1000
+            assert _.render_dpi((10,  5), dpi=300, max_pixels=1_000_000        ) == 141
+            assert _.render_dpi((10, 10), dpi=72 , max_pixels=1_000_000        ) == 72      # the budget only lowers the dpi
+            assert _.render_dpi((10, 10), dpi=300, preview=True                ) == 50
+            assert _.render_dpi((10, 10), dpi=300, max_pixels=1, preview=True  ) == 1
+
+    def test_to_image__preview(self):                                                   # Test the fast preview mode
+        with self.mgraph_simple.edit() as edit:
+            node_1 = edit.new_node(value='test1')
+            node_2 = edit.new_node(value='test2')
+            edit.new_edge(from_node_id=node_1.node_id, to_node_id=node_2.node_id)
+
+        full_image    = self.exporter.to_image(layout='circular', figsize=(4, 4), dpi=300)
+        preview_image = self.exporter.to_image(layout='circular', figsize=(4, 4), dpi=300, preview=True)
+        budget_image  = self.exporter.to_image(layout='circular', figsize=(4, 4), dpi=300, max_pixels=10_000)
+        assert preview_image.startswith(b'\x89PNG')
+        assert len(preview_image) < len(full_image)
+        assert png_size(preview_image) == (200, 200)                                    # 4 inches at 50 dpi (no tight bounding box in preview mode, it would add padding)
+        assert png_size(budget_image)  == (100, 100)                                    # 4 inches at 25 dpi
+
+    def test_to_image__draw_kwargs(self):                                               # Test the nx.draw style kwargs (mapped onto the scatter, LineCollection and text artists)
+        with self.mgraph_simple.edit() as edit:
+            node_1 = edit.new_node(value='test1')
+            node_2 = edit.new_node(value='test2')
+            edit.new_edge(from_node_id=node_1.node_id, to_node_id=node_2.node_id)
+
+        image_data = self.exporter.to_image(layout='circular', dpi=72, node_color='red', with_labels=False, font_size=8, font_color='blue',
+                                            edge_color='gray', width=2.0, style='dashed', alpha=0.5, node_shape='s', linewidths=1, edgecolors='black')
+        assert image_data.startswith(b'\x89PNG')
+        assert self.exporter.draw_kwargs(dict(edge_color='gray', width=2.0, font_size=8, alpha=0.5)) == (dict(alpha =0.5                    ),
+                                                                                                         dict(colors='gray', linewidths=2.0),
+                                                                                                         dict(size  =8                      ))
+        with self.assertRaises(ValueError) as context:
+            self.exporter.to_image(layout='circular', dpi=72, arrows=True, font_size=8)
+        assert context.exception.args[0].startswith("Unsupported draw options: ['arrows'] (supported: ['alpha', 'cmap', 'edge_color', ")
+
     def test_format_output(self):                                                       # Test output formatting
         with self.mgraph_simple.edit() as edit:
             node_1 = edit.new_node(value='test1')
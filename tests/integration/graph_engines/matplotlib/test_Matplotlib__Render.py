@@ -1,9 +1,13 @@
 from unittest                                                                               import TestCase
 from mgraph_ai.providers.simple.MGraph__Simple                                              import MGraph__Simple
-from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render                       import Matplotlib__Render
+from mgraph_ai.providers.json.MGraph__Json                                                  import MGraph__Json
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render                       import Matplotlib__Render, DOMAIN_TYPES
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Graph_Data__Reader           import GRAPH_DATA__READERS
+from mgraph_ai_serverless.graph_engines.Graph_Engines__Domain_Types                         import GRAPH_ENGINES__DOMAIN_TYPES
+from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib               import MGraph__Export__Matplotlib
 from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render         import Model__Matplotlib__Render
 from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Output_Format  import Model__Matplotlib__Output_Format
-from osbot_utils.utils.Objects                                                              import base_types
+from osbot_utils.utils.Objects                                                              import base_types, type_full_name
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
 
 # refactor/merge this with the tests in test__int__Matplotlib__Render.py
@@ -69,4 +73,22 @@ class test_Matplotlib__Render(TestCase):
             output     = self.renderer.create_image   (self.render_config, graph)
 
         assert type(output) is bytes                                                    # Check structure
-        assert output.startswith(b'\x89PNG')
\ No newline at end of file
+        assert output.startswith(b'\x89PNG')
+    def test_create_exporter__fast_parse(self):                                       # the fast path reads the same arrays as the full domain graph
+        mgraph_json = MGraph__Json()
+        mgraph_json.load().from_data({'a': 1, 'b': [1, 'x', 0], 'c': {'d': None}})
+        for graph_data in (self.graph_data, mgraph_json.graph.json()):
+            graph       = self.renderer.create_graph_from_graph_data(graph_data)
+            from_json   = MGraph__Export__Matplotlib(graph=graph).to_arrays()
+            fast_parse  = self.renderer.create_exporter(graph_data).to_arrays()
+            assert fast_parse.node_ids        == from_json.node_ids
+            assert fast_parse.labels          == from_json.labels
+            assert fast_parse.edges.tolist()  == from_json.edges.tolist()
+        assert sorted(GRAPH_DATA__READERS) == sorted(DOMAIN_TYPES) == sorted(GRAPH_ENGINES__DOMAIN_TYPES)     # same allow-list
+        assert [type_full_name(domain_type) for domain_type in DOMAIN_TYPES.values()] == list(GRAPH_ENGINES__DOMAIN_TYPES)
+
+    def test_create_exporter__from_json(self):
+        with Matplotlib__Render(fast_parse=False) as _:
+            exporter = _.create_exporter(self.graph_data)
+            assert exporter.graph_arrays is None
+            assert len(exporter.to_arrays().node_ids) == 2
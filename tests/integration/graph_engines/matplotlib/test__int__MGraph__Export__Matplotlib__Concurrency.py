@@ -0,0 +1,36 @@
+from concurrent.futures                                                         import ThreadPoolExecutor
+from unittest                                                                   import TestCase
+from mgraph_ai.providers.simple.MGraph__Simple                                  import MGraph__Simple
+from mgraph_ai_serverless.graph_engines.matplotlib.MGraph__Export__Matplotlib   import MGraph__Export__Matplotlib
+
+STRESS__THREADS  = 16
+STRESS__RENDERS  = 96
+
+
+class test__int__MGraph__Export__Matplotlib__Concurrency(TestCase):             # renders in parallel must not interfere with each other (no shared pyplot state)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.exporters = [cls.create_exporter(node_count) for node_count in (3, 7, 12)]
+
+    @classmethod
+    def create_exporter(cls, node_count):
+        mgraph_simple = MGraph__Simple()
+        with mgraph_simple.edit() as edit:
+            nodes = [edit.new_node(value=f'node {index}') for index in range(node_count)]
+            for from_node, to_node in zip(nodes, nodes[1:]):
+                edit.new_edge(from_node_id=from_node.node_id, to_node_id=to_node.node_id)
+        return MGraph__Export__Matplotlib(graph=mgraph_simple.graph)
+
+    def render(self, index):
+        exporter   = self.exporters[index % len(self.exporters)]
+        node_color = ('lightblue', 'orange')[index % 2]                         # different styles in flight at the same time
+        return exporter.to_image(layout='circular', figsize=(4, 4), node_size=300, node_color=node_color, format='png', dpi=72)   # circular layout is deterministic
+
+    def test_to_image__concurrent(self):
+        expected = [self.render(index) for index in range(len(self.exporters) * 2)]         # sequential baseline, one per (graph, style) combination
+        with ThreadPoolExecutor(max_workers=STRESS__THREADS) as executor:
+            results = list(executor.map(self.render, range(STRESS__RENDERS)))
+        for index, image_data in enumerate(results):
+            assert image_data.startswith(b'\x89PNG')
+            assert image_data == expected[index % len(expected)]                # byte-identical to the sequential render
@@ -0,0 +1,34 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager import Playwright__Browser__Manager
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless       import Playwright__Serverless
+from tests.integration.obj_for_tests__mgraph_ai_serverless                      import ensure_browser_is_installed
+
+
+class test__int__Playwright__Browser__Manager(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        ensure_browser_is_installed()
+
+    def setUp(self):
+        self.browser_manager = Playwright__Browser__Manager()
+
+    def tearDown(self):
+        self.browser_manager.stop()
+
+    def test_new_context__reconnect(self):                                      # one launch for many contexts, and a relaunch after a crash
+        launch_kwargs = Playwright__Serverless().browser__launch_kwargs
+        with self.browser_manager as _:
+            context_1 = _.run(_.new_context(launch_kwargs))
+            context_2 = _.run(_.new_context(launch_kwargs))
+            assert context_1         is not context_2
+            assert context_1.browser is     context_2.browser
+            assert _.launches        == 1
+
+            _.run(context_1.browser.close())                                    # simulates a crash
+            context_3 = _.run(_.new_context(launch_kwargs))
+            assert context_3.browser.is_connected() is True
+            assert _.launches                       == 2
+            for context in (context_1, context_2, context_3):
+                _.run(_.close_context(context))
+            assert _.status()['contexts_open'] == 0
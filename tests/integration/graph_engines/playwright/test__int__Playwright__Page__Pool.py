@@ -0,0 +1,61 @@
+import asyncio
+from unittest                                                                        import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool            import Playwright__Page__Pool
+from mgraph_ai_serverless.graph_engines.playwright.models.Model__Page_Pool__Renderer import Model__Page_Pool__Renderer
+from tests.integration.obj_for_tests__mgraph_ai_serverless                           import ensure_browser_is_installed
+
+PAGE_POOL__TEST_PAGE = 'data:text/html,<html><body><h1 id="text">ready</h1></body></html>'
+
+
+class test__int__Playwright__Page__Pool(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        ensure_browser_is_installed()
+
+    def setUp(self):
+        self.page_pool = Playwright__Page__Pool(size=1, max_renders_per_page=3)
+        self.renderer  = Model__Page_Pool__Renderer(target_url = PAGE_POOL__TEST_PAGE                                           ,
+                                                    prepare_js = "() => window.renders = 0"                                     ,
+                                                    render_js  = "(text) => { window.renders += 1; document.getElementById('text').textContent = text }",
+                                                    reset_js   = "() => document.getElementById('text').textContent = ''"       )
+
+    def tearDown(self):
+        self.page_pool.stop()
+
+    def test_render(self):                                                      # the page is loaded once, and reused until max_renders_per_page
+        with self.page_pool as _:
+            for index in range(4):
+                assert _.render(self.renderer, f'diagram {index}').startswith(b'\x89PNG')
+            stats = _.stats()
+            assert stats['renders'       ] == 4
+            assert stats['pages_created' ] == 2
+            assert stats['pages_recycled'] == 1
+            assert stats['idle_pages'    ] == {PAGE_POOL__TEST_PAGE: 1}
+            page = _.idle_pages[PAGE_POOL__TEST_PAGE][0]
+            assert _.browser_manager.run(page.evaluate("() => [window.renders, document.getElementById('text').textContent]")) == [1, '']
+
+    def test_render__error(self):                                               # pages that fail a render are not reused
+        with self.page_pool as _:
+            self.renderer.render_js = "() => { throw new Error('render failed') }"
+            with self.assertRaises(Exception) as context:
+                _.render(self.renderer, 'diagram')
+            assert 'render failed' in str(context.exception)
+            assert _.stats()['pages_recycled'] == 1
+            assert _.stats()['idle_pages'    ] == {PAGE_POOL__TEST_PAGE: 0}
+
+    def test_render__async_render_js(self):                                     # render_js's promise is awaited before the screenshot (no fixed wait)
+        with self.page_pool as _:
+            self.renderer.render_js = "(text) => new Promise(resolve => setTimeout(() => { document.getElementById('text').textContent = text; resolve() }, 200))"
+            self.renderer.reset_js  = ''                                        # (no reset, so the rendered text can be checked)
+            assert _.render(self.renderer, 'diagram').startswith(b'\x89PNG')
+            page = _.idle_pages[PAGE_POOL__TEST_PAGE][0]
+            assert _.browser_manager.run(page.evaluate("() => document.getElementById('text').textContent")) == 'diagram'
+
+    def test_render__timeout(self):                                             # renders that never finish are stopped after render_ready's timeout
+        with self.page_pool as _:
+            _.render_ready.timeout  = 0.1
+            self.renderer.render_js = "() => new Promise(() => {})"
+            with self.assertRaises(asyncio.TimeoutError):
+                _.render(self.renderer, 'diagram')
+            assert _.stats()['pages_recycled'] == 1
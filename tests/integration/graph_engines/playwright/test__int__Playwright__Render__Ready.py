@@ -0,0 +1,49 @@
+import asyncio
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Render__Ready    import Playwright__Render__Ready
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless       import Playwright__Serverless
+from tests.integration.obj_for_tests__mgraph_ai_serverless                      import ensure_browser_is_installed
+
+RENDER_READY__TEST_PAGE = """data:text/html,<html><body><div id="diagram"></div><script>
+                                window.renderDone = new Promise(resolve => setTimeout(resolve, 200))
+                                                        .then(() => document.getElementById('diagram').textContent = 'rendered');
+                             </script></body></html>"""
+
+
+class test__int__Playwright__Render__Ready(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        ensure_browser_is_installed()
+        cls.playwright_serverless = Playwright__Serverless()
+        cls.browser_manager       = cls.playwright_serverless.browser_manager
+        cls.render_ready          = Playwright__Render__Ready()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.playwright_serverless.close()
+
+    def open_page(self, url):
+        async def open_page():
+            page = await self.playwright_serverless.new_page()
+            await page.goto(url)
+            return page
+        return self.browser_manager.run(open_page())
+
+    def test_wait_for_render(self):                                             # waits for the page's window.renderDone (instead of a fixed sleep)
+        page = self.open_page(RENDER_READY__TEST_PAGE)
+        assert self.browser_manager.run(self.render_ready.wait_for_render(page))            is True
+        assert self.browser_manager.run(page.evaluate("document.getElementById('diagram').textContent")) == 'rendered'
+
+    def test_wait_for_render__no_signal(self):                                  # pages that don't set window.renderDone are ready once loaded
+        page = self.open_page('data:text/html,<html><body>no signal</body></html>')
+        assert self.browser_manager.run(self.render_ready.wait_for_render(page)) is True
+
+    def test_wait_for_render__timeout(self):
+        page = self.open_page('data:text/html,<html><body><script>window.renderDone = new Promise(() => {})</script></body></html>')
+        with self.assertRaises(asyncio.TimeoutError):
+            self.browser_manager.run(self.render_ready.wait_for_render(page, timeout=0.1))
+
+    def test_wait_for_selector(self):
+        page = self.open_page(RENDER_READY__TEST_PAGE.replace("textContent = 'rendered'", "setAttribute('data-done', 'true')"))
+        assert self.browser_manager.run(self.render_ready.wait_for_selector(page, '#diagram[data-done]')) is not None
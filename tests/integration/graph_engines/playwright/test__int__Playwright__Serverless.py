@@ -0,0 +1,27 @@
+from unittest                                                                   import TestCase
+from osbot_utils.utils.Threads                                                  import invoke_async
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager import playwright__browser_manager
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless       import Playwright__Serverless
+from tests.integration.obj_for_tests__mgraph_ai_serverless                      import ensure_browser_is_installed
+
+
+class test__int__Playwright__Serverless(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        ensure_browser_is_installed()
+
+    def test_new_page__shared_browser(self):                                    # each instance gets its own context, in the same (warm) browser
+        async def open_page(playwright_serverless):
+            with playwright_serverless as _:
+                page = await _.new_page()
+                await _.stop()
+                return page
+
+        launches   = playwright__browser_manager.launches
+        page_1     = invoke_async(open_page(Playwright__Serverless()))
+        page_2     = invoke_async(open_page(Playwright__Serverless()))
+        assert page_1.context                    is not page_2.context
+        assert page_1.context.browser            is page_2.context.browser
+        assert playwright__browser_manager.launches - launches <= 1             # (0 when a previous test already launched it)
+        assert playwright__browser_manager.status()['contexts_open'] == 0
@@ -0,0 +1,29 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless       import Playwright__Serverless
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets    import Web_Root__Assets, WEB_ROOT__URL
+from tests.integration.obj_for_tests__mgraph_ai_serverless                      import ensure_browser_is_installed
+
+
+class test__int__Web_Root__Assets(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        ensure_browser_is_installed()
+
+    def setUp(self):
+        self.web_root_assets = Web_Root__Assets()
+
+    def test_route_context(self):                                               # the web_root pages are rendered with no http server
+        playwright_serverless = Playwright__Serverless(web_root_assets=self.web_root_assets)
+        browser_manager       = playwright_serverless.browser_manager
+        async def render_page():
+            page = await playwright_serverless.new_page()
+            await page.goto(WEB_ROOT__URL + 'examples/hello-world.html')
+            return await page.inner_text('h1'), await page.screenshot()
+        try:
+            text, screenshot = browser_manager.run(render_page())
+            assert text                                          == 'Hello World! (static example)'
+            assert screenshot.startswith(b'\x89PNG')             is True
+            assert self.web_root_assets.stats()['assets_served'] == 1
+        finally:
+            playwright_serverless.close()
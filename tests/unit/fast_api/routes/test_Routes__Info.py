@@ -19,4 +19,4 @@ class test_Routes__Info(TestCase):
         with self.routes_info as _:
             assert _.routes_paths() == []
             _.setup_routes()
-            assert _.routes_paths() == ['/ping', '/version' ]
\ No newline at end of file
+            assert _.routes_paths() == ['/ping', '/version', '/engines']
\ No newline at end of file
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+from unittest                                                       import TestCase
+from mgraph_ai_serverless.fast_api.MGraph_AI_Serverless__Engines    import MGraph_AI_Serverless__Engines, ENGINES__MODULES, ENGINES__WARMUP__ENGINES
+
+
+class test_MGraph_AI_Serverless__Engines(TestCase):
+
+    def test_handler__import_is_lazy(self):                                     # in a new process, since this one might already have the engines loaded
+        code   = ("import sys, mgraph_ai_serverless.lambdas.handler\n"
+                  "print(sorted(name for name in ('matplotlib', 'networkx', 'playwright', 'mgraph_ai', 'osbot_aws') if name in sys.modules))")
+        env    = dict(os.environ, MGRAPH__ENGINES__WARMUP='false')
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env)
+        assert result.returncode     == 0, result.stderr
+        assert result.stdout.strip() == '[]'
+
+    def test_import_engine(self):
+        engines = MGraph_AI_Serverless__Engines()
+        with self.assertRaises(ValueError) as context:
+            engines.import_engine('aaa')
+        assert context.exception.args[0] == 'Unknown engine: aaa'
+
+        import_times = engines.import_engine('debug')
+        assert list(import_times)          == ENGINES__MODULES['debug']
+        assert engines.status().get('loaded') .count('debug') == 1
+
+    def test_import_module(self):
+        engines = MGraph_AI_Serverless__Engines()
+        engines.import_module('json')                                           # already imported, so it costs nothing
+        engines.import_module('an_module_that_does_not_exist')
+        assert engines.import_times                                  == {'json': 0.0}
+        assert engines.errors['an_module_that_does_not_exist'].startswith('ModuleNotFoundError')
+
+    def test_warmup_start(self):
+        engines = MGraph_AI_Serverless__Engines()
+        assert engines.status().get('warmup') == 'not-started'
+        thread  = engines.warmup_start()
+        assert engines.warmup_start() is thread                                 # only one warm-up thread
+        thread.join()
+        status  = engines.status()
+        assert status.get('warmup') == 'done'
+        assert ENGINES__WARMUP__ENGINES == ['matplotlib', 'playwright']         # 'debug' (osbot_aws and boto3) is not warmed up
+        assert set(status.get('import_times')) | set(status.get('errors')) == {module_name for engine in ENGINES__WARMUP__ENGINES for module_name in ENGINES__MODULES[engine]}
@@ -0,0 +1,75 @@
+from unittest                                                                       import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Dot__Stats               import Graphviz__Dot__Stats
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot import GRAPHVIZ__DOT__SAMPLE_GRAPH_1
+
+
+class test_Graphviz__Dot__Stats(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dot_stats = Graphviz__Dot__Stats()
+
+    def test_dot_stats(self):
+        stats = self.dot_stats.dot_stats(GRAPHVIZ__DOT__SAMPLE_GRAPH_1)
+        assert stats.json() == dict(directed      = True                                   ,
+                                    node_count    = 3                                      ,
+                                    edge_count    = 3                                      ,
+                                    cluster_count = 0                                      ,
+                                    body_end      = GRAPHVIZ__DOT__SAMPLE_GRAPH_1.rindex('}'))
+
+    def test_dot_stats__syntax(self):
+        dot_source = '''strict digraph "G" {                                 // comment -> a
+                            rankdir=LR; /* x -> y */
+# preprocessor line
+                            node [shape=box label=<a <b>x</b>>];
+                            subgraph cluster_0 { a:p1:n -> b -> c; label="x" }
+                            subgraph "cluster 1" { d; e [label="q\\"}"] }
+                            { rank=same; f g }
+                            a -> "é" [label="a]b"];
+                        }'''
+        stats = self.dot_stats.dot_stats(dot_source)
+        assert stats.directed      is True
+        assert stats.node_count    == 8                                                 # a, b, c, d, e, f, g, é
+        assert stats.edge_count    == 3
+        assert stats.cluster_count == 2
+
+        assert self.dot_stats.dot_stats('graph { a -- b -- c }').directed is False
+
+    def test_dot_stats__concatenation(self):                                    # "a" + "b" is one (quoted) id
+        stats = self.dot_stats.dot_stats('digraph "G" + "1" { "a" + "b" -> ab; c [label="x" + "y"]; label = "q" + "r" }')
+        assert (stats.node_count, stats.edge_count) == (2, 1)                    # ab and c
+
+    def test_dot_stats__non_bmp(self):                                          # ids can use any unicode character (not only the BMP)
+        stats = self.dot_stats.dot_stats('digraph { \U0001F600 -> b\U0001F680c }')
+        assert (stats.node_count, stats.edge_count) == (2, 1)
+
+    def test_dot_stats__subgraph_edges(self):                                   # edges to (and from) subgraphs count as the edges they expand to
+        for dot_source, node_count, edge_count in [('digraph { a -> {b c d} }'                       , 4, 3),
+                                                   ('digraph { {a b} -> {c d} }'                     , 4, 4),
+                                                   ('digraph { a -> {b c} -> d }'                    , 4, 4),
+                                                   ('digraph { a -> subgraph s { b -> c } }'         , 3, 3),
+                                                   ('digraph { {a; b} -> {} }'                       , 2, 0),
+                                                   ('graph   { a -- { rank=same; b c } [color=red] }', 3, 2)]:
+            stats = self.dot_stats.dot_stats(dot_source)
+            assert (stats.node_count, stats.edge_count) == (node_count, edge_count), dot_source
+
+    def test_dot_stats__invalid(self):
+        invalid_sources = { ''                   : "Invalid DOT source: expected 'graph' or 'digraph'"                        ,
+                            'foo {}'             : "Invalid DOT source: expected 'graph' or 'digraph'"                        ,
+                            'digraph a'          : "Invalid DOT source: expected '{' after the graph declaration"             ,
+                            'digraph {'          : "Invalid DOT source: unbalanced '{'"                                       ,
+                            'graph { a -> b }'   : "Invalid DOT source: '->' is not valid in a graph (at position 10)"        ,
+                            'digraph { a ] }'    : "Invalid DOT source: unbalanced ']' at position 12"                        ,
+                            'digraph { a } x'    : "Invalid DOT source: unexpected content after the end of the graph at position 14",
+                            'digraph { "abc }'   : "Invalid DOT source: unexpected character '\"' at position 10"             ,
+                            'digraph { a <b }'   : "Invalid DOT source: unterminated html string"                             ,
+                            'digraph { a -> }'   : "Invalid DOT source: '->' needs a node or subgraph on each side (at position 12)",
+                            'digraph { a -> -> b }': "Invalid DOT source: '->' needs a node or subgraph on each side (at position 12)",
+                            'digraph { -> b }'   : "Invalid DOT source: '->' needs a node or subgraph on each side (at position 10)",
+                            'graph { a [x=1] -- b }': "Invalid DOT source: '--' needs a node or subgraph on each side (at position 16)",
+                            'digraph { a + "b" }': "Invalid DOT source: '+' must be between two quoted strings (at position 12)",
+                            'digraph { "a" + }'  : "Invalid DOT source: '+' must be between two quoted strings (at position 14)"}
+        for dot_source, expected_error in invalid_sources.items():
+            with self.assertRaises(ValueError) as context:
+                self.dot_stats.dot_stats(dot_source)
+            assert context.exception.args[0] == expected_error
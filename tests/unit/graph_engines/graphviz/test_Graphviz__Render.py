@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures                                                                   import ThreadPoolExecutor
+from unittest                                                                             import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz                                          import Graphviz__Render as graphviz_render_module
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                         import Graphviz__Render, GRAPHVIZ__BACKENDS
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend               import Graphviz__Backend
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Libgvc       import Graphviz__Backend__Libgvc
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Subprocess   import Graphviz__Backend__Subprocess
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot       import Model__Graphviz__Render_Dot
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot_Batch import Model__Graphviz__Render_Dot_Batch
+
+
+class test_Graphviz__Render(TestCase):
+
+    def test_backend(self):
+        assert list(GRAPHVIZ__BACKENDS)                                     == ['subprocess', 'libgvc']
+        assert type(Graphviz__Render(backend_name='subprocess').backend())  is Graphviz__Backend__Subprocess
+
+        with Graphviz__Render(backend_name='libgvc') as _:
+            if Graphviz__Backend__Libgvc().is_available():
+                assert type(_.backend()) is Graphviz__Backend__Libgvc
+            else:
+                assert _.backend()       is _.backend_fallback                      # falls back to the subprocess path
+
+    def test_backend__abstract(self):                                           # backends must implement render
+        with self.assertRaises(TypeError):
+            Graphviz__Backend()
+
+    def test_backend__unsupported(self):
+        with self.assertRaises(ValueError) as context:
+            Graphviz__Render(backend_name='aaa').backend()
+        assert context.exception.args[0] == 'Unsupported graphviz backend: aaa'
+
+    def test_render_dot_source__fallback(self):                                 # only backend failures are retried in the subprocess backend (not invalid DOT)
+        class Backend__Error(Graphviz__Backend__Libgvc):
+            error : type = ValueError
+            def render(self, **kwargs):
+                raise self.error('from backend')
+        class Backend__Fallback(Graphviz__Backend__Subprocess):
+            renders : int
+            def render(self, **kwargs):
+                self.renders += 1
+                return b'from fallback'
+        class Graphviz__Render__Test(Graphviz__Render):
+            test_backend : Backend__Error
+            def backend(self):
+                return self.test_backend
+
+        with Graphviz__Render__Test(backend_fallback=Backend__Fallback()) as _:
+            with self.assertRaises(ValueError):
+                _.render_dot_source('digraph {', 'svg')
+            assert _.backend_fallback.renders == 0                              # the bad DOT is not rendered twice
+
+            _.test_backend.error = OSError
+            assert _.render_dot_source('digraph {}', 'svg') == b'from fallback'
+            assert _.backend_fallback.renders == 1
+
+    def test_render_dot_batch__serial_backend(self):                            # backends that serialize their renders (i.e. libgvc) get a single worker
+        class Backend__Serial(Graphviz__Backend__Libgvc):
+            threads : set
+            def render(self, **kwargs):
+                self.threads.add(threading.current_thread().name)
+                return b'rendered'
+        class Graphviz__Render__Test(Graphviz__Render):
+            test_backend : Backend__Serial
+            def backend(self):
+                return self.test_backend
+
+        items = [Model__Graphviz__Render_Dot(dot_source=f'digraph {{ a{index} -> b }}') for index in range(8)]
+        with Graphviz__Render__Test() as _:
+            results = _.render_dot_batch(Model__Graphviz__Render_Dot_Batch(items=items, max_workers=4))
+            assert [result['bytes_data'] for result in results] == [b'rendered'] * 8
+            assert len(_.test_backend.threads)                  == 1
+
+    def test_render_dot_batch__shared_cap(self):                                # the max_workers cap is process wide (concurrent batches share it)
+        class Backend__Counter(Graphviz__Backend__Subprocess):
+            running     : int
+            max_running : int
+            def render(self, **kwargs):
+                with lock:
+                    self.running    += 1
+                    self.max_running = max(self.max_running, self.running)
+                time.sleep(0.02)
+                with lock:
+                    self.running    -= 1
+                return b'rendered'
+        class Graphviz__Render__Test(Graphviz__Render):
+            test_backend : Backend__Counter
+            def backend(self):
+                return self.test_backend
+
+        lock          = threading.Lock()
+        batch_slots   = graphviz_render_module.graphviz__batch_slots
+        def render_batch(batch_index):
+            items = [Model__Graphviz__Render_Dot(dot_source=f'digraph {{ a{batch_index}_{index} -> b }}') for index in range(4)]
+            return _.render_dot_batch(Model__Graphviz__Render_Dot_Batch(items=items, max_workers=2))
+        try:
+            graphviz_render_module.graphviz__batch_slots = threading.BoundedSemaphore(2)
+            with Graphviz__Render__Test() as _:
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    results = list(executor.map(render_batch, range(3)))
+                assert [len(result) for result in results] == [4, 4, 4]
+                assert _.test_backend.max_running          == 2                 # not 6 (3 batches x 2 workers)
+        finally:
+            graphviz_render_module.graphviz__batch_slots = batch_slots
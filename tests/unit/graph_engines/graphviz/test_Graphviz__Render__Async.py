@@ -0,0 +1,42 @@
+import asyncio
+from unittest                                                                           import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render                       import Graphviz__Render
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Async                import Graphviz__Render__Async
+from mgraph_ai_serverless.graph_engines.graphviz.backends.Graphviz__Backend__Libgvc     import Graphviz__Backend__Libgvc
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Render_Dot     import Model__Graphviz__Render_Dot
+
+
+class test_Graphviz__Render__Async(TestCase):
+
+    def setUp(self):
+        self.render_async = Graphviz__Render__Async(timeout=10)
+
+    def test_render_timeout(self):                                              # requests can only shorten the timeout
+        assert self.render_async.render_timeout(Model__Graphviz__Render_Dot(            )) == 10
+        assert self.render_async.render_timeout(Model__Graphviz__Render_Dot(timeout=2   )) == 2
+        assert self.render_async.render_timeout(Model__Graphviz__Render_Dot(timeout=1000)) == 10
+
+    def test_render_dot__reuse_layout(self):
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(self.render_async.render_dot(Model__Graphviz__Render_Dot(reuse_layout=True)))
+        assert context.exception.args[0].startswith('reuse_layout is not supported by the async render')
+
+    def test_render_dot__in_process(self):                                      # the configured (in-process) backend is used, and abandoned on timeout
+        class Backend__Test(Graphviz__Backend__Libgvc):
+            delay : float
+            def render(self, **kwargs):
+                asyncio.run(asyncio.sleep(self.delay))
+                return b'from backend'
+        class Graphviz__Render__Test(Graphviz__Render):
+            test_backend : Backend__Test
+            def backend(self):
+                return self.test_backend
+
+        self.render_async.graphviz_render = Graphviz__Render__Test()
+        render_config                     = Model__Graphviz__Render_Dot()
+        assert asyncio.run(self.render_async.render_dot(render_config)) == b'from backend'
+
+        self.render_async.graphviz_render.test_backend.delay = 0.5
+        with self.assertRaises(TimeoutError) as context:
+            asyncio.run(self.render_async.render_dot(Model__Graphviz__Render_Dot(dot_source='digraph { a }', timeout=0.1)))
+        assert context.exception.args[0] == 'Graphviz render timed out after 0.1 seconds'
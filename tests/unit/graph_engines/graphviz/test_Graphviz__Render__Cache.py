@@ -0,0 +1,80 @@
+import os
+from unittest                                                                          import TestCase
+from osbot_utils.utils.Files                                                           import temp_folder, folder_delete_all, file_exists
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Cache               import Graphviz__Render__Cache
+from mgraph_ai_serverless.graph_engines.graphviz.models.Model__Graphviz__Output_Format import Model__Graphviz__Output_Format
+
+
+class test_Graphviz__Render__Cache(TestCase):
+
+    def setUp(self):
+        self.cache = Graphviz__Render__Cache(max_items=2, max_bytes=10, disk_enabled=False)
+
+    def test_cache_key(self):
+        with self.cache as _:
+            key_1 = _.cache_key('digraph { a -> b }'      , 'png', engine='dot')
+            key_2 = _.cache_key('\r\ndigraph { a -> b }\n', 'png', engine='dot')            # same graph after normalisation
+            key_3 = _.cache_key('digraph { a -> b }'      , 'svg', engine='dot')
+            key_4 = _.cache_key('digraph { a -> b }'      , 'png', engine='sfdp')
+            key_5 = _.cache_key('digraph { a -> b }'      , Model__Graphviz__Output_Format.png, engine='dot')
+            assert len(key_1) == 64
+            assert key_1      == key_2
+            assert key_1      != key_3
+            assert key_1      != key_4
+            assert key_1      == key_5
+
+    def test_get__set(self):
+        with self.cache as _:
+            assert _.get('key_1')          is None
+            assert _.set('key_1', b'abc') == b'abc'
+            assert _.get('key_1')          == b'abc'
+            assert _.stats()               == dict(hits=1, misses=1, evictions=0, disk_hits=0, disk_writes=0, disk_evictions=0,
+                                                   items=1, items_bytes=3, max_items=2, max_bytes=10, disk_enabled=False,
+                                                   disk_max_items=_.disk_max_items, disk_max_bytes=_.disk_max_bytes)
+
+    def test_lru_eviction(self):
+        with self.cache as _:
+            _.set('key_1', b'1')
+            _.set('key_2', b'2')
+            _.get('key_1')                                                                  # key_1 is now the most recently used
+            _.set('key_3', b'3')
+            assert list(_.items)  == ['key_1', 'key_3']
+            assert _.evictions    == 1
+
+            _.set('key_4', b'0123456789')                                                   # evicted by size
+            assert list(_.items)  == ['key_4']
+            assert _.items_bytes  == 10
+            _.set('key_5', b'this is too big to cache')
+            assert 'key_5'    not in _.items
+
+    def test_disk_tier(self):
+        disk_folder = temp_folder()
+        cache_1     = Graphviz__Render__Cache(disk_enabled=True, disk_folder=disk_folder)
+        cache_2     = Graphviz__Render__Cache(disk_enabled=True, disk_folder=disk_folder)       # i.e. another worker in the same container
+        cache_1.set('key_1', b'abc')
+        assert file_exists(cache_1.disk_path('key_1')) is True
+        assert cache_2.get('key_1')                    == b'abc'
+        assert cache_2.disk_hits                       == 1
+        assert cache_2.get('key_1')                    == b'abc'                              # now served from memory
+        assert cache_2.hits                            == 1
+        assert folder_delete_all(disk_folder)          is True
+
+    def test_disk_tier__eviction(self):                                                 # the disk tier is bounded too (least recently used files go first)
+        disk_folder = temp_folder()
+        cache_1     = Graphviz__Render__Cache(disk_enabled=True, disk_folder=disk_folder, disk_max_items=2, disk_max_bytes=10)
+        cache_2     = Graphviz__Render__Cache(disk_enabled=True, disk_folder=disk_folder)
+        cache_1.set('key_1', b'1')
+        cache_1.set('key_2', b'2')
+        os.utime(cache_1.disk_path('key_1'), (1000, 1000))
+        os.utime(cache_1.disk_path('key_2'), (2000, 2000))
+        assert cache_2.get('key_1')                        == b'1'                          # a disk hit makes key_1 the most recently used
+        cache_1.set('key_3', b'3')
+        assert sorted(os.listdir(disk_folder))             == ['key_1', 'key_3']
+        assert cache_1.disk_evictions                      == 1
+
+        cache_1.set('key_4', b'0123456789')                                             # evicted by size
+        assert os.listdir(disk_folder)                     == ['key_4']
+        cache_1.set('key_5', b'this is too big to cache')
+        assert file_exists(cache_1.disk_path('key_5'))     is False
+        assert cache_1.stats()['disk_evictions']           == 3
+        assert folder_delete_all(disk_folder)              is True
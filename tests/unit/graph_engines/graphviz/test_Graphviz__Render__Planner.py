@@ -0,0 +1,61 @@
+from unittest                                                               import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Planner  import Graphviz__Render__Planner
+
+
+class test_Graphviz__Render__Planner(TestCase):
+
+    def setUp(self):
+        self.planner = Graphviz__Render__Planner(large_nodes=5, large_edges=5, max_nodes=20, max_edges=20, max_iter=100)
+
+    def dot_source(self, edge_count):
+        edges = ' '.join(f'n{i} -> n{i + 1};' for i in range(edge_count))
+        return f'digraph {{ {edges} }}'
+
+    def test_render_plan(self):
+        with self.planner.render_plan(self.dot_source(2)) as _:
+            assert _.requested_engine     == 'dot'
+            assert _.engine               == 'dot'
+            assert _.graph_attrs          == {}
+            assert _.stats.node_count     == 3
+            assert _.stats.edge_count     == 2
+        assert self.planner.render_plan(self.dot_source(2), engine='neato').engine == 'neato'
+
+    def test_render_plan__large(self):
+        dot_source = self.dot_source(10)
+        with self.planner.render_plan(dot_source, engine='neato') as _:
+            assert _.requested_engine == 'neato'
+            assert _.engine           == 'sfdp'                                     # costly engine downgraded
+            assert _.graph_attrs      == {'maxiter': 100}
+            planned_dot_source = self.planner.planned_dot_source(dot_source, _)
+            assert planned_dot_source.endswith('n10; \n    graph [maxiter="100"];\n}')
+            assert self.planner.dot_stats.dot_stats(planned_dot_source).edge_count == 10
+        assert self.planner.render_plan(dot_source, engine='osage').engine == 'osage'
+
+    def test_render_plan__rejected(self):
+        for dot_source, engine, expected_error in [(self.dot_source(30), None , 'Graph too large: 31 nodes and 30 edges (max is 20 nodes and 20 edges)'),
+                                                   (self.dot_source(1) , 'aaa', 'Unsupported graphviz engine: aaa'                                     ),
+                                                   ('digraph { a -> b' , None , "Invalid DOT source: unbalanced '{'"                                  )]:
+            with self.assertRaises(ValueError) as context:
+                self.planner.render_plan(dot_source, engine=engine)
+            assert context.exception.args[0] == expected_error
+
+    def test_plan_headers(self):
+        render_plan = self.planner.render_plan(self.dot_source(10))
+        assert self.planner.plan_headers(render_plan) == { 'X-Graphviz-Engine'   : 'sfdp',
+                                                           'X-Graphviz-Nodes'    : '11'  ,
+                                                           'X-Graphviz-Edges'    : '10'  ,
+                                                           'X-Graphviz-Clusters' : '0'   ,
+                                                           'X-Graphviz-Params'   : 'maxiter=100'}
+
+    def test_render_plan__budget(self):
+        dot_source = self.dot_source(4)                                             # 9 elements (5 nodes + 4 edges) * 0.5ms
+        assert self.planner.render_plan(dot_source, max_ms=1000).graph_attrs == {}       # fits in the budget, so full quality
+        with self.planner.render_plan(dot_source, max_ms=1) as _:
+            assert _.graph_attrs == {'mclimit': 0.22, 'nslimit': 2.22, 'nslimit1': 2.22, 'searchsize': 6}
+            assert self.planner.plan_params(_) == 'mclimit=0.22;nslimit=2.22;nslimit1=2.22;searchsize=6'
+        assert self.planner.render_plan(dot_source, engine='fdp', max_ms=3).graph_attrs == {'maxiter': 400, 'overlap': 'scale'}
+        assert self.planner.render_plan(dot_source, engine='fdp', max_ms=1).graph_attrs == {'maxiter': 133, 'overlap': 'true' }
+
+        with self.assertRaises(ValueError) as context:
+            self.planner.render_plan(dot_source, max_ms=-1)
+        assert context.exception.args[0] == 'Invalid max_ms: -1 (must be a positive number of milliseconds)'
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from unittest                                                               import TestCase
+from mgraph_ai_serverless.graph_engines.graphviz.Graphviz__Render__Stream   import Graphviz__Render__Stream
+
+
+class test_Graphviz__Render__Stream(TestCase):
+
+    def setUp(self):
+        self.render_stream = Graphviz__Render__Stream()
+
+    async def chunks(self, *chunks):
+        for chunk in chunks:
+            yield chunk
+
+    def test_read_dot_source(self):                                             # all the chunks are read (the admission pre-parse needs the whole source)
+        dot_source = asyncio.run(self.render_stream.read_dot_source(self.chunks(b'', b'  \n', b'digraph {', b' a -> b }')))
+        assert dot_source == '  \ndigraph { a -> b }'
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(self.render_stream.read_dot_source(self.chunks(b'digraph { \xff }')))
+        assert context.exception.args[0].startswith('DOT source is not valid utf-8:')
+
+    def test_read_dot_source__empty(self):                                      # empty (or whitespace only) bodies are rejected before the renderer starts
+        for chunks in [(), (b'',), (b' \n', b'\t ')]:
+            with self.assertRaises(ValueError) as context:
+                asyncio.run(self.render_stream.read_dot_source(self.chunks(*chunks)))
+            assert context.exception.args[0] == 'No DOT source provided'
+
+    def test_render_stream__admission(self):                                    # malformed or oversized graphs are rejected before the renderer starts
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(self.render_stream.render_stream('digraph { a -> b', 'svg'))
+        assert context.exception.args[0] == "Invalid DOT source: unbalanced '{'"
+        self.render_stream.planner.max_nodes = 2
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(self.render_stream.render_stream('digraph { a -> b -> c }', 'svg'))
+        assert context.exception.args[0].startswith('Graph too large: 3 nodes')
+
+    def test_stream_stdout__failure_after_first_chunk(self):                    # failures after the headers were sent are raised (not a silently truncated body)
+        class Stream:
+            def __init__(self, *chunks):
+                self.chunks = list(chunks)
+            async def read(self, size=-1):
+                return self.chunks.pop(0) if self.chunks else b''
+        class Process:
+            returncode = None
+            stdout     = Stream(b'second chunk')
+            async def wait(self):
+                self.returncode = 1
+                return 1
+            def kill(self):
+                pass
+        async def read_all():
+            stderr_task = asyncio.create_task(Stream(b'Error: renderer crashed').read())
+            stdin_task  = asyncio.create_task(asyncio.sleep(0))
+            chunks      = []
+            output      = self.render_stream.stream_stdout(Process(), b'first chunk', time.monotonic() + 1, stdin_task, stderr_task)
+            with self.assertRaises(ValueError) as context:
+                async for chunk in output:
+                    chunks.append(chunk)
+            assert context.exception.args[0] == 'Graphviz render failed: Error: renderer crashed'
+            return chunks
+        assert asyncio.run(read_all()) == [b'first chunk', b'second chunk']
@@ -0,0 +1,52 @@
+from unittest                                                                     import TestCase
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Graph_Data__Reader import Matplotlib__Graph_Data__Reader
+
+NODE_TYPE  = 'mgraph_ai.providers.simple.schemas.Schema__Simple__Node.Schema__Simple__Node'
+GRAPH_TYPE = 'mgraph_ai.providers.simple.domain.Domain__Simple__Graph.Domain__Simple__Graph'
+
+
+class test_Matplotlib__Graph_Data__Reader(TestCase):
+
+    def setUp(self):
+        self.reader = Matplotlib__Graph_Data__Reader()
+
+    def graph_data(self, nodes, edges):
+        return {'graph_type': GRAPH_TYPE,
+                'model'     : {'data': {'nodes': {node['node_id']: node for node in nodes},
+                                        'edges': {f'e{index}': edge for index, edge in enumerate(edges)}}}}
+
+    def node(self, node_id, **node_data):
+        return dict(node_id=node_id, node_type=NODE_TYPE, node_data=node_data)
+
+    def test_read(self):
+        nodes      = [self.node('a', value='A', name='Node A'),
+                      self.node('b', label='B'             ),
+                      self.node('c', value=0               )]                   # falsy values fall back to the schema's class name
+        edges      = [dict(from_node_id='a', to_node_id='b'),
+                      dict(from_node_id='b', to_node_id='c'),
+                      dict(from_node_id='c', to_node_id='x')]                   # edge to a missing node (skipped)
+        graph_arrays = self.reader.read(self.graph_data(nodes, edges))
+        assert graph_arrays.node_ids       == ['a', 'b', 'c']
+        assert graph_arrays.labels         == ['Node A', 'B', 'Schema__Simple__Node']
+        assert graph_arrays.edges.tolist() == [[0, 1], [1, 2]]
+        assert graph_arrays.edges.dtype    == 'int32'
+
+    def test_read__empty_graph(self):
+        graph_arrays = self.reader.read(self.graph_data([], []))
+        assert graph_arrays.node_ids      == []
+        assert graph_arrays.edges.shape   == (0, 2)
+
+    def test_read__invalid(self):
+        def error(graph_data):
+            with self.assertRaises(ValueError) as context:
+                self.reader.read(graph_data)
+            return str(context.exception)
+
+        assert error(None                                   ) == "No graph provided for rendering"
+        assert error([1]                                    ) == "Invalid graph data: expected a json object"
+        assert error({'graph_type': 'os.system'}            ) == "Unsupported domain type: os.system"
+        assert error({'graph_type': GRAPH_TYPE}             ) == "Invalid graph data: graph_data.model must be a json object"
+        assert error({'graph_type': GRAPH_TYPE, 'model': {}}) == "Invalid graph data: graph_data.model.data must be a json object"
+        assert error(self.graph_data([{'node_id': 'a'}], [])) == "Invalid graph data: node 'a' needs a string node_id and node_type, and an object node_data"
+        assert error(self.graph_data([], ['not-an-edge'])   ) == "Invalid graph data: edges must be json objects"
+        assert error(self.graph_data([], [{'from_node_id': ['a'], 'to_node_id': 'b'}])) == "Invalid graph data: edge ['a'] -> 'b' needs string from_node_id and to_node_id"
@@ -0,0 +1,49 @@
+from unittest                                                                import TestCase
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Layout__Cache import Matplotlib__Layout__Cache
+
+
+class test_Matplotlib__Layout__Cache(TestCase):
+
+    def setUp(self):
+        self.cache = Matplotlib__Layout__Cache(max_items=2)
+
+    def test_cache_key(self):
+        key = self.cache.cache_key(['a', 'b', 'c'], [('a', 'b'), ('b', 'c')], layout='spring', seed=1)
+        assert key == self.cache.cache_key(['c', 'a', 'b'], [('c', 'b'), ('a', 'b')], layout='spring', seed=1)   # order and edge direction don't matter
+        assert key == self.cache.cache_key(['a', 'b', 'c'], [('a', 'b'), ('b', 'c'), ('b', 'a')], layout='spring', seed=1)   # nor duplicate edges
+        assert key != self.cache.cache_key(['a', 'b', 'c'], [('a', 'b'), ('a', 'c')], layout='spring', seed=1)   # structure does
+        assert key != self.cache.cache_key(['a', 'b', 'c'], [('a', 'b'), ('b', 'c')], layout='circular', seed=1)
+        assert key != self.cache.cache_key(['a', 'b', 'c'], [('a', 'b'), ('b', 'c')], layout='spring', seed=2)
+
+    def test_get_set__lru(self):
+        with self.cache as _:
+            _.set('k1', {'a': (0.0, 0.0)})
+            _.set('k2', {'b': (1.0, 1.0)})
+            assert _.get('k1') == {'a': (0.0, 0.0)}                             # k1 becomes the most recently used
+            _.set('k3', {'c': (2.0, 2.0)})
+            assert list(_.items) == ['k1', 'k3']
+            assert _.get('k2')   is None
+            assert _.stats()     == dict(hits=1, misses=1, evictions=1, items=2, positions=2,
+                                         max_items=2, max_positions=_.max_positions, eviction='lru')
+
+    def test_get_set__fifo(self):
+        with Matplotlib__Layout__Cache(max_items=2, eviction='fifo') as _:
+            _.set('k1', {'a': (0.0, 0.0)})
+            _.set('k2', {'b': (1.0, 1.0)})
+            assert _.get('k1') == {'a': (0.0, 0.0)}
+            _.set('k3', {'c': (2.0, 2.0)})
+            assert list(_.items) == ['k2', 'k3']                                 # k1 was the first in, so it was the first out
+
+    def test_set__max_positions(self):
+        with Matplotlib__Layout__Cache(max_positions=3) as _:
+            _.set('k1', {'a': (0, 0), 'b': (0, 0)})
+            _.set('k2', {'c': (0, 0), 'd': (0, 0)})
+            assert list(_.items) == ['k2']
+            _.set('k3', {'e': (0, 0), 'f': (0, 0), 'g': (0, 0), 'h': (0, 0)})     # larger than the whole cache, not stored
+            assert list(_.items) == ['k2']
+            assert _.positions   == 2
+
+    def test__init__eviction(self):
+        with self.assertRaises(ValueError) as context:
+            Matplotlib__Layout__Cache(eviction='aaa')
+        assert context.exception.args[0] == 'Unsupported layout cache eviction policy: aaa'
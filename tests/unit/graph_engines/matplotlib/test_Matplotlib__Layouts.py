@@ -0,0 +1,68 @@
+import numpy as np
+from unittest                                                           import TestCase
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Layouts  import Matplotlib__Layouts
+
+
+class test_Matplotlib__Layouts(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.layouts    = Matplotlib__Layouts()
+        cls.node_count = 400                                                    # 20 x 20 grid graph
+        cls.edges      = np.array([(row * 20 + col, row * 20 + col + 1 ) for row in range(20) for col in range(19)] +
+                                  [(row * 20 + col, row * 20 + col + 20) for row in range(19) for col in range(20)])
+
+    def test_layout(self):
+        for layout in ['force_grid', 'multilevel', 'spectral_sparse']:
+            positions = self.layouts.layout(layout, self.node_count, self.edges, seed=42)
+            assert positions.shape            == (self.node_count, 2)
+            assert np.isfinite(positions).all()
+            assert np.abs(positions).max()    == 1.0                           # rescaled to [-1, 1] (like the networkx layouts)
+            assert np.array_equal(positions, self.layouts.layout(layout, self.node_count, self.edges, seed=42))  # deterministic for the same seed
+
+            neighbours = np.linalg.norm(positions[self.edges[:, 0]] - positions[self.edges[:, 1]], axis=1).mean()
+            random     = np.linalg.norm(positions[:200] - positions[200:], axis=1).mean()
+            assert neighbours < random / 2                                      # connected nodes end up close to each other
+
+    def test_layout__small_graphs(self):
+        no_edges = np.zeros((0, 2), dtype=int)
+        for layout in ['force_grid', 'multilevel', 'spectral_sparse']:
+            assert self.layouts.layout(layout, 0, no_edges).shape == (0, 2)
+            assert self.layouts.layout(layout, 1, no_edges).tolist() == [[0.0, 0.0]]
+            assert self.layouts.layout(layout, 2, np.array([[0, 1], [1, 0], [1, 1]]), seed=1).shape == (2, 2)
+
+    def test_layout__unsupported(self):
+        with self.assertRaises(ValueError) as context:
+            self.layouts.layout('aaa', 1, np.zeros((0, 2)))
+        assert context.exception.args[0] == 'Unsupported layout: aaa'
+
+    def test_incremental(self):
+        prior     = self.layouts.layout('multilevel', self.node_count, self.edges, seed=42)
+        new_edges = np.array([(self.node_count, 0), (self.node_count + 1, self.node_count)])        # new node next to node 0, and a second one (two hops away) next to it
+        initial   = np.vstack([prior, np.full((2, 2), np.nan)])
+        positions = self.layouts.incremental(np.vstack([self.edges, new_edges]), initial, seed=42)
+        extent    = np.ptp(prior, axis=0).max()
+        assert positions.shape == (self.node_count + 2, 2)
+        assert np.abs(positions[:self.node_count] - prior).max() < 0.05 * extent                  # the prior layout is kept (stable output)
+        assert np.linalg.norm(positions[self.node_count    ] - positions[0             ]) < 0.25 * extent
+        assert np.linalg.norm(positions[self.node_count + 1] - positions[self.node_count]) < 0.25 * extent
+
+    def test_place_new_nodes(self):
+        positions = np.array([[0.0, 0.0], [2.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0]])
+        placed    = np.array([True, True, False, False, False])
+        edges     = np.array([[0, 2], [1, 2], [2, 3]])                         # 2 is between 0 and 1, 3 hangs off 2 and 4 is not connected
+        positions = self.layouts.place_new_nodes(positions, placed, edges)
+        assert positions[:4].tolist() == [[0.0, 0.0], [2.0, 0.0], [1.0, 0.0], [1.0, 0.0]]
+        assert placed.tolist()        == [True, True, True, True, False]
+
+    def test_coarsen(self):
+        rng                   = np.random.default_rng(42)
+        edges                 = self.layouts.simple_edges(self.edges)
+        parents, coarse_count = self.layouts.coarsen(self.node_count, edges, rng)
+        assert parents.shape  == (self.node_count,)
+        assert coarse_count   <  self.node_count / 2                           # grid graphs shrink fast
+        assert set(parents.tolist()) == set(range(coarse_count))
+
+    def test_simple_edges(self):
+        edges = np.array([[1, 0], [0, 1], [2, 2], [1, 2]])
+        assert self.layouts.simple_edges(edges).tolist() == [[0, 1], [1, 2]]
@@ -0,0 +1,54 @@
+import json
+from unittest                                                                               import TestCase
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Body                 import Matplotlib__Render__Body
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Layout         import Model__Matplotlib__Layout
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Output_Format  import Model__Matplotlib__Output_Format
+from mgraph_ai_serverless.graph_engines.matplotlib.models.Model__Matplotlib__Render         import Model__Matplotlib__Render
+
+
+class test_Matplotlib__Render__Body(TestCase):
+
+    def setUp(self):
+        self.render_body = Matplotlib__Render__Body()
+
+    def body(self, **kwargs):
+        return json.dumps(kwargs).encode()
+
+    def test_decode(self):
+        graph_data        = {'graph_type': 'an.allow_listed.Type', 'model': {'data': {'nodes': {}, 'edges': {}}}}
+        matplotlib_render = self.render_body.decode(self.body(graph_data    = graph_data     ,
+                                                              layout        = 'circular'     ,
+                                                              seed          = None           ,
+                                                              figsize       = [4, 3]         ,
+                                                              output_format = 'svg'          ,
+                                                              positions     = {'a': [1, 2.5]},
+                                                              unknown_field = 42             ))
+        assert type(matplotlib_render)          is Model__Matplotlib__Render
+        assert matplotlib_render.graph_data     == graph_data
+        assert matplotlib_render.layout         == 'circular'
+        assert matplotlib_render.seed           is None
+        assert matplotlib_render.figsize        == (4, 3)
+        assert matplotlib_render.output_format  is Model__Matplotlib__Output_Format.svg
+        assert matplotlib_render.positions      == {'a': (1.0, 2.5)}
+        assert matplotlib_render.dpi            == 300                                      # defaults are kept
+
+    def test_decode__model_type(self):
+        matplotlib_layout = self.render_body.decode(self.body(layout='shell', encoding='flat'), model_type=Model__Matplotlib__Layout)
+        assert type(matplotlib_layout)    is Model__Matplotlib__Layout
+        assert matplotlib_layout.encoding == 'flat'
+
+    def test_decode__invalid(self):
+        def error(body):
+            with self.assertRaises(ValueError) as context:
+                self.render_body.decode(body)
+            return str(context.exception)
+
+        assert error(b'[1, 2]'                                 ) == "Invalid json body: expected a json object"
+        assert error(b'{"graph_data": '                        ).startswith("Invalid json body: ")
+        assert error(self.body(graph_data    = [1]            )) == "Invalid value for graph_data: expected a json object"
+        assert error(self.body(dpi           = True           )) == "Invalid value for dpi: expected an integer"
+        assert error(self.body(preview       = 1              )) == "Invalid value for preview: expected a boolean"
+        assert error(self.body(layout        = 1              )) == "Invalid value for layout: expected a string"
+        assert error(self.body(figsize       = [1, 2, 3]      )) == "Invalid value for figsize: expected a list with 2 items"
+        assert error(self.body(output_format = 'gif'          )) == "Invalid value for output_format: 'gif' (expected one of ['png', 'svg', 'pdf'])"
+        assert error(self.body(positions     = {'a': ['x', 1]})) == "Invalid value for positions: expected a number"
@@ -0,0 +1,74 @@
+import os
+import time
+from concurrent.futures                                                     import ThreadPoolExecutor
+from concurrent.futures.process                                             import BrokenProcessPool
+from unittest                                                               import TestCase
+from mgraph_ai_serverless.graph_engines.matplotlib.Matplotlib__Render__Pool import Matplotlib__Render__Pool, matplotlib__render_pool
+
+
+class test_Matplotlib__Render__Pool(TestCase):
+
+    def test__init__(self):
+        with matplotlib__render_pool as _:
+            assert _.enabled            is False                                # opt-in (MGRAPH__MATPLOTLIB__POOL=true)
+            assert _.executor           is None                                 # nothing is started until it is needed
+            assert _.queue_size()       == max(_.workers, 1) * 4
+
+    def test_run__worker_recycling(self):
+        render_pool = Matplotlib__Render__Pool(workers=2, max_renders_per_worker=2)
+        try:
+            pids = {render_pool.run(os.getpid) for _ in range(10)}
+            assert os.getpid() not in pids
+            assert len(pids)   >  2                                             # workers were replaced after 2 tasks
+            assert render_pool.stats().get('submitted') == 10
+        finally:
+            render_pool.stop()
+        assert render_pool.executor is None
+
+    def test_run__queue_full(self):
+        render_pool = Matplotlib__Render__Pool(workers=1, max_queue=1, queue_timeout=0.1)
+        try:
+            render_pool.start()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                slow_task = executor.submit(render_pool.run, time.sleep, 1)
+                time.sleep(0.2)
+                with self.assertRaises(TimeoutError) as context:
+                    render_pool.run(os.getpid)
+                assert context.exception.args[0] == 'Matplotlib render queue is full (max 1 renders)'
+                assert slow_task.result()        is None
+            assert render_pool.stats().get('rejected') == 1
+        finally:
+            render_pool.stop()
+
+    def test_run__render_timeout(self):
+        render_pool = Matplotlib__Render__Pool(workers=1, render_timeout=0.2)
+        try:
+            with self.assertRaises(TimeoutError) as context:
+                render_pool.run(time.sleep, 1)
+            assert context.exception.args[0]           == 'Matplotlib render timed out (after 0.2 seconds)'
+            assert render_pool.stats().get('timed_out') == 1
+        finally:
+            render_pool.stop()
+
+    def test_run__render_timeout__keeps_slot(self):                             # a timed out render keeps its queue slot until it really finishes
+        render_pool = Matplotlib__Render__Pool(workers=1, max_queue=1, queue_timeout=0.1, render_timeout=0.2)
+        try:
+            with self.assertRaises(TimeoutError):
+                render_pool.run(time.sleep, 1)
+            with self.assertRaises(TimeoutError) as context:
+                render_pool.run(os.getpid)
+            assert context.exception.args[0] == 'Matplotlib render queue is full (max 1 renders)'
+            time.sleep(1)
+            assert render_pool.run(os.getpid) != os.getpid()
+        finally:
+            render_pool.stop()
+
+    def test_run__broken_pool(self):                                            # a worker that dies doesn't break the renders that follow
+        render_pool = Matplotlib__Render__Pool(workers=1)
+        try:
+            with self.assertRaises(BrokenProcessPool):
+                render_pool.run(os._exit, 1)
+            assert render_pool.run(os.getpid)            != os.getpid()
+            assert render_pool.stats().get('restarts')   == 1
+        finally:
+            render_pool.stop()
@@ -0,0 +1,29 @@
+import threading
+from unittest                                                                   import TestCase
+from osbot_utils.utils.Threads                                                  import invoke_in_new_event_loop
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager import Playwright__Browser__Manager
+
+
+class test_Playwright__Browser__Manager(TestCase):
+
+    def setUp(self):
+        self.browser_manager = Playwright__Browser__Manager()
+
+    def tearDown(self):
+        self.browser_manager.stop()
+
+    def test_run(self):                                                         # coroutines run in the manager's own loop (and thread)
+        async def thread_name():
+            return threading.current_thread().name
+
+        assert self.browser_manager.run(thread_name())  == 'playwright-browser'
+        assert invoke_in_new_event_loop(self.browser_manager.run_async(thread_name())) == 'playwright-browser'
+        assert self.browser_manager.status()['started'] is True
+
+    def test_stop(self):
+        loop = self.browser_manager.event_loop()
+        self.browser_manager.stop()
+        assert loop.is_closed()             is True
+        assert self.browser_manager.loop    is None
+        assert self.browser_manager.status() == dict(started=False, browser_connected=False, launches=0,
+                                                     contexts_opened=0, contexts_open=0, last_error=None)
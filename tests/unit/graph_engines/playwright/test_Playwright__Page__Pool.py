@@ -0,0 +1,22 @@
+from unittest                                                                        import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Pool            import Playwright__Page__Pool
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless            import Playwright__Serverless
+
+
+class test_Playwright__Page__Pool(TestCase):
+
+    def setUp(self):
+        self.page_pool = Playwright__Page__Pool(size=1, max_renders_per_page=3)
+
+    def tearDown(self):
+        self.page_pool.stop()
+
+    def test_launch_kwargs(self):                                               # same chromium flags as Playwright__Serverless (the browser is shared)
+        launch_kwargs = self.page_pool.launch_kwargs()
+        assert launch_kwargs             == Playwright__Serverless().browser__launch_kwargs()
+        assert launch_kwargs.get('args') == ['--disable-gpu', '--no-zygote', '--disable-dev-shm-usage']   # no --single-process (outside lambda), since many pages render at once
+
+    def test_stats(self):
+        assert Playwright__Page__Pool(size=3).stats() == dict(enabled=Playwright__Page__Pool().enabled, size=3,
+                                                             max_renders_per_page=Playwright__Page__Pool().max_renders_per_page,
+                                                             renders=0, pages_created=0, pages_recycled=0, idle_pages={})
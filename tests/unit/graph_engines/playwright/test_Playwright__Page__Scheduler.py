@@ -0,0 +1,72 @@
+import asyncio
+import os
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Scheduler  import Playwright__Page__Scheduler
+
+
+class test_Playwright__Page__Scheduler(TestCase):
+
+    def setUp(self):
+        self.page_scheduler = Playwright__Page__Scheduler(max_pages=2, queue_timeout=1, request_timeout=1)
+
+    def test_page_slots(self):                                                  # max_pages, or sized from the container's memory and cpus
+        assert self.page_scheduler.page_slots() == 2
+        with Playwright__Page__Scheduler() as _:
+            assert 1 <= _.page_slots() <= _.cpu_count() * 2
+        with Playwright__Page__Scheduler(page_memory_mb=100, browser_memory_mb=400) as _:
+            os.environ['AWS_LAMBDA_FUNCTION_MEMORY_SIZE'] = '1024'
+            try:
+                assert _.memory_mb () == 1024
+                assert _.page_slots() == min(_.cpu_count() * 2, 6)              # (1024 - 400) // 100
+            finally:
+                del os.environ['AWS_LAMBDA_FUNCTION_MEMORY_SIZE']
+
+    def test_run_async(self):                                                   # never more than max_pages at once, and the queue is served in arrival order
+        running = []
+        started = []
+        async def render(index):
+            running.append(index)
+            started.append(index)
+            max_running = len(running)
+            await asyncio.sleep(0.02)
+            running.remove(index)
+            return max_running
+        async def render_all():
+            return await asyncio.gather(*[self.page_scheduler.run_async(render(index)) for index in range(6)])
+
+        with self.page_scheduler as _:
+            assert max(asyncio.run(render_all())) == 2
+            assert started                        == [0, 1, 2, 3, 4, 5]
+            assert _.stats()                      == dict(max_pages=2, running=0, queued=0, completed=6, rejected=0, timed_out=0,
+                                                          queue_timeout=1.0, request_timeout=1.0)
+
+    def test_acquire__queue_timeout(self):                                      # requests that wait longer than queue_timeout are rejected
+        async def acquire():
+            await self.page_scheduler.acquire()
+            await self.page_scheduler.acquire()
+            with self.assertRaises(TimeoutError) as context:
+                await self.page_scheduler.acquire(timeout=0.01)
+            self.page_scheduler.release()
+            self.page_scheduler.release()
+            return str(context.exception)
+
+        with self.page_scheduler as _:
+            assert asyncio.run(acquire()) == 'Playwright page queue is full (max 2 pages, waited 0.01 seconds)'
+            assert _.stats()['rejected']  == 1
+            assert _.stats()['queued'  ]  == 0
+            assert _.stats()['running' ]  == 0
+
+    def test_run_async__request_timeout(self):                                  # slow requests are cancelled after request_timeout (and their page is freed)
+        with self.page_scheduler as _:
+            _.request_timeout = 0.01
+            with self.assertRaises(TimeoutError) as context:
+                asyncio.run(_.run_async(asyncio.sleep(1)))
+            assert str(context.exception) == 'Playwright request timed out (after 0.01 seconds)'
+            assert _.stats()['timed_out'] == 1
+            assert _.stats()['running'  ] == 0
+
+    def test_with_deadline(self):
+        with self.page_scheduler as _:
+            assert asyncio.run(_.with_deadline(asyncio.sleep(0, result=42), None)) == 42
+            with self.assertRaises(TimeoutError):
+                asyncio.run(_.with_deadline(asyncio.sleep(0), 0))               # (already past the deadline)
@@ -0,0 +1,13 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Render__Ready    import Playwright__Render__Ready, PLAYWRIGHT__RENDER_TIMEOUT
+
+
+class test_Playwright__Render__Ready(TestCase):
+
+    def setUp(self):
+        self.render_ready = Playwright__Render__Ready()
+
+    def test__init__(self):
+        assert self.render_ready.timeout            == PLAYWRIGHT__RENDER_TIMEOUT
+        assert self.render_ready.timeout_value(   ) == PLAYWRIGHT__RENDER_TIMEOUT
+        assert self.render_ready.timeout_value(0.5) == 0.5
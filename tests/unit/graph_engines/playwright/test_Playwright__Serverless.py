@@ -1,13 +1,17 @@
-from unittest                                                   import TestCase
+import os
+from unittest                                                                   import TestCase
 
 import pytest
-from playwright.async_api._generated                                      import Clock, BrowserContext, Keyboard, Mouse, Touchscreen, APIRequestContext
-from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless import Playwright__Serverless
-from osbot_utils.utils.Misc                                               import list_set
-from playwright.async_api                                                 import Playwright, Browser, Response, Request, Frame, Page, Accessibility
-from osbot_utils.utils.Threads                                            import async_invoke_in_new_loop, invoke_async
-from osbot_utils.utils.Env                                                import in_github_action, not_in_github_action
-from osbot_utils.utils.Files                                              import file_name, file_exists, folder_exists, folder_name
+from playwright.async_api._generated                                            import Clock, BrowserContext, Keyboard, Mouse, Touchscreen, APIRequestContext
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Serverless       import Playwright__Serverless
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Browser__Manager import playwright__browser_manager
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets    import web_root__assets
+from mgraph_ai_serverless.graph_engines.playwright.Playwright__Page__Scheduler  import playwright__page_scheduler
+from osbot_utils.utils.Misc                                                     import list_set
+from playwright.async_api                                                       import Playwright, Browser, Response, Request, Frame, Page, Accessibility
+from osbot_utils.utils.Threads                                                  import async_invoke_in_new_loop, invoke_async
+from osbot_utils.utils.Env                                                      import in_github_action, not_in_github_action
+from osbot_utils.utils.Files                                                    import file_name, file_exists, folder_exists, folder_name
 
 class test_Playwright__Serverless(TestCase):
 
@@ -17,12 +21,19 @@ class test_Playwright__Serverless(TestCase):
 
     def test__init__(self):
         with self.playwright__serverless as _:
-            expected_locals = dict(browser        = None             ,
-                                   page           = None             ,
-                                   playwright     = None             ,
-                                   playwright_cli = _.playwright_cli ,
-                                   response       = None             ,
-                                   screenshot     = None             )
+            expected_locals = dict(browser         = None                        ,
+                                   browser_manager = playwright__browser_manager ,
+                                   context         = None                        ,
+                                   deadline        = 0.0                         ,
+                                   page            = None                        ,
+                                   page_scheduler  = playwright__page_scheduler  ,
+                                   page_slot       = False                       ,
+                                   playwright      = None                        ,
+                                   playwright_cli  = _.playwright_cli            ,
+                                   render_ready    = _.render_ready              ,
+                                   response        = None                        ,
+                                   screenshot      = None                        ,
+                                   web_root_assets = web_root__assets            )
 
             assert self.playwright__serverless.__locals__() == expected_locals
 
@@ -39,6 +50,15 @@ class test_Playwright__Serverless(TestCase):
         with self.playwright__serverless as _:
             assert _.browser__exists() is True
 
+    def test_browser__launch_kwargs(self):                                     # lambda safe flags, plus --single-process when running in lambda
+        with self.playwright__serverless as _:
+            assert _.browser__launch_kwargs().get('args') == ['--disable-gpu', '--no-zygote', '--disable-dev-shm-usage']
+            os.environ['AWS_LAMBDA_FUNCTION_NAME'] = 'mgraph_ai_serverless'
+            try:
+                assert _.browser__launch_kwargs().get('args') == ['--disable-gpu', '--no-zygote', '--disable-dev-shm-usage', '--single-process']
+            finally:
+                del os.environ['AWS_LAMBDA_FUNCTION_NAME']
+
     def test_chrome_path(self):
         with self.playwright__serverless as _:
             chrome_path = _.chrome_path()
@@ -0,0 +1,98 @@
+import asyncio
+import os
+import tempfile
+from types                                                                      import SimpleNamespace
+from unittest                                                                   import TestCase
+from mgraph_ai_serverless.graph_engines.playwright.web_root.Web_Root__Assets    import Web_Root__Assets, WEB_ROOT__URL, WEB_ROOT__PATH, WEB_ROOT__LIBS
+
+
+class test_Web_Root__Assets(TestCase):
+
+    def setUp(self):
+        self.web_root_assets = Web_Root__Assets()
+
+    def test_asset(self):                                                       # files are read once, and then served from memory
+        with self.web_root_assets as _:
+            body, content_type = _.asset('mermaid/index.html')
+            assert content_type                   == 'text/html'
+            assert b'../lib/mermaid/mermaid.min.js' in body
+            assert _.asset('mermaid/index.html')  is _.assets['mermaid/index.html']
+            assert list(_.assets)                 == ['mermaid/index.html']
+
+    def test_asset__not_found(self):
+        with self.web_root_assets as _:
+            assert _.asset('mermaid/not-a-file.html'    ) is None
+            assert _.asset('../__init__.py'             ) is None             # outside web_root
+            assert _.asset('mermaid/../../__init__.py'  ) is None
+            assert _.asset(''                           ) is None             # (folders are not files)
+            assert _.asset('__init__.py'                ) is None             # only WEB_ROOT__ASSET_TYPES are served
+            assert _.asset('favicon.ico'                ) is None
+            assert _.assets                               == {}
+
+    def test_content_type(self):
+        with self.web_root_assets as _:
+            assert _.content_type('mermaid/index.html') == 'text/html'
+            assert _.content_type('lib/a/b.min.js'    ) == 'text/javascript'
+            assert _.content_type('A.PNG'             ) == 'image/png'
+            assert _.content_type('__init__.py'       ) is None
+            assert _.content_type('lib'               ) is None
+
+    def test_on_route(self):                                                    # (with a fake playwright route)
+        class Route__Test:
+            def __init__(self, url):
+                self.request  = SimpleNamespace(url=url)
+                self.response = None
+            async def fulfill(self, **kwargs):
+                self.response = kwargs
+        def on_route(path):
+            route = Route__Test(WEB_ROOT__URL + path)
+            asyncio.run(self.web_root_assets.on_route(route))
+            return route.response.get('status')
+
+        assert on_route('mermaid/index.html'          ) == 200
+        assert on_route('../__init__.py'              ) == 404                 # ../ traversal
+        assert on_route('mermaid/../../__init__.py'   ) == 404
+        assert on_route('%2e%2e/__init__.py'          ) == 404
+        assert on_route('__init__.py'                 ) == 404                 # .py files
+        assert on_route('__pycache__/__init__.cpython-311.pyc') == 404
+        assert self.web_root_assets.stats()['assets_served'] == 1
+
+    def test_vendor_libs(self):                                                 # the libraries are only downloaded when missing, and always checked against their pinned sha256
+        class Web_Root__Assets__Test(Web_Root__Assets):                         # (no network: downloads return the test bytes)
+            downloads : dict
+            def download_lib(self, path):
+                return self.downloads[path]
+
+        with tempfile.TemporaryDirectory() as web_root:
+            with Web_Root__Assets__Test(web_root=web_root, downloads={path: f'// {path}'.encode() for path in WEB_ROOT__LIBS}) as _:
+                assert _.missing_libs() == list(WEB_ROOT__LIBS)
+                with self.assertRaises(FileNotFoundError):                      # nothing is vendored without the pins
+                    _.vendor_libs()
+
+                pins = _.pin_libs()
+                assert _.missing_libs()     == []
+                assert _.lib_pins()         == pins
+                assert _.vendor_libs()      == []                               # (nothing to download)
+
+                path = list(WEB_ROOT__LIBS)[0]
+                os.remove(os.path.join(web_root, path))
+                assert _.vendor_libs()      == [path]
+
+                os.remove(os.path.join(web_root, path))
+                _.downloads[path] = b'// tampered'
+                with self.assertRaises(ValueError) as context:
+                    _.vendor_libs()
+                assert context.exception.args[0].startswith(f'web_root library sha256 mismatch for {path}')
+                assert _.missing_libs()     == [path]                           # the bad download was not saved
+
+    def test_url_path(self):
+        with self.web_root_assets as _:
+            assert _.url_path(WEB_ROOT__URL + 'cytoscape/index.html'          ) == 'cytoscape/index.html'
+            assert _.url_path(WEB_ROOT__URL + 'examples/hello%20world.html?a=1') == 'examples/hello world.html'
+
+    def test_libs(self):                                                        # the pages load the vendored libraries (relative to WEB_ROOT__URL)
+        assert self.web_root_assets.web_root == WEB_ROOT__PATH
+        for path in WEB_ROOT__LIBS:
+            assert path.startswith('lib/')
+            page = path.split('/')[1] + '/index.html'
+            assert f'../{path}'.encode() in self.web_root_assets.asset(page)[0]